@@ -1,3 +1,4 @@
+import argparse
 import random
 from src.process import create_processes
 from src.schedulers.fcfs import FCFSScheduler
@@ -6,10 +7,29 @@ from src.schedulers.round_robin import RoundRobinScheduler
 from src.schedulers.priority import PriorityScheduler
 from src.schedulers.mlq import MLQScheduler
 from src.schedulers.ipc import IPCScheduler
-from src.visualizer.gantt import GanttVisualizer
-from src.visualizer.timeline import TimelineVisualizer
+from src.schedulers.instrumentation import SummarySink, build_instrumentation, format_summary
+from src.cache import DEFAULT_CACHE_DIR
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="CPU 스케줄러 시뮬레이션")
+    parser.add_argument("--profile", nargs="?", const="summary", default=None,
+                        choices=["summary", "jsonl", "cprofile", "pyinstrument"],
+                        help="스케줄러 루프 계측 (값 생략 시 summary)")
+    parser.add_argument("--profile-output", default=None,
+                        help="jsonl 파일 경로 또는 프로파일 결과 파일 접두어")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="스케줄링 결과 캐시 디렉터리")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="결과 캐시를 사용하지 않고 항상 다시 스케줄링")
+    parser.add_argument("--telemetry", action="store_true",
+                        help="tick별 큐 길이 / 처리량 / 사용률 시계열을 수집하여 telemetry.png 생성")
+    parser.add_argument("--store", default=None,
+                        help="실행 결과(지표, 병합된 실행 기록)를 저장할 SQLite DB 경로")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     # 프로세스 생성
     processes, scheduler_settings = create_processes(num_processes=10)
     time_quantum = scheduler_settings.get("time_quantum", 4)
@@ -72,6 +92,33 @@ def main():
                     queue_algorithms=mlq_algorithms)
     ]
     
+    # --profile 지정 시 모든 스케줄러에 계측 연결
+    instrumentation = None
+    if args.profile:
+        instrumentation = build_instrumentation(args.profile, args.profile_output)
+        for scheduler in ipc_schedulers + non_ipc_schedulers:
+            scheduler.set_instrumentation(instrumentation)
+    
+    # --telemetry 지정 시 스케줄러마다 시계열 수집
+    if args.telemetry:
+        from src.schedulers.telemetry import Telemetry
+        for scheduler in ipc_schedulers + non_ipc_schedulers:
+            scheduler.set_telemetry(Telemetry())
+    
+    # 같은 워크로드 / 설정의 결과는 캐시에서 재사용 (계측 / telemetry 수집 시에는 항상 다시 실행)
+    use_cache = not args.no_cache and instrumentation is None and not args.telemetry
+    cache = None
+    if use_cache:
+        from src.cache import ResultCache
+        cache = ResultCache(args.cache_dir)
+    
+    def run_scheduler(scheduler):
+        process_copy = [p.copy() for p in processes]
+        if cache is not None:
+            return cache.run(scheduler, process_copy)
+        execution_history = scheduler.schedule(process_copy)
+        return execution_history, scheduler.calculate_metrics()
+    
     # 각 스케줄러 실행 및 결과 수집
     ipc_results = {}
     non_ipc_results = {}
@@ -79,25 +126,35 @@ def main():
     
     # IPC 버전 실행
     for scheduler in ipc_schedulers:
-        process_copy = [p.copy() for p in processes]
-        execution_history = scheduler.schedule(process_copy)
-        metrics = scheduler.calculate_metrics()
-        ipc_results[scheduler.__class__.__name__] = (execution_history, metrics)
+        ipc_results[scheduler.__class__.__name__] = run_scheduler(scheduler)
 
     # Non-IPC 버전 실행
     for scheduler in non_ipc_schedulers:
-        process_copy = [p.copy() for p in processes]
-        execution_history = scheduler.schedule(process_copy)
-        metrics = scheduler.calculate_metrics()
-        non_ipc_results[scheduler.__class__.__name__] = (execution_history, metrics)
+        non_ipc_results[scheduler.__class__.__name__] = run_scheduler(scheduler)
+    
+    # 실행 결과를 SQLite DB에 저장
+    if args.store:
+        from src.run_store import RunStore
+        with RunStore(args.store) as store:
+            for schedulers, results in ((ipc_schedulers, ipc_results), (non_ipc_schedulers, non_ipc_results)):
+                for scheduler in schedulers:
+                    history, metrics = results[scheduler.__class__.__name__]
+                    store.record(scheduler, processes, metrics, history=history)
     
-    # 시각화
-    visualizer = GanttVisualizer()
-    timeline_viz = TimelineVisualizer()
-    # 시각화 부분 수정 필요
-    visualizer.plot_all_schedulers_with_ipc(ipc_results, non_ipc_results, save_path='gantt_chart.png')
-    visualizer.create_performance_comparison_with_ipc(ipc_results, non_ipc_results, save_path='performance_comparison.png')
-    timeline_viz.create_timeline_view_with_ipc(ipc_results, non_ipc_results, save_path='timeline_view.png')
+    # 시각화 (gantt_chart / performance_comparison / timeline_view 를 병렬로 렌더링)
+    from src.visualizer.render import render_reports
+    from src.visualizer.html_export import HTMLTimelineExporter
+    render_reports(ipc_results, non_ipc_results, output_dir='.', fmt='png', dpi=300)
+    # 확대/이동/필터가 가능한 오프라인 HTML 타임라인
+    HTMLTimelineExporter().export_with_ipc(ipc_results, non_ipc_results, 'timeline.html', processes)
+    # 큐 길이 / 의존성 대기 / 처리량 / 사용률 시계열 차트
+    if args.telemetry:
+        from src.visualizer.telemetry_chart import TelemetryVisualizer
+        telemetries = {}
+        for schedulers, mode in ((ipc_schedulers, "with IPC"), (non_ipc_schedulers, "without IPC")):
+            for scheduler in schedulers:
+                telemetries[f"{scheduler.__class__.__name__} ({mode})"] = scheduler.telemetry
+        TelemetryVisualizer().plot_comparison(telemetries, 'telemetry.png')
 
     def format_scheduler_name(name):
         """스케줄러 이름을 포맷팅"""
@@ -139,6 +196,16 @@ def main():
         print(f"CPU Utilization: {metrics['cpu_utilization']:.1f}%")
         print(f"Context Switches: {metrics['context_switches']}")
         print("-" * 30)
+    
+    # 계측 요약 출력
+    if instrumentation is not None:
+        print("\n스케줄러 루프 계측 결과:")
+        print("=" * 50)
+        for sink in instrumentation.sinks:
+            if isinstance(sink, SummarySink):
+                for summary in sink.summaries:
+                    print(format_summary(summary))
+                    print("-" * 30)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,187 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+
+from src.process import Process, QueueLevel, generate_processes
+from src.schedulers.base import Scheduler
+from src.schedulers.history import NullHistorySink
+
+# 지표 행렬의 열 순서
+METRIC_NAMES = ("avg_waiting_time", "avg_turnaround_time", "cpu_utilization", "context_switches")
+
+QUEUE_LEVELS = list(QueueLevel)
+
+@dataclass
+class WorkloadBatch:
+    """
+    여러 워크로드를 ragged(CSR) 배열로 저장
+    - 워크로드 w의 프로세스는 offsets[w]:offsets[w+1] 구간
+    - 프로세스 i의 의존성은 dependency_ids[dependency_offsets[i]:dependency_offsets[i+1]]
+    """
+    offsets: np.ndarray
+    process_ids: np.ndarray
+    arrival_times: np.ndarray
+    burst_times: np.ndarray
+    priorities: np.ndarray
+    queue_levels: np.ndarray
+    dependency_offsets: np.ndarray
+    dependency_ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @classmethod
+    def from_workloads(cls, workloads: Iterable[List[Process]]) -> 'WorkloadBatch':
+        """Process 목록 여러 개를 하나의 batch로 변환"""
+        offsets = [0]
+        process_ids, arrivals, bursts, priorities, levels = [], [], [], [], []
+        dependency_offsets = [0]
+        dependency_ids = []
+        level_codes = {level: code for code, level in enumerate(QUEUE_LEVELS)}
+        for processes in workloads:
+            for p in processes:
+                process_ids.append(p.process_id)
+                arrivals.append(p.arrival_time)
+                bursts.append(p.burst_time)
+                priorities.append(p.priority)
+                levels.append(level_codes[p.queue_level])
+                dependency_ids.extend(p.dependencies)
+                dependency_offsets.append(len(dependency_ids))
+            offsets.append(len(process_ids))
+        return cls(
+            offsets=np.array(offsets, dtype=np.int64),
+            process_ids=np.array(process_ids, dtype=np.int64),
+            arrival_times=np.array(arrivals, dtype=np.int64),
+            burst_times=np.array(bursts, dtype=np.int64),
+            priorities=np.array(priorities, dtype=np.int64),
+            queue_levels=np.array(levels, dtype=np.int8),
+            dependency_offsets=np.array(dependency_offsets, dtype=np.int64),
+            dependency_ids=np.array(dependency_ids, dtype=np.int64),
+        )
+
+    @classmethod
+    def generate(cls, seeds: Iterable[int], num_processes: int = 10,
+                 max_dependencies: int = 3, **kwargs) -> 'WorkloadBatch':
+        """seed마다 generate_processes로 워크로드를 만들어 batch 생성"""
+        return cls.from_workloads(
+            generate_processes(num_processes, max_dependencies, seed=seed, **kwargs)
+            for seed in seeds
+        )
+
+    def workload(self, index: int) -> List[Process]:
+        """워크로드 하나를 Process 목록으로 복원"""
+        lo, hi = int(self.offsets[index]), int(self.offsets[index + 1])
+        dependency_lo = int(self.dependency_offsets[lo])
+        dependency_offsets = (self.dependency_offsets[lo:hi + 1] - dependency_lo).tolist()
+        dependency_ids = self.dependency_ids[dependency_lo:dependency_lo + dependency_offsets[-1]].tolist()
+        return [
+            Process(
+                process_id=pid,
+                arrival_time=arrival,
+                burst_time=burst,
+                priority=priority,
+                queue_level=QUEUE_LEVELS[level],
+                dependencies=dependency_ids[dependency_offsets[k]:dependency_offsets[k + 1]],
+            )
+            for k, (pid, arrival, burst, priority, level) in enumerate(zip(
+                self.process_ids[lo:hi].tolist(),
+                self.arrival_times[lo:hi].tolist(),
+                self.burst_times[lo:hi].tolist(),
+                self.priorities[lo:hi].tolist(),
+                self.queue_levels[lo:hi].tolist(),
+            ))
+        ]
+
+    def subset(self, indices: Iterable[int]) -> 'WorkloadBatch':
+        """선택한 워크로드만 담은 batch"""
+        return WorkloadBatch.from_workloads(self.workload(i) for i in indices)
+
+def _closed_form_metrics(scheduler: Scheduler, batch: WorkloadBatch) -> np.ndarray:
+    """closed-form 스케줄에서 tick 루프와 같은 방식으로 워크로드별 지표 계산"""
+    n_workloads = len(batch)
+    counts = batch.sizes
+    order, _, ends = scheduler.closed_form_batch_timings(
+        batch.offsets, batch.arrival_times, batch.burst_times)
+    workload = np.repeat(np.arange(n_workloads), counts)
+    arrivals = batch.arrival_times[order]
+    bursts = batch.burst_times[order]
+    process_ids = batch.process_ids[order]
+
+    # 반환 시간은 마지막 실행 구간의 종료 시간 기준 (calculate_detailed_metrics와 동일)
+    turnaround = np.bincount(workload, weights=ends - arrivals, minlength=n_workloads)
+    busy = np.bincount(workload, weights=bursts, minlength=n_workloads)
+    total_time = np.zeros(n_workloads)
+    np.maximum.at(total_time, workload, ends)
+    same_workload = workload[1:] == workload[:-1]
+    switches = np.bincount(workload[1:][same_workload & (process_ids[1:] != process_ids[:-1])],
+                           minlength=n_workloads)
+
+    metrics = np.zeros((n_workloads, len(METRIC_NAMES)))
+    nonempty = counts > 0
+    metrics[nonempty, 0] = (turnaround - busy)[nonempty] / counts[nonempty]
+    metrics[nonempty, 1] = turnaround[nonempty] / counts[nonempty]
+    metrics[nonempty, 2] = busy[nonempty] / total_time[nonempty] * 100
+    metrics[:, 3] = switches
+    return metrics
+
+def _engine_metrics(scheduler_factory: Callable[[], Scheduler], batch: WorkloadBatch) -> np.ndarray:
+    """워크로드마다 tick 엔진으로 스케줄링 (선점형 정책, IPC 의존성 등)"""
+    metrics = np.zeros((len(batch), len(METRIC_NAMES)))
+    for w in range(len(batch)):
+        scheduler = scheduler_factory()
+        scheduler.set_history_sink(NullHistorySink())
+        scheduler.schedule(batch.workload(w))
+        result = scheduler.calculate_metrics()
+        metrics[w] = [result[name] for name in METRIC_NAMES]
+    return metrics
+
+def _closed_form_mask(scheduler: Scheduler, batch: WorkloadBatch) -> np.ndarray:
+    """closed-form으로 계산할 수 있는 워크로드 (Scheduler._schedule_closed_form과 같은 조건)"""
+    if not scheduler.use_fast_path or not scheduler.has_closed_form():
+        return np.zeros(len(batch), dtype=bool)
+    invalid = (batch.arrival_times < 0) | (batch.burst_times < 1)
+    workload = np.repeat(np.arange(len(batch)), batch.sizes)
+    return (np.bincount(workload[invalid], minlength=len(batch)) == 0) & (batch.sizes > 0)
+
+def simulate_batch(batch: WorkloadBatch,
+                   scheduler_factory: Callable[[], Scheduler],
+                   workers: Optional[int] = 1,
+                   chunk_size: int = 64) -> np.ndarray:
+    """
+    batch의 모든 워크로드를 스케줄링하여 (워크로드 x METRIC_NAMES) 지표 행렬 반환
+    - closed-form 정책(Non-IPC FCFS / SJF)은 Process 객체 없이 배열 단위로 한꺼번에 계산
+    - 그 외 정책과 IPC 모드는 워크로드별로 tick 엔진 실행 (결과는 schedule + calculate_metrics와 동일)
+    - workers > 1이면 tick 엔진 워크로드를 chunk 단위로 여러 프로세스에 분배
+      (scheduler_factory는 pickle 가능해야 함, 예: functools.partial(RoundRobinScheduler, time_quantum=4))
+    """
+    metrics = np.zeros((len(batch), len(METRIC_NAMES)))
+    fast = _closed_form_mask(scheduler_factory(), batch)
+    if fast.any():
+        fast_indices = np.flatnonzero(fast)
+        fast_batch = batch if fast.all() else batch.subset(fast_indices)
+        metrics[fast_indices] = _closed_form_metrics(scheduler_factory(), fast_batch)
+
+    slow_indices = np.flatnonzero(~fast)
+    if len(slow_indices) == 0:
+        return metrics
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = [slow_indices[i:i + chunk_size] for i in range(0, len(slow_indices), chunk_size)]
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            metrics[chunk] = _engine_metrics(scheduler_factory, batch.subset(chunk))
+        return metrics
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = [executor.submit(_engine_metrics, scheduler_factory, batch.subset(chunk))
+                   for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            metrics[chunk] = future.result()
+    return metrics
@@ -0,0 +1,379 @@
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.process import generate_processes, save_processes, load_processes
+from src.schedulers.history import NullHistorySink
+from src.schedulers.registry import available_schedulers, create_scheduler
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_REPEATS = 5
+DEFAULT_NOISE_FLOOR = 0.005  # 이보다 짧은 기준 측정은 처리량 회귀 판정에서 제외(초)
+
+def _peak_rss_kb() -> int:
+    """현재 프로세스의 최대 RSS (KB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 byte 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def _run_schedule_case(scheduler_name: str, size: int, use_ipc: bool,
+                       seed: int, history: str) -> Dict:
+    """스케줄러 한 개 x 워크로드 크기 한 개 측정 (측정값은 반복 측정을 합칠 수 있도록 <단계>_samples 목록)"""
+    processes = generate_processes(size, max_dependencies=min(3, size - 1), seed=seed)
+    scheduler = create_scheduler(scheduler_name, use_ipc)
+    if history == "null":
+        scheduler.set_history_sink(NullHistorySink())
+
+    # 지연 import (numpy 등)와 첫 호출 비용이 측정에 섞이지 않도록 작은 워크로드로 먼저 한 번 실행
+    warm_up = create_scheduler(scheduler_name, use_ipc)
+    warm_up.schedule(generate_processes(10, seed=seed))
+    warm_up.calculate_detailed_metrics()
+
+    return {
+        "schedule_samples": [_timed(lambda: scheduler.schedule(processes))],
+        "metrics_samples": [_timed(scheduler.calculate_detailed_metrics)],
+        # 실행된 tick 수 (closed-form fast path는 tick별 기록을 만들지 않으므로 busy time 기준)
+        "events": scheduler.history_stats.busy_time,
+        "simulated_time": scheduler.current_time,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+def _run_io_case(size: int, seed: int) -> Dict:
+    """워크로드 JSON 저장/불러오기 측정"""
+    processes = generate_processes(size, max_dependencies=min(3, size - 1), seed=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "workload.json")
+        save_seconds = _timed(lambda: save_processes(processes, filename=path))
+        load_seconds = _timed(lambda: load_processes(path))
+    return {"save_samples": [save_seconds], "load_samples": [load_seconds], "peak_rss_kb": _peak_rss_kb()}
+
+def _run_render_case(size: int, seed: int, dpi: int) -> Dict:
+    """gantt / performance / timeline 차트 렌더링 측정 (현재 프로세스에서 순차 실행)"""
+    from src.visualizer.render import render_reports
+    processes = generate_processes(size, max_dependencies=min(3, size - 1), seed=seed)
+    ipc_results, non_ipc_results = {}, {}
+    for use_ipc, results in ((True, ipc_results), (False, non_ipc_results)):
+        for name in available_schedulers():
+            scheduler = create_scheduler(name, use_ipc)
+            history = scheduler.schedule([p.copy() for p in processes])
+            results[name] = (history, scheduler.calculate_metrics())
+    with tempfile.TemporaryDirectory() as tmp:
+        def render():
+            render_reports(ipc_results, non_ipc_results, output_dir=tmp, dpi=dpi, workers=1)
+        render()  # font cache 등 첫 렌더링 비용 제외
+        render_seconds = _timed(render)
+    return {"render_samples": [render_seconds], "peak_rss_kb": _peak_rss_kb()}
+
+def _child(conn, func, args):
+    try:
+        conn.send(("ok", func(*args)))
+    except BaseException as e:
+        conn.send(("error", repr(e)))
+    finally:
+        conn.close()
+
+def run_isolated(func, args, timeout: Optional[float]) -> Dict:
+    """별도 프로세스에서 실행하여 케이스별 최대 RSS를 분리하고 timeout 적용"""
+    ctx = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_child, args=(child_conn, func, args))
+    process.start()
+    child_conn.close()
+    if not parent_conn.poll(timeout):
+        process.kill()
+        process.join()
+        return {"status": "timeout"}
+    try:
+        status, payload = parent_conn.recv()
+    except EOFError:
+        # 결과를 보내기 전에 자식 프로세스가 종료됨 (예: 메모리 부족으로 kill)
+        process.join()
+        return {"status": "error", "error": f"exit code {process.exitcode}"}
+    process.join()
+    if status != "ok":
+        return {"status": "error", "error": payload}
+    payload["status"] = "ok"
+    return payload
+
+def _run_rounds(jobs: List[Tuple[Dict, Callable, tuple]], repeats: int, isolate: bool,
+                timeout: Optional[float]):
+    """
+    (case, func, args) 목록을 round-robin으로 repeats번 실행하여 case에 <단계>_samples를 누적
+    - 같은 케이스의 표본이 전체 실행 시간에 흩어지므로 잠시 느려진 구간이 한 케이스에 몰리지 않음
+    - isolate이면 매번 새 프로세스에서 실행 (프로세스 간 편차도 표본에 포함, timeout은 실행마다 적용)
+    - 실패 / timeout이 난 케이스는 그 결과로 바꾸고, 같은 series(case["series"])에서 뒤에 있는
+      아직 측정하지 않은 케이스는 건너뜀
+    """
+    repeats = max(1, repeats)
+    for round_index in range(repeats):
+        print(f"round {round_index + 1}/{repeats}")
+        for index, (case, func, args) in enumerate(jobs):
+            if case["status"] != "ok":
+                continue
+            result = run_isolated(func, args, timeout) if isolate else dict(func(*args), status="ok")
+            if result["status"] != "ok":
+                for key in [key for key in case if key.endswith("_samples")]:
+                    del case[key]
+                case.update(result)
+                for later, _, _ in jobs[index + 1:]:
+                    measured = any(key.endswith("_samples") for key in later)
+                    if not measured and later.get("series") is not None and later.get("series") == case.get("series"):
+                        later["status"] = "skipped"
+                continue
+            for key, value in result.items():
+                if key.endswith("_samples"):
+                    case.setdefault(key, []).extend(value)
+                elif key == "peak_rss_kb":
+                    case[key] = max(case.get(key, 0), value)
+                else:
+                    case[key] = value
+
+def _summarize(case: Dict) -> Dict:
+    """<단계>_samples마다 최소값(<단계>_seconds)과 중앙값(<단계>_seconds_median), 처리량 추가"""
+    for key in [key for key in case if key.endswith("_samples")]:
+        name = key[:-len("_samples")]
+        case[f"{name}_seconds"] = min(case[key])
+        case[f"{name}_seconds_median"] = statistics.median(case[key])
+    if "schedule_seconds" in case:
+        seconds = case["schedule_seconds"]
+        case["events_per_sec"] = case["events"] / seconds if seconds > 0 else float("inf")
+    if "save_seconds" in case:
+        case["processes_per_sec"] = case["size"] / (case["save_seconds"] + case["load_seconds"])
+    return case
+
+def _fit_exponent(points: List[Dict], x_key: str, y_key: str) -> Optional[float]:
+    """log-log 기울기로 스케일링 지수 추정 (1이면 선형)"""
+    xs, ys = [], []
+    for p in points:
+        if p.get("status") == "ok" and p.get(y_key, 0) > 0:
+            xs.append(math.log(p[x_key]))
+            ys.append(math.log(p[y_key]))
+    if len(xs) < 2:
+        return None
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if var == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var
+
+def run_benchmarks(sizes: List[int] = None,
+                   schedulers: List[str] = None,
+                   ipc_modes: List[bool] = (False, True),
+                   seed: int = 0,
+                   history: str = "memory",
+                   timeout: Optional[float] = 60.0,
+                   include_io: bool = True,
+                   render_sizes: List[int] = (10, 100),
+                   render_dpi: int = 100,
+                   isolate: bool = True,
+                   repeats: int = DEFAULT_REPEATS) -> Dict:
+    """
+    전체 벤치마크 실행
+    - 전체 케이스를 repeats round 반복 실행하여 케이스마다 최소값 / 중앙값 기록 (_run_rounds 참고)
+    - timeout을 넘긴 (스케줄러, 모드)는 더 큰 크기를 건너뜀
+    - 결과는 JSON으로 저장 가능한 dict
+    """
+    sizes = sorted(sizes or DEFAULT_SIZES)
+    schedulers = schedulers or available_schedulers()
+
+    results = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "history": history,
+            "repeats": repeats,
+        },
+        "schedule": [],
+        "io": [],
+        "render": [],
+        "scaling": {},
+    }
+
+    jobs = []
+    for name in schedulers:
+        for use_ipc in ipc_modes:
+            for size in sizes:
+                case = {"scheduler": name, "use_ipc": use_ipc, "size": size, "status": "ok",
+                        "series": f"{name}/{'ipc' if use_ipc else 'non_ipc'}"}
+                results["schedule"].append(case)
+                jobs.append((case, _run_schedule_case, (name, size, use_ipc, seed, history)))
+    if include_io:
+        for size in sizes:
+            case = {"size": size, "status": "ok"}
+            results["io"].append(case)
+            jobs.append((case, _run_io_case, (size, seed)))
+    for size in render_sizes:
+        case = {"size": size, "dpi": render_dpi, "status": "ok"}
+        results["render"].append(case)
+        jobs.append((case, _run_render_case, (size, seed, render_dpi)))
+
+    _run_rounds(jobs, repeats, isolate, timeout)
+
+    for case, _, _ in jobs:
+        _summarize(case)
+    points = {}
+    for case in results["schedule"]:
+        series = case.pop("series")
+        if case["status"] == "skipped":
+            continue  # 더 작은 크기에서 timeout / error
+        points.setdefault(series, []).append(case)
+        print(_format_case(case))
+    results["schedule"] = [case for case in results["schedule"] if case["status"] != "skipped"]
+    for series, series_points in points.items():
+        results["scaling"][series] = _fit_exponent(series_points, "size", "schedule_seconds")
+    return results
+
+def _format_case(case: Dict) -> str:
+    mode = "IPC" if case["use_ipc"] else "non-IPC"
+    prefix = f"{case['scheduler']:>8} {mode:>7} n={case['size']:<8}"
+    if case["status"] != "ok":
+        return f"{prefix} {case['status']}"
+    return (f"{prefix} {case['schedule_seconds']:9.4f}s (median {case['schedule_seconds_median']:.4f}s)  "
+            f"{case['events_per_sec']:12,.0f} events/s  "
+            f"metrics {case['metrics_seconds']:8.4f}s  "
+            f"rss {case['peak_rss_kb'] / 1024:8.1f} MB")
+
+def _noise(case: Dict) -> float:
+    """반복 측정의 상대 편차 ((중앙값 - 최소값) / 최소값, 반복하지 않은 결과는 0)"""
+    best = case["schedule_seconds"]
+    median = case.get("schedule_seconds_median", best)
+    return (median - best) / best if best > 0 else 0.0
+
+def compare_with_baseline(results: Dict, baseline: Dict, tolerance: float = 0.2,
+                          noise_floor: float = DEFAULT_NOISE_FLOOR) -> List[str]:
+    """
+    기준 결과와 비교하여 회귀 목록 반환
+    - 처리량(events/s, 반복 중 최소 시간 기준)이 max(tolerance, 두 결과의 상대 편차) 비율 이상 감소
+      (기준 schedule 시간이 noise_floor초 미만이면 측정 잡음이 커서 비교하지 않음)
+    - 최대 RSS가 tolerance 비율 이상 증가
+    - 기준에서는 성공했던 케이스가 timeout / error
+    """
+    def key(case):
+        return (case["scheduler"], case["use_ipc"], case["size"])
+
+    base_cases = {key(c): c for c in baseline.get("schedule", [])}
+    regressions = []
+    for case in results.get("schedule", []):
+        base = base_cases.get(key(case))
+        if base is None or base.get("status") != "ok":
+            continue
+        label = f"{case['scheduler']} {'IPC' if case['use_ipc'] else 'non-IPC'} n={case['size']}"
+        if case.get("status") != "ok":
+            regressions.append(f"{label}: {case.get('status')} (baseline ok)")
+            continue
+        threshold = max(tolerance, _noise(case), _noise(base))
+        if (base["schedule_seconds"] >= noise_floor and
+                case["events_per_sec"] < base["events_per_sec"] * (1 - threshold)):
+            regressions.append(
+                f"{label}: throughput {case['events_per_sec']:,.0f} < "
+                f"baseline {base['events_per_sec']:,.0f} events/s (threshold {threshold:.0%})")
+        if case["peak_rss_kb"] > base["peak_rss_kb"] * (1 + tolerance):
+            regressions.append(
+                f"{label}: peak RSS {case['peak_rss_kb']} KB > baseline {base['peak_rss_kb']} KB")
+    return regressions
+
+def plot_scaling(results: Dict, save_path: str):
+    """워크로드 크기별 실행 시간 곡선 (log-log)"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    series = {}
+    for case in results["schedule"]:
+        if case["status"] == "ok":
+            label = f"{case['scheduler']} ({'IPC' if case['use_ipc'] else 'non-IPC'})"
+            series.setdefault(label, []).append((case["size"], case["schedule_seconds"]))
+    for label, points in series.items():
+        xs, ys = zip(*sorted(points))
+        ax.plot(xs, ys, marker="o", label=label)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("Processes")
+    ax.set_ylabel("Scheduler.schedule time (s)")
+    ax.grid(True, which="both", linestyle="--", alpha=0.5)
+    ax.legend(fontsize=8)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=150)
+    plt.close()
+
+def _parse_list(text: str, cast=str) -> List:
+    return [cast(item) for item in text.split(",") if item]
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--sizes", type=lambda s: _parse_list(s, int), default=DEFAULT_SIZES,
+                        help="워크로드 크기 목록 (예: 10,100,1000,1000000)")
+    parser.add_argument("--schedulers", type=_parse_list, default=None,
+                        help=f"{','.join(available_schedulers())} 중 선택 (기본: 전체)")
+    parser.add_argument("--ipc", choices=["on", "off", "both"], default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", choices=["memory", "null"], default="memory")
+    parser.add_argument("--timeout", type=float, default=60.0, help="케이스당 제한 시간(초)")
+    parser.add_argument("--render-sizes", type=lambda s: _parse_list(s, int), default=[10, 100])
+    parser.add_argument("--no-isolate", action="store_true", help="케이스를 별도 프로세스로 분리하지 않음")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="케이스별 반복 횟수")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR,
+                        help="이보다 짧은 기준 schedule 시간(초)은 처리량 비교에서 제외")
+    parser.add_argument("--plot", default=None, help="스케일링 곡선 PNG 저장 경로")
+
+def run_from_args(args) -> int:
+    ipc_modes = {"on": [True], "off": [False], "both": [False, True]}[args.ipc]
+    results = run_benchmarks(sizes=args.sizes,
+                             schedulers=args.schedulers,
+                             ipc_modes=ipc_modes,
+                             seed=args.seed,
+                             history=args.history,
+                             timeout=args.timeout,
+                             render_sizes=args.render_sizes,
+                             isolate=not args.no_isolate,
+                             repeats=args.repeats)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    print("\nScaling exponents (schedule time ~ n^k):")
+    for key, exponent in results["scaling"].items():
+        print(f"  {key:<20} {'-' if exponent is None else f'{exponent:.2f}'}")
+
+    if args.plot:
+        plot_scaling(results, args.plot)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance, args.noise_floor)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="CPU scheduler benchmarks")
+    add_arguments(parser)
+    return run_from_args(parser.parse_args(argv))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from src.process import Process, workload_fingerprint
+from src.schedulers.base import ENGINE_VERSION, Scheduler
+
+DEFAULT_CACHE_DIR = ".scheduler_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def result_key(scheduler: Scheduler, processes: List[Process]) -> str:
+    """(워크로드, 스케줄러 클래스, 파라미터, IPC 여부, 엔진 버전, 채널 설정)의 SHA-256 해시"""
+    scheduler_class = type(scheduler)
+    data = {
+        "workload": workload_fingerprint(processes),
+        "scheduler": f"{scheduler_class.__module__}.{scheduler_class.__qualname__}",
+        "params": scheduler.get_params(),
+        "use_ipc": scheduler.use_ipc,
+        "engine_version": ENGINE_VERSION,
+    }
+    if scheduler.channels is not None and scheduler.use_ipc:
+        data["channels"] = scheduler.channels.get_params()
+    if scheduler.admission is not None:
+        data["admission"] = scheduler.admission.get_params()
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """
+    스케줄링 결과(병합된 실행 구간 + 성능 지표)를 로컬 디스크에 저장하는 content-addressed 캐시
+    - 결과 하나당 압축 NPZ 파일 하나 (파일 이름이 key)
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (LRU, 사용 시각은 mtime)
+    """
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.npz")
+
+    def get(self, key: str) -> Optional[Tuple['Segments', Dict]]:
+        """캐시된 (실행 구간, 지표) 반환 (없거나 읽을 수 없으면 None)"""
+        import numpy as np
+        from src.visualizer.segments import Segments
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                segments = Segments(data["process_ids"], data["start_times"], data["end_times"])
+                metrics = json.loads(data["metrics"].tobytes().decode("utf-8"))
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return segments, metrics
+
+    def put(self, key: str, history, metrics: Dict):
+        """실행 기록을 병합된 구간으로 압축 저장한 뒤 용량 초과분 정리"""
+        import numpy as np
+        from src.visualizer.segments import Segments
+        segments = Segments.from_history(history)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                process_ids=segments.process_ids,
+                start_times=segments.start_times,
+                end_times=segments.end_times,
+                metrics=np.frombuffer(json.dumps(metrics).encode("utf-8"), dtype=np.uint8),
+            )
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def run(self, scheduler: Scheduler, processes: List[Process]) -> Tuple[object, Dict]:
+        """캐시에 있으면 바로 반환하고, 없으면 schedule + calculate_metrics 실행 후 저장"""
+        key = result_key(scheduler, processes)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        history = scheduler.schedule(processes)
+        metrics = scheduler.calculate_metrics()
+        self.put(key, history, metrics)
+        return history, metrics
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".npz"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """총 크기가 max_bytes 이하가 될 때까지 오래된 항목 삭제"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            os.remove(path)
@@ -0,0 +1,466 @@
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from src.process import Process, generate_processes, load_processes, save_processes
+from src.schedulers.aging import AGING_POLICIES
+from src.schedulers.registry import (
+    available_schedulers, create_scheduler, default_params, resolve_name
+)
+
+# numpy / matplotlib 등 무거운 모듈은 필요한 명령 안에서만 import
+
+def _parse_list(text: str, cast=str) -> List:
+    return [cast(item) for item in text.split(",") if item]
+
+def _parse_mapping(text: str, cast=str) -> Dict:
+    """key=value 목록 (예: A=6,B=3,C=1)"""
+    mapping = {}
+    for item in _parse_list(text):
+        key, _, value = item.partition("=")
+        mapping[key.strip()] = cast(value)
+    return mapping
+
+def _parse_value(text: str):
+    """sweep 값 (정수 -> 실수 -> 문자열 순으로 변환)"""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+def _load_workload(path: str) -> Tuple[List[Process], Dict]:
+    processes, settings = load_processes(path)
+    if processes is None:
+        raise SystemExit(f"Workload file not found: {path} (python -m src.cli generate --output {path})")
+    return processes, settings
+
+def _scheduler_params(name: str, settings: Dict, time_quantum: Optional[int]) -> Dict:
+    """워크로드 파일의 scheduler_settings와 명령행 인자로 생성 인자 결정"""
+    defaults = default_params(name)
+    params = {}
+    time_quantum = time_quantum or settings.get("time_quantum")
+    if "time_quantum" in defaults and time_quantum:
+        params["time_quantum"] = time_quantum
+    if "queue_algorithms" in defaults and settings.get("mlq_algorithms"):
+        params["queue_algorithms"] = settings["mlq_algorithms"]
+    return params
+
+def _ipc_modes(value: str) -> List[bool]:
+    return {"on": [True], "off": [False], "both": [True, False]}[value]
+
+def _mode_label(use_ipc: bool) -> str:
+    return "ipc" if use_ipc else "non_ipc"
+
+def _run_scheduler(scheduler, processes: List[Process], cache=None):
+    process_copy = [p.copy() for p in processes]
+    if cache is not None:
+        return cache.run(scheduler, process_copy)
+    history = scheduler.schedule(process_copy)
+    return history, scheduler.calculate_metrics()
+
+def _open_cache(cache_dir: Optional[str]):
+    if not cache_dir:
+        return None
+    from src.cache import ResultCache
+    return ResultCache(cache_dir)
+
+def _format_header() -> str:
+    return (f"{'Scheduler':<12} {'Mode':<8} {'Avg Wait':>10} {'Avg TAT':>10} "
+            f"{'P99 Wait':>10} {'Max Wait':>10} {'CPU %':>7} {'Switches':>9}")
+
+def _format_row(name: str, mode: str, metrics: Dict) -> str:
+    return (f"{name:<12} {mode:<8} {metrics['avg_waiting_time']:>10.2f} "
+            f"{metrics['avg_turnaround_time']:>10.2f} {metrics.get('p99_waiting_time', 0):>10.2f} "
+            f"{metrics.get('max_waiting_time', 0):>10} {metrics['cpu_utilization']:>7.1f} {metrics['context_switches']:>9}")
+
+def _add_workload_input(parser: argparse.ArgumentParser):
+    parser.add_argument("--input", default="process_config.json", help="워크로드 JSON 파일")
+    parser.add_argument("--schedulers", type=_parse_list, default=None,
+                        help=f"{','.join(available_schedulers())} 중 선택 (기본: 전체)")
+    parser.add_argument("--ipc", choices=["on", "off", "both"], default="both")
+    parser.add_argument("--time-quantum", type=int, default=None,
+                        help="RR / MLQ time quantum (기본: 워크로드 파일 설정)")
+
+def _selected_schedulers(args) -> List[str]:
+    try:
+        return [resolve_name(name) for name in (args.schedulers or available_schedulers())]
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+# generate
+def _add_generate_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--num-processes", "-n", type=int, default=10)
+    parser.add_argument("--max-dependencies", type=int, default=3)
+    parser.add_argument("--max-arrival", type=int, default=20)
+    parser.add_argument("--burst-range", type=lambda s: tuple(_parse_list(s, int)), default=(10, 20),
+                        help="burst 시간 범위 (예: 10,20)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--time-quantum", type=int, default=4)
+    parser.add_argument("--output", "-o", default="process_config.json")
+
+def _run_generate(args) -> int:
+    processes = generate_processes(args.num_processes, args.max_dependencies, seed=args.seed,
+                                   max_arrival=args.max_arrival, burst_range=args.burst_range)
+    save_processes(processes, time_quantum=args.time_quantum, filename=args.output)
+    print(f"{len(processes)} processes saved to {args.output}")
+    return 0
+
+# run
+def _add_run_arguments(parser: argparse.ArgumentParser):
+    _add_workload_input(parser)
+    parser.add_argument("--details", action="store_true", help="프로세스별 상세 계산 과정 출력")
+    parser.add_argument("--json", default=None, help="지표를 저장할 JSON 파일")
+    parser.add_argument("--cache-dir", default=None, help="결과 캐시 디렉터리 (기본: 사용 안 함)")
+    parser.add_argument("--store", default=None, help="실행 결과를 저장할 SQLite DB 경로")
+    parser.add_argument("--latency", type=int, default=None, help="IPC 메시지 전달 지연(tick)")
+    parser.add_argument("--bandwidth", type=float, default=None, help="IPC 채널의 tick당 전송량")
+    parser.add_argument("--buffer", type=float, default=None, help="IPC 송신 buffer 크기")
+    parser.add_argument("--message-size", type=float, default=1, help="IPC 메시지 크기")
+    parser.add_argument("--aging", choices=list(AGING_POLICIES), default=None,
+                        help="Priority / MLQ 대기 시간 aging 방식 (기본: 사용 안 함)")
+    parser.add_argument("--aging-rate", type=float, default=0.1, help="linear aging의 tick당 우선순위 증가량")
+    parser.add_argument("--aging-half-life", type=float, default=50,
+                        help="exponential aging에서 유효 우선순위가 절반이 되는 대기 시간(tick)")
+    parser.add_argument("--level-shares", type=lambda s: _parse_mapping(s, float), default=None,
+                        help="MLQ 레벨별 CPU 점유 비율 (예: A=6,B=3,C=1)")
+    parser.add_argument("--capacity", type=int, default=None, help="ready queue 최대 길이 (기본: 무제한)")
+    parser.add_argument("--admission", choices=["reject", "drop_oldest", "defer"], default="reject",
+                        help="ready queue가 가득 찼을 때의 admission 정책")
+    parser.add_argument("--level-rates", type=_parse_mapping, default=None,
+                        help="레벨별 tick당 admission 수와 burst (예: A=0.5:2,C=0.1)")
+    parser.add_argument("--deadline", type=int, default=None, help="도착 기준 상대 마감 시간(tick)")
+
+def _aging_params(name: str, args) -> Dict:
+    """aging / level share 옵션 중 스케줄러가 지원하는 생성 인자"""
+    defaults = default_params(name)
+    params = {}
+    if "aging" in defaults and args.aging:
+        params.update(aging=args.aging, aging_rate=args.aging_rate, aging_half_life=args.aging_half_life)
+    if "level_shares" in defaults and args.level_shares:
+        params["level_shares"] = args.level_shares
+    return params
+
+def _admission_control(args):
+    """admission 옵션을 하나라도 주면 AdmissionControl 생성"""
+    if args.capacity is None and args.level_rates is None and args.deadline is None:
+        return None
+    from src.schedulers.admission import AdmissionControl, TokenBucket
+    level_rates = {}
+    for level, spec in (args.level_rates or {}).items():
+        rate, _, burst = spec.partition(":")
+        level_rates[level] = TokenBucket(float(rate), float(burst) if burst else 1)
+    return AdmissionControl(capacity=args.capacity, policy=args.admission, level_rates=level_rates,
+                            deadline=args.deadline)
+
+def _channel_model(args):
+    """채널 옵션을 하나라도 주면 IPC 모드 스케줄러에 사용할 ChannelModel 생성"""
+    if args.latency is None and args.bandwidth is None and args.buffer is None:
+        return None
+    from src.schedulers.channels import ChannelModel
+    return ChannelModel(latency=args.latency or 0, bandwidth=args.bandwidth, capacity=args.buffer,
+                        message_size=args.message_size)
+
+def _run_run(args) -> int:
+    processes, settings = _load_workload(args.input)
+    names = _selected_schedulers(args)
+    cache = _open_cache(args.cache_dir)
+    store = None
+    if args.store:
+        from src.run_store import RunStore
+        store = RunStore(args.store)
+
+    results = {}
+    try:
+        admission = _admission_control(args)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(_format_header())
+    for use_ipc in _ipc_modes(args.ipc):
+        for name in names:
+            try:
+                scheduler = create_scheduler(name, use_ipc,
+                                             **_scheduler_params(name, settings, args.time_quantum),
+                                             **_aging_params(name, args))
+            except ValueError as e:
+                raise SystemExit(str(e))
+            scheduler.set_channels(_channel_model(args))
+            scheduler.set_admission(admission)
+            history, metrics = _run_scheduler(scheduler, processes, cache)
+            results[f"{name}/{_mode_label(use_ipc)}"] = metrics
+            print(_format_row(name, _mode_label(use_ipc), metrics))
+            if "avg_send_blocked_time" in metrics:
+                print(f"{'':<21} send blocked {metrics['avg_send_blocked_time']:.2f}, "
+                      f"message wait {metrics['avg_message_wait_time']:.2f}, "
+                      f"messages {metrics['messages_delivered']}")
+            if "goodput" in metrics:
+                print(f"{'':<21} completed {metrics['completed_processes']}, "
+                      f"dropped {metrics['dropped_processes']}, deferred {metrics['deferred_processes']} "
+                      f"(avg {metrics['avg_defer_time']:.2f}), goodput {metrics['goodput']:.1f}%, "
+                      f"max queue {metrics['max_queue_length']}")
+            if args.details and cache is None:
+                print(scheduler.calculate_detailed_metrics()[1])
+            if store is not None:
+                store.record(scheduler, processes, metrics, history=history)
+
+    if store is not None:
+        store.close()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Metrics saved to {args.json}")
+    return 0
+
+# sweep
+def _add_sweep_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--input", default="process_config.json", help="워크로드 JSON 파일")
+    parser.add_argument("--scheduler", default="RR")
+    parser.add_argument("--param", default="time_quantum", help="변경할 생성 인자 이름")
+    parser.add_argument("--values", type=lambda s: _parse_list(s, _parse_value), required=True,
+                        help="인자 값 목록 (예: 1,2,4,8)")
+    parser.add_argument("--ipc", choices=["on", "off", "both"], default="off")
+    parser.add_argument("--metric", default="avg_waiting_time", help="최적 값을 고를 지표 (작을수록 좋음)")
+    parser.add_argument("--store", default=None, help="실행 결과를 저장할 SQLite DB 경로")
+    parser.add_argument("--sweep-name", default=None, help="DB에 기록할 sweep 이름")
+
+def _run_sweep(args) -> int:
+    processes, settings = _load_workload(args.input)
+    try:
+        name = resolve_name(args.scheduler)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    available = default_params(name)
+    if args.param not in available:
+        raise SystemExit(f"{name} has no parameter {args.param} (available: {', '.join(available) or 'none'})")
+    for value in args.values:
+        # 출력 전에 모든 값으로 생성 가능한지 확인
+        try:
+            create_scheduler(name, False, **{**_scheduler_params(name, settings, None), args.param: value})
+        except (TypeError, ValueError) as e:
+            raise SystemExit(f"Invalid {args.param}={value!r} for {name}: {e}")
+    store = None
+    if args.store:
+        from src.run_store import RunStore
+        store = RunStore(args.store)
+    sweep_name = args.sweep_name or f"{name}.{args.param}"
+
+    print(f"{args.param:<14} " + _format_header())
+    for use_ipc in _ipc_modes(args.ipc):
+        best = None
+        for value in args.values:
+            params = _scheduler_params(name, settings, None)
+            params[args.param] = value
+            scheduler = create_scheduler(name, use_ipc, **params)
+            history, metrics = _run_scheduler(scheduler, processes)
+            print(f"{str(value):<14} " + _format_row(name, _mode_label(use_ipc), metrics))
+            if best is None or metrics[args.metric] < best[1]:
+                best = (value, metrics[args.metric])
+            if store is not None:
+                store.record(scheduler, processes, metrics, history=history, sweep=sweep_name)
+        print(f"Best {args.param} ({_mode_label(use_ipc)}, {args.metric}): {best[0]} = {best[1]:.2f}")
+
+    if store is not None:
+        store.close()
+    return 0
+
+# report
+def _add_report_arguments(parser: argparse.ArgumentParser):
+    _add_workload_input(parser)
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--format", choices=["png", "svg", "pdf"], default="png")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--preview", action="store_true", help="저해상도 미리보기로 빠르게 출력")
+    parser.add_argument("--no-html", action="store_true", help="timeline.html 생성 안 함")
+    parser.add_argument("--telemetry", action="store_true", help="시계열 차트 telemetry.png 생성")
+
+def _run_report(args) -> int:
+    import os
+    from src.visualizer.render import render_reports
+
+    processes, settings = _load_workload(args.input)
+    names = _selected_schedulers(args)
+    ipc_results, non_ipc_results = {}, {}
+    telemetries = {}
+    for use_ipc in _ipc_modes(args.ipc):
+        results = ipc_results if use_ipc else non_ipc_results
+        for name in names:
+            scheduler = create_scheduler(name, use_ipc,
+                                         **_scheduler_params(name, settings, args.time_quantum))
+            if args.telemetry:
+                from src.schedulers.telemetry import Telemetry
+                scheduler.set_telemetry(Telemetry())
+                telemetries[f"{name} ({'with' if use_ipc else 'without'} IPC)"] = scheduler.telemetry
+            results[name] = _run_scheduler(scheduler, processes)
+
+    paths = render_reports(ipc_results, non_ipc_results, output_dir=args.output_dir,
+                           fmt=args.format, dpi=args.dpi, preview=args.preview)
+    if not args.no_html:
+        from src.visualizer.html_export import HTMLTimelineExporter
+        path = os.path.join(args.output_dir, "timeline.html")
+        HTMLTimelineExporter().export_with_ipc(ipc_results, non_ipc_results, path, processes)
+        paths.append(path)
+    if telemetries:
+        from src.visualizer.telemetry_chart import TelemetryVisualizer
+        path = os.path.join(args.output_dir, f"telemetry.{args.format}")
+        TelemetryVisualizer(dpi=args.dpi).plot_comparison(telemetries, path)
+        paths.append(path)
+    for path in paths:
+        print(f"Saved {path}")
+    return 0
+
+# measure
+def _add_measure_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--input", default="process_config.json", help="워크로드 JSON 파일")
+    parser.add_argument("--scheduler", default="RR")
+    parser.add_argument("--ipc", action="store_true", help="IPC 모드로 실행")
+    parser.add_argument("--time-quantum", type=int, default=None,
+                        help="RR / MLQ time quantum (기본: 워크로드 파일 설정)")
+    parser.add_argument("--tick", type=float, default=0.01, help="tick 길이(초)")
+    parser.add_argument("--gate", choices=["auto", "signal", "cgroup"], default="auto",
+                        help="프로세스 정지 / 재개 방식")
+    parser.add_argument("--timeout", type=float, default=None, help="전체 제한 시간(초)")
+
+def _run_measure(args) -> int:
+    from src.real_backend import RealProcessBackend, compare_with_simulation, format_comparison
+    from src.schedulers.registry import scheduler_factory
+
+    processes, settings = _load_workload(args.input)
+    try:
+        name = resolve_name(args.scheduler)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    factory = scheduler_factory(name, args.ipc, **_scheduler_params(name, settings, args.time_quantum))
+    backend = RealProcessBackend(factory(), tick_seconds=args.tick, gate=args.gate, timeout=args.timeout)
+    result = backend.run([p.copy() for p in processes])
+    print(format_comparison(compare_with_simulation(factory, processes, result), result))
+    return 1 if result.failed else 0
+
+# cluster
+def _add_cluster_arguments(parser: argparse.ArgumentParser):
+    from src.cluster import PLACEMENT_POLICIES
+    parser.add_argument("--input", default="process_config.json", help="워크로드 JSON 파일")
+    parser.add_argument("--scheduler", default="RR", help="노드별 스케줄러")
+    parser.add_argument("--ipc", action="store_true", help="IPC 모드로 실행")
+    parser.add_argument("--time-quantum", type=int, default=None,
+                        help="RR / MLQ time quantum (기본: 워크로드 파일 설정)")
+    parser.add_argument("--nodes", type=int, default=4, help="노드 수")
+    parser.add_argument("--placement", type=_parse_list, default=list(PLACEMENT_POLICIES),
+                        help=f"{','.join(PLACEMENT_POLICIES)} 중 선택 (기본: 전체)")
+    parser.add_argument("--penalty", type=int, default=0, help="노드 간 의존성 메시지 지연(tick)")
+    parser.add_argument("--workers", type=int, default=1, help="노드 시뮬레이션 프로세스 수")
+    parser.add_argument("--seed", type=int, default=None, help="power_of_two 노드 선택 seed")
+
+def _run_cluster(args) -> int:
+    from src.cluster import ClusterSimulator
+    from src.schedulers.registry import scheduler_factory
+
+    processes, settings = _load_workload(args.input)
+    try:
+        name = resolve_name(args.scheduler)
+        factory = scheduler_factory(name, args.ipc, **_scheduler_params(name, settings, args.time_quantum))
+        simulators = [ClusterSimulator(args.nodes, factory, placement, message_penalty=args.penalty,
+                                       workers=args.workers, seed=args.seed)
+                      for placement in args.placement]
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"{'Placement':<14} {'Avg Wait':>10} {'Avg TAT':>10} {'P99 Wait':>10} {'Makespan':>9} "
+          f"{'CPU %':>7} {'Imbalance':>10} {'Messages':>9} {'Syncs':>7}")
+    for simulator in simulators:
+        result = simulator.run([p.copy() for p in processes])
+        metrics = result.metrics
+        print(f"{simulator.placement:<14} {metrics['avg_waiting_time']:>10.2f} "
+              f"{metrics['avg_turnaround_time']:>10.2f} {metrics['p99_waiting_time']:>10.2f} "
+              f"{metrics['makespan']:>9} {metrics['cpu_utilization']:>7.1f} "
+              f"{metrics['load_imbalance']:>10.2f} {metrics['cross_node_messages']:>9} {result.sync_rounds:>7}")
+    return 0
+
+# benchmark
+def _add_benchmark_arguments(parser: argparse.ArgumentParser):
+    from src.benchmark import add_arguments
+    add_arguments(parser)
+
+def _run_benchmark(args) -> int:
+    from src.benchmark import run_from_args
+    return run_from_args(args)
+
+# fluid
+def _add_fluid_arguments(parser: argparse.ArgumentParser):
+    from src.fluid import FLUID_POLICIES
+    parser.add_argument("--input", default=None,
+                        help="워크로드 JSON 파일 (없으면 --num-processes 크기의 합성 trace 사용)")
+    parser.add_argument("--num-processes", "-n", type=int, default=1_000_000, help="합성 trace 프로세스 수")
+    parser.add_argument("--utilization", type=float, default=0.9, help="합성 trace의 평균 CPU 사용률")
+    parser.add_argument("--policy", choices=FLUID_POLICIES, default="RR")
+    parser.add_argument("--window", type=int, default=10, help="같은 class 도착을 묶는 시간 구간(tick)")
+    parser.add_argument("--time-quantum", type=int, default=None, help="검증용 RR / MLQ time quantum")
+    parser.add_argument("--samples", type=int, default=8, help="검증 구간 수")
+    parser.add_argument("--sample-size", type=int, default=200, help="검증 구간당 프로세스 수")
+    parser.add_argument("--seed", type=int, default=None, help="합성 trace / 검증 구간 선택 seed")
+    parser.add_argument("--no-validate", action="store_true", help="tick 엔진 검증 생략")
+
+def _run_fluid(args) -> int:
+    import time
+    from src.fluid import FLUID_METRICS, simulate_fluid, synthetic_trace, workload_arrays
+
+    started = time.perf_counter()
+    settings = {}
+    try:
+        if args.input:
+            processes, settings = _load_workload(args.input)
+            arrays = workload_arrays(processes)
+        else:
+            arrays = synthetic_trace(args.num_processes, args.utilization, seed=args.seed)
+        loaded = time.perf_counter() - started
+        result = simulate_fluid(*arrays, policy=args.policy, window=args.window,
+                                time_quantum=args.time_quantum or settings.get("time_quantum"),
+                                queue_algorithms=settings.get("mlq_algorithms"),
+                                validate=not args.no_validate, samples=args.samples,
+                                sample_size=args.sample_size, seed=args.seed)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    print(f"{args.policy} fluid approximation: {len(arrays[0])} processes, {result.cohorts} cohorts, "
+          f"{result.events} events")
+    validation = result.validation
+    print(f"{'Metric':<22} {'Value':>12} {'Error':>10} {'Bias':>8}")
+    for metric in FLUID_METRICS:
+        error = f"±{result.errors[metric]:.2f}" if metric in result.errors else "-"
+        bias = f"{validation.bias(metric) * 100:+.1f}%" if validation is not None else "-"
+        print(f"{metric:<22} {result.metrics[metric]:>12.2f} {error:>10} {bias:>8}")
+    print(f"load {loaded:.2f}s, solve {result.wall_seconds:.2f}s"
+          + (f", validation {validation.wall_seconds:.2f}s "
+             f"({validation.samples} x {validation.sample_size} processes)" if validation is not None else ""))
+    return 0
+
+# 명령 이름 -> (도움말, 인자 등록 함수, 실행 함수)
+COMMANDS = {
+    "generate": ("랜덤 워크로드 JSON 생성", _add_generate_arguments, _run_generate),
+    "run": ("스케줄러 실행 후 지표 출력 (시각화 없음)", _add_run_arguments, _run_run),
+    "sweep": ("스케줄러 생성 인자 값별 지표 비교", _add_sweep_arguments, _run_sweep),
+    "report": ("차트 / HTML 타임라인 생성", _add_report_arguments, _run_report),
+    "measure": ("실제 Linux 프로세스로 실행하여 시뮬레이션과 비교", _add_measure_arguments, _run_measure),
+    "cluster": ("여러 노드 클러스터에서 배치 정책별 지표 비교", _add_cluster_arguments, _run_cluster),
+    "benchmark": ("스케줄러 성능 벤치마크", _add_benchmark_arguments, _run_benchmark),
+    "fluid": ("대용량 trace를 fluid 근사로 계산하고 tick 엔진 부분 실행으로 오차 추정", _add_fluid_arguments, _run_fluid),
+}
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """command를 주면 그 명령의 인자만 등록 (다른 명령이 사용하는 모듈은 import하지 않음)"""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="CPU 스케줄러 시뮬레이션")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, add_arguments, _) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        if command is None or name == command:
+            add_arguments(subparser)
+    return parser
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    command = next((arg for arg in argv if arg in COMMANDS), "")
+    args = build_parser(command).parse_args(argv)
+    return COMMANDS[args.command][2](args)
+
+if __name__ == "__main__":
+    sys.exit(main())
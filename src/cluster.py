@@ -0,0 +1,462 @@
+import heapq
+import itertools
+import multiprocessing
+import random
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.process import Process, ProcessState
+from src.schedulers.base import Scheduler, percentile
+from src.schedulers.history import NullHistorySink, ProcessExecution
+
+PLACEMENT_POLICIES = ("least_loaded", "power_of_two", "locality")
+
+def _check_placement(placement: str):
+    if placement not in PLACEMENT_POLICIES:
+        raise ValueError(f"Unknown placement policy: {placement} (available: {', '.join(PLACEMENT_POLICIES)})")
+
+class ClusterNode:
+    """
+    노드 하나의 tick 엔진 (tick 실행은 Scheduler.schedule과 같은 Scheduler._run_tick 사용)
+    - dispatcher가 배치한 프로세스를 도착 시간에 ready queue에 추가
+    - 다른 노드에서 완료된 선행 프로세스는 전달 시간에 add_remote_completion으로 반영
+    - 실행할 프로세스가 없으면 다음 도착 / 메시지 시간으로 건너뜀 (계측 / telemetry 사용 시에는 tick마다 진행)
+    - 채널 모델과 admission 정책은 노드 간 메시지 / drop을 모델링하지 않으므로 지원하지 않음
+    """
+    def __init__(self, node_id: int, scheduler: Scheduler, keep_history: bool = False):
+        if scheduler.channels is not None or scheduler.admission is not None:
+            raise ValueError("Cluster nodes do not support channel models or admission control "
+                             "(detach them with set_channels(None) / set_admission(None))")
+        self.node_id = node_id
+        self.scheduler = scheduler
+        if not keep_history:
+            scheduler.set_history_sink(NullHistorySink())
+        scheduler.reset_run([])
+        if scheduler.telemetry is not None:
+            scheduler.telemetry.reset(None, scheduler.use_ipc)
+        if scheduler.instrumentation is not None:
+            scheduler.instrumentation.start_run(scheduler)
+        self._seq = itertools.count()
+        self.arrivals = []  # (도착 시간, 순서, 프로세스) heap
+        self.messages = []  # (전달 시간, 선행 process id) heap
+        self.active = 0  # 도착했지만 완료되지 않은 프로세스 수
+        self.load = 0  # 배치된 프로세스의 남은 실행 시간 합
+        self.busy_until = 0  # 마지막 실행 tick의 종료 시간
+        self.completions: List[Tuple[int, int]] = []  # 마지막 sync 이후 (process id, 완료 시간)
+
+    def place(self, process: Process):
+        process.reset()
+        self.scheduler.all_processes.append(process)
+        heapq.heappush(self.arrivals, (process.arrival_time, next(self._seq), process))
+        self.load += process.remaining_time
+
+    def deliver(self, deliver_at: int, process_id: int):
+        heapq.heappush(self.messages, (deliver_at, process_id))
+
+    def idle(self) -> bool:
+        return not self.active and not self.arrivals and not self.messages
+
+    def advance(self, until: Optional[int]):
+        """current_time부터 until 직전 tick까지 실행 (until이 None이면 배치된 프로세스가 모두 끝날 때까지)"""
+        scheduler = self.scheduler
+        instr = scheduler.instrumentation
+        telemetry = scheduler.telemetry
+        # 계측 / telemetry는 tick마다 기록하므로 idle 구간을 건너뛰지 않음
+        skip_idle = instr is None and telemetry is None
+        while until is None or scheduler.current_time < until:
+            if self.idle():
+                return
+            now = scheduler.current_time
+            if instr is not None:
+                t0 = time.perf_counter()
+                instr.counters["ticks"] += 1
+            while self.messages and self.messages[0][0] <= now:
+                scheduler.add_remote_completion(heapq.heappop(self.messages)[1])
+            while self.arrivals and self.arrivals[0][0] <= now:
+                scheduler.enqueue(heapq.heappop(self.arrivals)[2])
+                self.active += 1
+                if instr is not None:
+                    instr.counters["admissions"] += 1
+            if instr is not None:
+                instr.phase_seconds["admission"] += time.perf_counter() - t0
+                instr.observe_queue(len(scheduler.ready_queue))
+
+            current = scheduler._run_tick(None, instr, telemetry)
+            if current is None:
+                # 도착이나 메시지 없이는 상태가 바뀌지 않으므로 다음 event 시간으로 이동
+                events = [t for t in (self.arrivals[0][0] if self.arrivals else None,
+                                      self.messages[0][0] if self.messages else None, until)
+                          if t is not None]
+                if not events:
+                    if self.active:
+                        raise RuntimeError(f"Node {self.node_id}: processes blocked on dependencies "
+                                           "that can never complete")
+                    scheduler.current_time = now
+                    return
+                if skip_idle:
+                    scheduler.current_time = min(events)
+                continue
+
+            # burst 0 프로세스는 0 tick 실행
+            self.load -= min(1, current.burst_time)
+            if current.state == ProcessState.TERMINATED:
+                self.completions.append((current.process_id, now))
+                self.active -= 1
+            self.busy_until = now + 1
+
+    def summary(self, keep_history: bool) -> Dict:
+        scheduler = self.scheduler
+        # 노드 사용률은 마지막 실행 tick까지 기준 (schedule 종료 시점과 같음)
+        scheduler.current_time = self.busy_until
+        scheduler.execution_history.close()
+        summary = {
+            "node_id": self.node_id,
+            "processes": len(scheduler.all_processes),
+            "busy_time": scheduler.history_stats.busy_time,
+            "metrics": scheduler.calculate_metrics() if scheduler.all_processes else {},
+        }
+        if scheduler.instrumentation is not None:
+            scheduler.instrumentation.end_run(scheduler)
+        if keep_history:
+            summary["history"] = list(scheduler.execution_history)
+        return summary
+
+class _Shard:
+    """노드 일부를 담당하는 단위 (workers > 1이면 별도 프로세스에서 실행)"""
+    def __init__(self, node_ids: List[int], scheduler_factory: Callable[[], Scheduler], keep_history: bool):
+        self.keep_history = keep_history
+        self.nodes = [ClusterNode(node_id, scheduler_factory(), keep_history) for node_id in node_ids]
+        self.busy = set()  # 할 일이 남아 있는 노드 index (sync 비용이 전체 노드 수에 비례하지 않도록)
+
+    def step(self, until: Optional[int], placements: List[Tuple[int, Process]],
+             messages: List[Tuple[int, int, int]]) -> Tuple[Dict[int, int], List[Tuple[int, int]]]:
+        """배치 / 메시지를 반영하고 노드를 until까지 진행하여 (진행한 노드 index -> 부하, 완료 목록) 반환"""
+        for index, process in placements:
+            self.nodes[index].place(process)
+            self.busy.add(index)
+        for index, deliver_at, process_id in messages:
+            self.nodes[index].deliver(deliver_at, process_id)
+            self.busy.add(index)
+        loads = {}
+        completions = []
+        for index in sorted(self.busy):
+            node = self.nodes[index]
+            node.advance(until)
+            completions.extend(node.completions)
+            node.completions.clear()
+            loads[index] = node.load
+            if node.idle():
+                self.busy.discard(index)
+        return loads, completions
+
+    def results(self) -> List[Dict]:
+        return [node.summary(self.keep_history) for node in self.nodes]
+
+def _shard_worker(connection, node_ids: List[int], scheduler_factory: Callable[[], Scheduler],
+                  keep_history: bool):
+    """worker 프로세스: dispatcher의 명령을 받아 shard를 진행하고 결과 전송"""
+    try:
+        shard = _Shard(node_ids, scheduler_factory, keep_history)
+        while True:
+            command, args = connection.recv()
+            if command == "step":
+                connection.send((True, shard.step(*args)))
+            else:
+                connection.send((True, shard.results()))
+                break
+    except Exception:
+        connection.send((False, traceback.format_exc()))
+    finally:
+        connection.close()
+
+class _RemoteShard:
+    def __init__(self, context, node_ids: List[int], scheduler_factory: Callable[[], Scheduler],
+                 keep_history: bool):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_shard_worker,
+                                       args=(child, node_ids, scheduler_factory, keep_history),
+                                       daemon=True)
+        self.process.start()
+        child.close()
+
+    def send(self, command: str, *args):
+        self.connection.send((command, args))
+
+    def receive(self):
+        ok, value = self.connection.recv()
+        if not ok:
+            raise RuntimeError(f"Cluster worker failed:\n{value}")
+        return value
+
+    def close(self):
+        self.connection.close()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+
+class _LocalShard:
+    """workers = 1일 때 같은 프로세스에서 실행 (_RemoteShard와 같은 send / receive 형태)"""
+    def __init__(self, node_ids: List[int], scheduler_factory: Callable[[], Scheduler], keep_history: bool):
+        self.shard = _Shard(node_ids, scheduler_factory, keep_history)
+        self._result = None
+
+    def send(self, command: str, *args):
+        self._result = self.shard.step(*args) if command == "step" else self.shard.results()
+
+    def receive(self):
+        return self._result
+
+    def close(self):
+        pass
+
+class Dispatcher:
+    """
+    도착한 프로세스를 노드에 배치하는 전역 dispatcher
+    - least_loaded: 남은 실행 시간 합이 가장 작은 노드 (부하가 바뀔 때마다 heap에 추가하고 오래된 항목은 꺼낼 때 버림)
+    - power_of_two: 무작위로 고른 두 노드 중 부하가 작은 노드
+    - locality: 의존성으로 연결된 프로세스(선행 / 후행)가 가장 많이 배치된 노드, 없으면 least_loaded
+    - 같은 시간에 도착한 프로세스는 앞서 배치한 burst를 부하에 더해 가며 배치
+    """
+    def __init__(self, num_nodes: int, placement: str = "least_loaded", seed: Optional[int] = None):
+        _check_placement(placement)
+        self.num_nodes = num_nodes
+        self.placement = placement
+        self.rng = random.Random(seed)
+        self.loads = [0] * num_nodes
+        self._heap = [(0, node) for node in range(num_nodes)]  # (부하, 노드), 부하가 바뀌면 새 항목 추가
+        self.node_of: Dict[int, int] = {}
+        self.dependents: Dict[int, List[int]] = {}
+
+    def set_dependents(self, processes: List[Process]):
+        self.dependents = {}
+        for process in processes:
+            for dependency in process.dependencies:
+                self.dependents.setdefault(dependency, []).append(process.process_id)
+
+    def set_load(self, node: int, load: int):
+        if self.loads[node] != load:
+            self.loads[node] = load
+            heapq.heappush(self._heap, (load, node))
+
+    def update_loads(self, loads: Dict[int, int]):
+        for node, load in loads.items():
+            self.set_load(node, load)
+        # 오래된 항목이 많이 쌓이면 heap 재구성
+        if len(self._heap) > 4 * self.num_nodes:
+            self._heap = [(load, node) for node, load in enumerate(self.loads)]
+            heapq.heapify(self._heap)
+
+    def _least_loaded(self) -> int:
+        heap = self._heap
+        while heap[0][0] != self.loads[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def _power_of_two(self) -> int:
+        if self.num_nodes == 1:
+            return 0
+        a, b = self.rng.sample(range(self.num_nodes), 2)
+        return min(a, b, key=lambda node: (self.loads[node], node))
+
+    def _locality(self, process: Process) -> int:
+        neighbours = [self.node_of[pid] for pid in process.dependencies if pid in self.node_of]
+        neighbours += [self.node_of[pid] for pid in self.dependents.get(process.process_id, ())
+                       if pid in self.node_of]
+        if not neighbours:
+            return self._least_loaded()
+        counts = Counter(neighbours)
+        return min(counts, key=lambda node: (-counts[node], self.loads[node], node))
+
+    def place(self, process: Process) -> int:
+        if self.placement == "least_loaded":
+            node = self._least_loaded()
+        elif self.placement == "power_of_two":
+            node = self._power_of_two()
+        else:
+            node = self._locality(process)
+        self.node_of[process.process_id] = node
+        self.set_load(node, self.loads[node] + process.burst_time)
+        return node
+
+@dataclass
+class ClusterResult:
+    """클러스터 시뮬레이션 결과 (시간 단위는 tick)"""
+    metrics: Dict[str, float]
+    placement: Dict[int, int]  # process id -> node
+    nodes: List[Dict]
+    sync_rounds: int
+    wall_seconds: float
+    histories: Dict[int, List[ProcessExecution]] = field(default_factory=dict)
+
+class ClusterSimulator:
+    """
+    여러 노드에서 노드별 스케줄러를 실행하는 클러스터 시뮬레이션
+    - 노드는 shard로 나뉘어 workers개 프로세스에서 병렬로 진행하고, dispatch 시점에만 동기화
+    - IPC 모드에서 다른 노드의 선행 프로세스 완료는 message_penalty tick 뒤에 전달
+      (노드 사이 의존성이 남아 있는 동안은 message_penalty + 1 tick마다 동기화하여 메시지 순서 보장)
+    - 노드 수가 1이면 결과는 같은 스케줄러의 schedule과 같음
+    """
+    def __init__(self, num_nodes: int, scheduler_factory: Callable[[], Scheduler],
+                 placement: str = "least_loaded", message_penalty: int = 0,
+                 workers: int = 1, seed: Optional[int] = None, keep_history: bool = False):
+        if num_nodes < 1:
+            raise ValueError("num_nodes must be at least 1")
+        if message_penalty < 0:
+            raise ValueError("message_penalty must be non-negative")
+        _check_placement(placement)
+        self.num_nodes = num_nodes
+        self.scheduler_factory = scheduler_factory
+        self.placement = placement
+        self.message_penalty = message_penalty
+        self.workers = max(1, min(workers, num_nodes))
+        self.seed = seed
+        self.keep_history = keep_history
+        self.use_ipc = scheduler_factory().use_ipc
+
+    def _start_shards(self) -> List:
+        """노드 i는 shard i % workers의 (i // workers)번째 노드"""
+        groups = [list(range(shard, self.num_nodes, self.workers)) for shard in range(self.workers)]
+        if self.workers == 1:
+            return [_LocalShard(groups[0], self.scheduler_factory, self.keep_history)]
+        context = multiprocessing.get_context()
+        return [_RemoteShard(context, group, self.scheduler_factory, self.keep_history) for group in groups]
+
+    def run(self, processes: List[Process]) -> ClusterResult:
+        started = time.perf_counter()
+        for process in processes:
+            process.reset()
+        known = {p.process_id for p in processes}
+        if self.use_ipc:
+            for process in processes:
+                unknown = [d for d in process.dependencies if d not in known]
+                if unknown:
+                    raise ValueError(f"Process {process.process_id} depends on unknown processes {unknown}")
+
+        dispatcher = Dispatcher(self.num_nodes, self.placement, self.seed)
+        dispatcher.set_dependents(processes)
+        by_id = {p.process_id: p for p in processes}
+        arrival_order = sorted(processes, key=lambda p: p.arrival_time)
+        cursor = 0
+        lookahead = self.message_penalty + 1
+        workers = self.workers
+
+        completion_time: Dict[int, int] = {}
+        waiting_on: Dict[int, List[int]] = {}  # 선행 process id -> 다른 노드(또는 미배치)에서 기다리는 후행
+        pending_edges = 0
+        messages_sent = 0
+        placements: List[List[Tuple[int, Process]]] = [[] for _ in range(workers)]
+        messages: List[List[Tuple[int, int, int]]] = [[] for _ in range(workers)]
+
+        def send_message(dependency: int, node: int):
+            nonlocal messages_sent
+            deliver_at = completion_time[dependency] + lookahead
+            messages[node % workers].append((node // workers, deliver_at, dependency))
+            messages_sent += 1
+
+        shards = self._start_shards()
+        sync_rounds = 0
+        now = 0
+        try:
+            while True:
+                # 현재 시간에 도착한 프로세스 배치
+                while cursor < len(arrival_order) and arrival_order[cursor].arrival_time <= now:
+                    process = arrival_order[cursor]
+                    cursor += 1
+                    node = dispatcher.place(process)
+                    placements[node % workers].append((node // workers, process.copy()))
+                    if not self.use_ipc:
+                        continue
+                    for dependency in process.dependencies:
+                        if dependency in completion_time:
+                            if dispatcher.node_of[dependency] != node:
+                                send_message(dependency, node)
+                        elif dispatcher.node_of.get(dependency) != node:
+                            waiting_on.setdefault(dependency, []).append(process.process_id)
+                            pending_edges += 1
+                    # 먼저 배치되어 이 프로세스를 기다리던 후행이 같은 노드이면 노드 안의 의존성이 됨
+                    waiters = waiting_on.get(process.process_id)
+                    if waiters:
+                        remote = [pid for pid in waiters if dispatcher.node_of[pid] != node]
+                        pending_edges -= len(waiters) - len(remote)
+                        waiting_on[process.process_id] = remote
+
+                if len(completion_time) == len(processes):
+                    break
+
+                next_arrival = arrival_order[cursor].arrival_time if cursor < len(arrival_order) else None
+                until = next_arrival
+                if pending_edges:
+                    until = now + lookahead if until is None else min(until, now + lookahead)
+
+                for index, shard in enumerate(shards):
+                    shard.send("step", until, placements[index], messages[index])
+                    placements[index] = []
+                    messages[index] = []
+                loads = {}
+                for index, shard in enumerate(shards):
+                    shard_loads, completions = shard.receive()
+                    for local, load in shard_loads.items():
+                        loads[local * workers + index] = load
+                    for process_id, completed_at in completions:
+                        completion_time[process_id] = completed_at
+                        for waiter in waiting_on.pop(process_id, ()):
+                            send_message(process_id, dispatcher.node_of[waiter])
+                            pending_edges -= 1
+                dispatcher.update_loads(loads)
+                sync_rounds += 1
+                if until is None:
+                    if len(completion_time) < len(processes):
+                        raise RuntimeError("Cluster simulation stopped before all processes completed")
+                    break
+                now = until
+
+            for shard in shards:
+                shard.send("results")
+            nodes = [None] * self.num_nodes
+            for index, shard in enumerate(shards):
+                nodes[index::workers] = shard.receive()
+        finally:
+            for shard in shards:
+                shard.close()
+
+        # 원래 Process 객체에 완료 시간 / 지표 기록 (schedule과 같은 방식)
+        for process_id, completed_at in completion_time.items():
+            process = by_id[process_id]
+            process.remaining_time = 0
+            process.state = ProcessState.TERMINATED
+            process.completion_time = completed_at
+            process.turnaround_time = completed_at - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+
+        histories = {node["node_id"]: node.pop("history") for node in nodes if "history" in node}
+        return ClusterResult(
+            metrics=self._cluster_metrics(processes, nodes, messages_sent),
+            placement=dict(dispatcher.node_of),
+            nodes=nodes,
+            sync_rounds=sync_rounds,
+            wall_seconds=time.perf_counter() - started,
+            histories=histories,
+        )
+
+    def _cluster_metrics(self, processes: List[Process], nodes: List[Dict], messages_sent: int) -> Dict[str, float]:
+        """calculate_detailed_metrics와 같은 정의 (반환 시간 = 마지막 실행 종료 - 도착)"""
+        turnaround = [p.completion_time + 1 - p.arrival_time for p in processes]
+        waiting = [t - p.burst_time for t, p in zip(turnaround, processes)]
+        count = len(processes)
+        makespan = max((p.completion_time + 1 for p in processes), default=0)
+        busy = [node["busy_time"] for node in nodes]
+        mean_busy = sum(busy) / len(busy)
+        return {
+            "avg_waiting_time": sum(waiting) / count if count else 0,
+            "avg_turnaround_time": sum(turnaround) / count if count else 0,
+            "p99_waiting_time": percentile(waiting, 99) if waiting else 0,
+            "max_waiting_time": max(waiting, default=0),
+            "makespan": makespan,
+            "cpu_utilization": sum(busy) / (makespan * self.num_nodes) * 100 if makespan else 0,
+            "load_imbalance": max(busy) / mean_busy if mean_busy else 0,
+            "context_switches": sum(node["metrics"].get("context_switches", 0) for node in nodes),
+            "cross_node_messages": messages_sent,
+        }
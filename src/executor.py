@@ -0,0 +1,405 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.process import Process, QueueLevel
+from src.schedulers.base import percentile
+from src.schedulers.registry import DEFAULT_MLQ_ALGORITHMS
+
+POLICIES = ("FCFS", "SJF", "Priority", "MLQ")
+
+class DependencyError(Exception):
+    """선행 작업이 실패하거나 취소되어 실행하지 않은 작업의 예외"""
+    def __init__(self, task_id: int, dependency_id: int):
+        super().__init__(f"Task {task_id} skipped: dependency {dependency_id} did not complete")
+        self.task_id = task_id
+        self.dependency_id = dependency_id
+
+class TaskFuture(Future):
+    """task_id가 붙은 Future (다른 작업의 dependencies로 전달 가능)"""
+    def __init__(self, task_id: int):
+        super().__init__()
+        self.task_id = task_id
+
+@dataclass
+class TaskRecord:
+    """작업 한 개의 상태와 시간 기록 (executor 생성 시점 기준 초)"""
+    process: Process
+    name: str
+    submit_time: float
+    ready_time: Optional[float] = None
+    dispatch_time: Optional[float] = None
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    status: str = "blocked"  # blocked / ready / running / done / failed / cancelled
+    dependents: List[int] = field(default_factory=list)
+
+    @property
+    def task_id(self) -> int:
+        return self.process.process_id
+
+    @property
+    def run_time(self) -> float:
+        return self.end_time - self.start_time
+
+    @property
+    def turnaround_time(self) -> float:
+        return self.end_time - self.submit_time
+
+    @property
+    def waiting_time(self) -> float:
+        """제출 후 실행 시작까지 (의존성 대기 + 큐 대기)"""
+        return self.start_time - self.submit_time
+
+    @property
+    def dependency_wait(self) -> float:
+        return self.ready_time - self.submit_time
+
+    @property
+    def queue_wait(self) -> float:
+        return self.dispatch_time - self.ready_time
+
+    @property
+    def dispatch_latency(self) -> float:
+        """dispatch 후 worker에서 실제로 시작하기까지"""
+        return self.start_time - self.dispatch_time
+
+def _policy_key(policy: str, mlq_algorithms: Dict[str, str]) -> Callable[[Process, int], Tuple]:
+    """ready 작업의 heap key (seq는 제출 순서, 같은 key에서는 먼저 제출한 작업 우선)"""
+    if policy == "FCFS":
+        return lambda process, seq: (seq,)
+    if policy == "SJF":
+        return lambda process, seq: (process.burst_time, seq)
+    if policy == "Priority":
+        return lambda process, seq: (process.priority, seq)
+    if policy == "MLQ":
+        # 레벨 A -> B -> C 순, 레벨 안에서는 SJF면 비용 순, 그 외(FCFS / RR)는 제출 순
+        # 작업은 선점할 수 없으므로 RR은 제출 순서와 같음
+        rank = {level: i for i, level in enumerate(QueueLevel)}
+        by_cost = {level: mlq_algorithms.get(level.value) == "SJF" for level in QueueLevel}
+        return lambda process, seq: (rank[process.queue_level],
+                                     process.burst_time if by_cost[process.queue_level] else 0, seq)
+    raise ValueError(f"Unknown policy: {policy} (available: {', '.join(POLICIES)})")
+
+def _run_task(fn, args, kwargs) -> Tuple[float, float, object]:
+    """worker에서 실행 (시작 / 종료 시각은 프로세스 간 비교 가능한 monotonic 시계)"""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return start, time.perf_counter(), result
+
+class PolicyExecutor(Executor):
+    """
+    스케줄링 정책 순서로 Python callable을 실행하는 submit / future executor
+    - ready 작업은 정책 key의 heap에 두고, worker 수만큼만 내부 pool에 넘겨 pool 내부 큐에서 순서가 바뀌지 않게 함
+    - dependencies는 IPC 모드처럼 DAG로 처리 (선행 작업이 모두 성공해야 ready, 실패 / 취소 시 후속 작업은 DependencyError)
+    - dispatch는 제출 / 완료 callback에서만 수행 (별도 polling thread 없음)
+    """
+    def __init__(self, policy: str = "FCFS", max_workers: Optional[int] = None, backend: str = "thread",
+                 mlq_algorithms: Optional[Dict[str, str]] = None):
+        self.policy = policy
+        self._key = _policy_key(policy, mlq_algorithms or DEFAULT_MLQ_ALGORITHMS)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # thread backend는 worker가 heap에서 직접 꺼내 실행, process backend는 작업마다 pool에 전달
+        self._drain_loops = backend == "thread"
+        if backend == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        elif backend == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._ids = itertools.count(1)
+        self._ready: List[Tuple] = []
+        self._records: Dict[int, TaskRecord] = {}
+        self._calls: Dict[int, Tuple[Callable, tuple, dict]] = {}
+        self._futures: Dict[int, TaskFuture] = {}
+        self._waiting_on: Dict[int, int] = {}  # task id -> 남은 선행 작업 수
+        self._running = 0
+        self._unfinished = 0
+        self._shutdown = False
+        self._started = time.perf_counter()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._started
+
+    def submit(self, fn, /, *args, **kwargs) -> TaskFuture:
+        return self.submit_task(fn, *args, **kwargs)
+
+    def submit_task(self, fn, /, *args, cost: float = 1, priority: int = 0,
+                    queue_level: Union[QueueLevel, str] = QueueLevel.A,
+                    dependencies: Iterable[Union[int, Future]] = (), name: Optional[str] = None,
+                    **kwargs) -> TaskFuture:
+        """
+        정책 속성을 지정하여 제출
+        - cost: SJF / MLQ(SJF 레벨)의 추정 실행 비용
+        - priority: Priority 정책 순위 (낮을수록 먼저)
+        - dependencies: 먼저 성공해야 하는 작업의 TaskFuture 또는 task_id
+        """
+        if isinstance(queue_level, str):
+            queue_level = QueueLevel(queue_level)
+        dependency_ids = [d.task_id if isinstance(d, TaskFuture) else int(d) for d in dependencies]
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            unknown = [d for d in dependency_ids if d not in self._records]
+            if unknown:
+                raise ValueError(f"Unknown dependencies: {unknown}")
+            task_id = next(self._ids)
+            process = Process(process_id=task_id, arrival_time=task_id, burst_time=cost,
+                              priority=priority, queue_level=queue_level, dependencies=dependency_ids)
+            record = TaskRecord(process, name or getattr(fn, "__name__", "task"), self._now())
+            future = TaskFuture(task_id)
+            self._records[task_id] = record
+            self._calls[task_id] = (fn, args, kwargs)
+            self._futures[task_id] = future
+            self._unfinished += 1
+
+            failed_dependency = None
+            pending = 0
+            for dependency_id in dependency_ids:
+                dependency = self._records[dependency_id]
+                if dependency.status in ("failed", "cancelled"):
+                    failed_dependency = dependency_id
+                elif dependency.status != "done":
+                    dependency.dependents.append(task_id)
+                    pending += 1
+
+            if failed_dependency is not None:
+                failures = self._fail_locked(task_id, "failed")
+                failures[task_id] = DependencyError(task_id, failed_dependency)
+                to_start = []
+            else:
+                self._waiting_on[task_id] = pending
+                if pending == 0:
+                    self._make_ready_locked(record)
+                to_start = self._take_dispatchable_locked()
+        if failed_dependency is not None:
+            self._set_failures(failures)
+        self._start(to_start)
+        return future
+
+    def _make_ready_locked(self, record: TaskRecord):
+        record.status = "ready"
+        record.ready_time = self._now()
+        heapq.heappush(self._ready, (self._key(record.process, record.task_id), record.task_id))
+
+    def _take_dispatchable_locked(self) -> List[int]:
+        """
+        빈 worker 수만큼 실행 단위를 예약
+        - thread: ready 작업이 없을 때까지 연속 실행하는 drain loop 수 (task id 대신 None)
+        - process: heap에서 꺼낸 작업 id
+        """
+        taken = []
+        while self._ready and self._running < self.max_workers:
+            self._running += 1
+            taken.append(None if self._drain_loops else self._pop_ready_locked())
+        return taken
+
+    def _pop_ready_locked(self) -> int:
+        _, task_id = heapq.heappop(self._ready)
+        record = self._records[task_id]
+        record.status = "running"
+        record.dispatch_time = self._now()
+        return task_id
+
+    def _start(self, taken: List[Optional[int]]):
+        for task_id in taken:
+            if task_id is None:
+                self._pool.submit(self._drain)
+                continue
+            future = self._futures[task_id]
+            if not future.set_running_or_notify_cancel():
+                self._finish(task_id, cancelled=True)
+                continue
+            fn, args, kwargs = self._calls.pop(task_id)
+            try:
+                inner = self._pool.submit(_run_task, fn, args, kwargs)
+            except BaseException as e:
+                self._finish(task_id, error=e)
+                continue
+            inner.add_done_callback(lambda f, task_id=task_id: self._on_done(task_id, f))
+
+    def _drain(self):
+        """thread backend worker: 작업마다 pool에 다시 넘기지 않고 정책 순서로 연속 실행"""
+        task_id = None
+        outcome = None
+        while True:
+            with self._lock:
+                failures = {}
+                if task_id is not None:
+                    failures = self._complete_locked(task_id, *outcome)
+                    finished, finished_outcome = task_id, outcome
+                else:
+                    finished = None
+                task_id = self._pop_ready_locked() if self._ready else None
+                if task_id is None:
+                    self._running -= 1
+                # 완료로 ready가 된 후속 작업이 남아 있으면 빈 worker에도 drain loop 시작 (fan-out 병렬 실행)
+                to_start = self._take_dispatchable_locked()
+                if self._unfinished == 0:
+                    self._idle.notify_all()
+                call = self._calls.pop(task_id) if task_id is not None else None
+            self._start(to_start)
+            if finished is not None:
+                self._deliver(finished, *finished_outcome[:3], failures)
+            if task_id is None:
+                return
+
+            if not self._futures[task_id].set_running_or_notify_cancel():
+                outcome = (None, None, True, None, None)
+                continue
+            fn, args, kwargs = call
+            try:
+                start, end, result = _run_task(fn, args, kwargs)
+                outcome = (result, None, False, start - self._started, end - self._started)
+            except BaseException as e:
+                outcome = (None, e, False, None, None)
+
+    def _on_done(self, task_id: int, inner: Future):
+        if inner.cancelled():
+            self._finish(task_id, cancelled=True)
+            return
+        error = inner.exception()
+        if error is not None:
+            self._finish(task_id, error=error)
+            return
+        start, end, result = inner.result()
+        self._finish(task_id, result=result, start=start - self._started, end=end - self._started)
+
+    def _fail_locked(self, task_id: int, status: str) -> Dict[int, BaseException]:
+        """작업을 실패 처리하고 아직 실행하지 않은 후속 작업 전체를 DependencyError로 실패 처리"""
+        record = self._records[task_id]
+        record.status = status
+        record.end_time = self._now()
+        self._calls.pop(task_id, None)
+        self._unfinished -= 1
+        failures = {}
+        stack = [(dependent, task_id) for dependent in record.dependents]
+        while stack:
+            dependent_id, cause = stack.pop()
+            dependent = self._records[dependent_id]
+            if dependent.status != "blocked":
+                continue
+            dependent.status = "failed"
+            dependent.end_time = self._now()
+            self._calls.pop(dependent_id, None)
+            self._waiting_on.pop(dependent_id, None)
+            self._unfinished -= 1
+            failures[dependent_id] = DependencyError(dependent_id, cause)
+            stack.extend((d, dependent_id) for d in dependent.dependents)
+        return failures
+
+    def _complete_locked(self, task_id: int, result=None, error: Optional[BaseException] = None,
+                         cancelled: bool = False, start: Optional[float] = None,
+                         end: Optional[float] = None) -> Dict[int, BaseException]:
+        """완료 상태 반영 후 ready가 된 후속 작업을 heap에 추가 (실패 시 후속 작업 실패 목록 반환)"""
+        record = self._records[task_id]
+        record.start_time = start if start is not None else record.dispatch_time
+        if error is not None or cancelled:
+            return self._fail_locked(task_id, "cancelled" if cancelled else "failed")
+        record.status = "done"
+        record.end_time = end
+        self._unfinished -= 1
+        for dependent_id in record.dependents:
+            if dependent_id in self._waiting_on:
+                self._waiting_on[dependent_id] -= 1
+                if self._waiting_on[dependent_id] == 0:
+                    del self._waiting_on[dependent_id]
+                    self._make_ready_locked(self._records[dependent_id])
+        return {}
+
+    def _deliver(self, task_id: int, result, error: Optional[BaseException], cancelled: bool,
+                 failures: Dict[int, BaseException]):
+        """사용자 callback이 다시 submit할 수 있으므로 lock 밖에서 결과 설정"""
+        future = self._futures[task_id]
+        if error is not None:
+            future.set_exception(error)
+        elif not cancelled:
+            future.set_result(result)
+        self._set_failures(failures)
+
+    def _finish(self, task_id: int, result=None, error: Optional[BaseException] = None,
+                cancelled: bool = False, start: Optional[float] = None, end: Optional[float] = None):
+        """process backend 작업 완료 처리"""
+        with self._lock:
+            self._running -= 1
+            failures = self._complete_locked(task_id, result, error, cancelled, start, end)
+            to_start = self._take_dispatchable_locked()
+            if self._unfinished == 0:
+                self._idle.notify_all()
+        self._deliver(task_id, result, error, cancelled, failures)
+        self._start(to_start)
+
+    def _set_failures(self, failures: Dict[int, BaseException]):
+        for dependent_id, error in failures.items():
+            dependent = self._futures[dependent_id]
+            if dependent.set_running_or_notify_cancel():
+                dependent.set_exception(error)
+        if failures:
+            with self._lock:
+                if self._unfinished == 0:
+                    self._idle.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """제출된 모든 작업이 끝날 때까지 대기"""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            cancelled = []
+            if cancel_futures:
+                cancelled = [task_id for task_id, record in self._records.items()
+                             if record.status in ("blocked", "ready")]
+        for task_id in cancelled:
+            self._futures[task_id].cancel()
+        # 취소된 작업은 heap에서 꺼낼 때 정리되므로 대기는 모든 작업이 끝날 때까지
+        if wait:
+            self.wait()
+        self._pool.shutdown(wait=wait)
+
+    def records(self) -> List[TaskRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+    def metrics(self) -> Dict[str, float]:
+        """완료된 작업의 지연 지표 (초, 시뮬레이터와 같은 이름 사용)"""
+        done = [r for r in self.records() if r.status == "done"]
+        n = len(done)
+        if n == 0:
+            return {"completed": 0, "failed": sum(r.status != "done" for r in self.records())}
+        waiting = [r.waiting_time for r in done]
+        span = max(r.end_time for r in done) - min(r.submit_time for r in done)
+        return {
+            "completed": n,
+            "failed": sum(r.status in ("failed", "cancelled") for r in self.records()),
+            "avg_waiting_time": sum(waiting) / n,
+            "p99_waiting_time": percentile(waiting, 99),
+            "max_waiting_time": max(waiting),
+            "avg_turnaround_time": sum(r.turnaround_time for r in done) / n,
+            "avg_run_time": sum(r.run_time for r in done) / n,
+            "avg_dependency_wait": sum(r.dependency_wait for r in done) / n,
+            "avg_queue_wait": sum(r.queue_wait for r in done) / n,
+            "avg_dispatch_latency": sum(r.dispatch_latency for r in done) / n,
+            "throughput": n / span if span > 0 else float("inf"),
+        }
+
+    def as_processes(self, tick_seconds: float) -> List[Process]:
+        """완료된 작업을 tick 단위 워크로드로 변환 (같은 파이프라인을 시뮬레이터로 재현)"""
+        processes = []
+        for record in self.records():
+            if record.status != "done":
+                continue
+            process = record.process.copy()
+            process.arrival_time = int(record.submit_time / tick_seconds)
+            process.burst_time = max(1, round(record.run_time / tick_seconds))
+            process.remaining_time = process.burst_time
+            processes.append(process)
+        return processes
@@ -0,0 +1,334 @@
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from statistics import NormalDist
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.batch import METRIC_NAMES, WorkloadBatch, simulate_batch
+from src.schedulers.base import Scheduler
+from src.schedulers.registry import DEFAULT_MLQ_ALGORITHMS, DEFAULT_TIME_QUANTUM, scheduler_factory
+
+DEFAULT_TARGET_METRICS = ("avg_waiting_time", "avg_turnaround_time")
+
+@dataclass
+class WorkloadFamily:
+    """seed만 다른 워크로드 집합의 생성 조건 (generate_processes 인자)"""
+    num_processes: int = 10
+    max_dependencies: int = 3
+    max_arrival: int = 20
+    burst_range: Tuple[int, int] = (10, 20)
+
+    def __post_init__(self):
+        # JSON에서 불러온 list도 tuple로 맞춰 비교 가능하게 함
+        self.burst_range = tuple(self.burst_range)
+
+    def generate(self, seeds: Iterable[int]) -> WorkloadBatch:
+        return WorkloadBatch.generate(seeds, num_processes=self.num_processes,
+                                      max_dependencies=self.max_dependencies,
+                                      max_arrival=self.max_arrival,
+                                      burst_range=self.burst_range)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["burst_range"] = list(self.burst_range)
+        return data
+
+def default_policies(time_quantum: int = DEFAULT_TIME_QUANTUM,
+                     mlq_algorithms: Optional[Dict[str, str]] = None,
+                     ipc_modes: Sequence[bool] = (False, True)) -> Dict[str, Callable[[], Scheduler]]:
+    """main.py와 같은 스케줄러 구성 (이름 -> pickle 가능한 생성 함수)"""
+    mlq_algorithms = mlq_algorithms or DEFAULT_MLQ_ALGORITHMS
+    policies = {}
+    for use_ipc in ipc_modes:
+        mode = "ipc" if use_ipc else "non_ipc"
+        policies[f"FCFS/{mode}"] = scheduler_factory("FCFS", use_ipc)
+        policies[f"SJF/{mode}"] = scheduler_factory("SJF", use_ipc)
+        policies[f"RR/{mode}"] = scheduler_factory("RR", use_ipc, time_quantum=time_quantum)
+        policies[f"Priority/{mode}"] = scheduler_factory("Priority", use_ipc)
+        policies[f"MLQ/{mode}"] = scheduler_factory("MLQ", use_ipc, time_quantum=time_quantum,
+                                                    queue_algorithms=mlq_algorithms)
+    return policies
+
+def t_quantile(p: float, df: int) -> float:
+    """Student t 분포의 분위수 (df 1, 2는 정확한 식, 그 외는 Cornish-Fisher 전개)"""
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    return (z
+            + (z ** 3 + z) / (4 * df)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * df ** 4))
+
+def confidence_interval(samples: np.ndarray, confidence: float = 0.95) -> Tuple[float, float]:
+    """표본 평균과 t 분포 신뢰구간의 반폭 (표본이 2개 미만이면 반폭은 inf)"""
+    n = len(samples)
+    if n == 0:
+        return float("nan"), float("inf")
+    mean = float(np.mean(samples))
+    if n < 2:
+        return mean, float("inf")
+    std_error = float(np.std(samples, ddof=1)) / math.sqrt(n)
+    return mean, t_quantile(0.5 + confidence / 2, n - 1) * std_error
+
+class ExperimentResults:
+    """정책별 (replication x METRIC_NAMES) 지표 행렬 (같은 행은 같은 seed의 워크로드)"""
+    def __init__(self, family: WorkloadFamily, base_seed: int = 0):
+        self.family = family
+        self.base_seed = base_seed
+        self.seeds: List[int] = []
+        self.metrics: Dict[str, np.ndarray] = {}
+
+    @property
+    def replications(self) -> int:
+        return len(self.seeds)
+
+    def completed(self, policy: str) -> int:
+        return len(self.metrics.get(policy, ()))
+
+    def add(self, policy: str, rows: np.ndarray):
+        current = self.metrics.get(policy)
+        if current is None:
+            current = np.empty((0, len(METRIC_NAMES)))
+        self.metrics[policy] = np.vstack([current, rows])
+
+    def column(self, policy: str, metric: str) -> np.ndarray:
+        return self.metrics[policy][:self.replications, METRIC_NAMES.index(metric)]
+
+    def summary(self, confidence: float = 0.95) -> Dict[str, Dict[str, Tuple[float, float]]]:
+        """정책 -> 지표 -> (평균, 신뢰구간 반폭)"""
+        return {
+            policy: {metric: confidence_interval(self.column(policy, metric), confidence)
+                     for metric in METRIC_NAMES}
+            for policy in self.metrics
+        }
+
+    def paired_differences(self, metric: str, confidence: float = 0.95,
+                           pairs: Optional[List[Tuple[str, str]]] = None) -> List[Dict]:
+        """
+        같은 워크로드에서의 정책 간 차이 (a - b)의 평균과 신뢰구간
+        - pairs를 지정하지 않으면 같은 IPC 모드 안의 모든 정책 쌍
+        """
+        if pairs is None:
+            policies = list(self.metrics)
+            pairs = [(a, b) for i, a in enumerate(policies) for b in policies[i + 1:]
+                     if a.split("/")[-1] == b.split("/")[-1]]
+        differences = []
+        for a, b in pairs:
+            mean, half_width = confidence_interval(
+                self.column(a, metric) - self.column(b, metric), confidence)
+            differences.append({
+                "a": a,
+                "b": b,
+                "mean": mean,
+                "half_width": half_width,
+                "significant": abs(mean) > half_width,
+            })
+        return differences
+
+    def is_precise(self, policies: Iterable[str], target_metrics: Sequence[str], confidence: float,
+                   rel_precision: float, abs_precision: float) -> bool:
+        """모든 정책 / 목표 지표의 신뢰구간 반폭이 max(rel_precision * |평균|, abs_precision) 이하인지"""
+        for policy in policies:
+            for metric in target_metrics:
+                mean, half_width = confidence_interval(self.column(policy, metric), confidence)
+                if half_width > max(rel_precision * abs(mean), abs_precision):
+                    return False
+        return True
+
+    def to_dict(self) -> Dict:
+        return {
+            "family": self.family.to_dict(),
+            "base_seed": self.base_seed,
+            "seeds": self.seeds,
+            "metric_names": list(METRIC_NAMES),
+            "metrics": {policy: rows.tolist() for policy, rows in self.metrics.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ExperimentResults':
+        family = WorkloadFamily(**data["family"])
+        results = cls(family, data["base_seed"])
+        results.seeds = list(data["seeds"])
+        for policy, rows in data["metrics"].items():
+            results.metrics[policy] = np.array(rows, dtype=float).reshape(-1, len(METRIC_NAMES))
+        return results
+
+    def save(self, path: str):
+        """중간 결과 저장 (임시 파일에 쓴 뒤 교체하여 중단되어도 기존 파일 유지)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'ExperimentResults':
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+def _simulate_job(family: WorkloadFamily, factory: Callable[[], Scheduler], seeds: List[int]) -> np.ndarray:
+    """worker 프로세스에서 정책 하나 x seed 묶음 실행"""
+    return simulate_batch(family.generate(seeds), factory, workers=1)
+
+def _run_jobs(results: ExperimentResults, jobs: Dict[str, List[int]],
+              policies: Dict[str, Callable[[], Scheduler]], executor: Optional[Executor], workers: int):
+    """정책별 seed 목록을 실행하여 결과에 추가 (executor가 있으면 정책 x seed chunk 단위로 병렬 실행)"""
+    jobs = {policy: seeds for policy, seeds in jobs.items() if seeds}
+    if executor is None:
+        for policy, seeds in jobs.items():
+            results.add(policy, _simulate_job(results.family, policies[policy], seeds))
+        return
+    # worker 수가 정책 수보다 많으면 seed도 나누어 분배
+    n_chunks = max(1, workers // max(1, len(jobs)))
+    futures = {
+        policy: [executor.submit(_simulate_job, results.family, policies[policy], chunk.tolist())
+                 for chunk in np.array_split(seeds, min(n_chunks, len(seeds)))]
+        for policy, seeds in jobs.items()
+    }
+    for policy, policy_futures in futures.items():
+        results.add(policy, np.vstack([future.result() for future in policy_futures]))
+
+def run_experiment(policies: Optional[Dict[str, Callable[[], Scheduler]]] = None,
+                   family: Optional[WorkloadFamily] = None,
+                   base_seed: int = 0,
+                   min_replications: int = 10,
+                   max_replications: int = 1000,
+                   batch_size: int = 10,
+                   confidence: float = 0.95,
+                   rel_precision: float = 0.05,
+                   abs_precision: float = 0.0,
+                   target_metrics: Sequence[str] = DEFAULT_TARGET_METRICS,
+                   workers: Optional[int] = 1,
+                   state_path: Optional[str] = None,
+                   progress: Optional[Callable[[str], None]] = print) -> ExperimentResults:
+    """
+    seed를 batch_size개씩 늘려가며 모든 정책을 같은 워크로드(공통 난수)로 실행
+    - min_replications 이후 목표 지표의 신뢰구간이 충분히 좁아지면 중단 (최대 max_replications)
+    - workers > 1이면 라운드마다 정책 x seed chunk를 worker 프로세스에서 병렬 실행 (None이면 CPU 수)
+    - state_path가 있으면 라운드마다 저장하고, 다시 실행하면 저장된 replication부터 이어서 실행
+      (정책이 추가되었으면 기존 seed에 대해서도 계산)
+    """
+    policies = policies or default_policies()
+    family = family or WorkloadFamily()
+
+    results = None
+    if state_path and os.path.exists(state_path):
+        results = ExperimentResults.load(state_path)
+        if results.family != family or results.base_seed != base_seed:
+            raise ValueError(f"{state_path} was created with a different workload family or base seed")
+        if progress:
+            progress(f"Resuming from {state_path} ({results.replications} replications)")
+    if results is None:
+        results = ExperimentResults(family, base_seed)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # 이전 실행 이후 추가된 정책은 기존 seed부터 계산
+        _run_jobs(results, {policy: results.seeds[results.completed(policy):] for policy in policies},
+                  policies, executor, workers)
+
+        while results.replications < max_replications:
+            if (results.replications >= min_replications and
+                    results.is_precise(policies, target_metrics, confidence, rel_precision, abs_precision)):
+                break
+            start = base_seed + results.replications
+            seeds = list(range(start, min(start + batch_size, base_seed + max_replications)))
+            _run_jobs(results, {policy: seeds for policy in policies}, policies, executor, workers)
+            results.seeds.extend(seeds)
+            if state_path:
+                results.save(state_path)
+            if progress:
+                progress(f"{results.replications} replications")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # 이번 실행에 포함되지 않은 정책은 결과에서 제외
+    results.metrics = {policy: results.metrics[policy] for policy in policies}
+    return results
+
+def format_report(results: ExperimentResults, confidence: float = 0.95,
+                  paired_metric: str = "avg_waiting_time") -> str:
+    """정책별 평균 ± 신뢰구간 표와 정책 간 paired 차이"""
+    lines = [f"Replications: {results.replications}  (confidence {confidence:.0%})", ""]
+    header = f"{'Policy':<16}" + "".join(f"{name:>26}" for name in METRIC_NAMES)
+    lines.append(header)
+    lines.append("-" * len(header))
+    for policy, metrics in results.summary(confidence).items():
+        cells = "".join(f"{mean:>15.2f} ± {half_width:<8.2f}" for mean, half_width in metrics.values())
+        lines.append(f"{policy:<16}{cells}")
+
+    lines.append("")
+    lines.append(f"Paired differences ({paired_metric}, a - b):")
+    for diff in results.paired_differences(paired_metric, confidence):
+        mark = "*" if diff["significant"] else " "
+        lines.append(f"  {diff['a']:<16} - {diff['b']:<16} {diff['mean']:>9.2f} ± {diff['half_width']:<8.2f} {mark}")
+    lines.append("  (* 신뢰구간이 0을 포함하지 않음)")
+    return "\n".join(lines)
+
+def _parse_list(text: str, cast=str) -> List:
+    return [cast(item) for item in text.split(",") if item]
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--num-processes", type=int, default=10)
+    parser.add_argument("--max-dependencies", type=int, default=3)
+    parser.add_argument("--max-arrival", type=int, default=20)
+    parser.add_argument("--burst-range", type=lambda s: tuple(_parse_list(s, int)), default=(10, 20),
+                        help="burst 시간 범위 (예: 10,20)")
+    parser.add_argument("--policies", type=_parse_list, default=None,
+                        help="실행할 정책 (예: FCFS/ipc,RR/non_ipc, 기본: 전체)")
+    parser.add_argument("--time-quantum", type=int, default=DEFAULT_TIME_QUANTUM)
+    parser.add_argument("--seed", type=int, default=0, help="첫 번째 workload seed")
+    parser.add_argument("--min-replications", type=int, default=10)
+    parser.add_argument("--max-replications", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=10, help="라운드마다 추가할 replication 수")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--precision", type=float, default=0.05,
+                        help="목표 상대 정밀도 (신뢰구간 반폭 / |평균|)")
+    parser.add_argument("--abs-precision", type=float, default=0.0)
+    parser.add_argument("--metric", default="avg_waiting_time", choices=METRIC_NAMES,
+                        help="paired 차이를 출력할 지표")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 worker 수 (기본: CPU 수)")
+    parser.add_argument("--state", default=None, help="중간 결과 JSON (있으면 이어서 실행)")
+
+def run_from_args(args) -> int:
+    policies = default_policies(time_quantum=args.time_quantum)
+    if args.policies:
+        unknown = [name for name in args.policies if name not in policies]
+        if unknown:
+            print(f"Unknown policies: {', '.join(unknown)} (available: {', '.join(policies)})")
+            return 2
+        policies = {name: policies[name] for name in args.policies}
+    family = WorkloadFamily(args.num_processes, args.max_dependencies,
+                            args.max_arrival, tuple(args.burst_range))
+    results = run_experiment(policies, family,
+                             base_seed=args.seed,
+                             min_replications=args.min_replications,
+                             max_replications=args.max_replications,
+                             batch_size=args.batch_size,
+                             confidence=args.confidence,
+                             rel_precision=args.precision,
+                             abs_precision=args.abs_precision,
+                             workers=args.workers,
+                             state_path=args.state)
+    print()
+    print(format_report(results, args.confidence, args.metric))
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Monte Carlo scheduler comparison")
+    add_arguments(parser)
+    return run_from_args(parser.parse_args(argv))
+
+if __name__ == "__main__":
+    sys.exit(main())
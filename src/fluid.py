@@ -0,0 +1,356 @@
+import heapq
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.batch import QUEUE_LEVELS
+from src.process import Process
+from src.schedulers.history import NullHistorySink
+from src.schedulers.registry import (
+    DEFAULT_MLQ_ALGORITHMS, DEFAULT_TIME_QUANTUM, resolve_name, scheduler_factory
+)
+
+FLUID_POLICIES = ("FCFS", "RR", "Priority", "MLQ")
+# fluid 근사로 추정하는 지표 (context switch는 추정하지 않음)
+FLUID_METRICS = ("avg_waiting_time", "avg_turnaround_time", "cpu_utilization", "max_waiting_time")
+
+@dataclass
+class FluidValidation:
+    """부분 trace에서 fluid 근사와 정확한 tick 엔진을 비교한 결과 (상대 오차 = (근사 - 정확) / 정확)"""
+    samples: int
+    sample_size: int
+    relative_errors: Dict[str, List[float]]
+    wall_seconds: float
+
+    def bias(self, metric: str) -> float:
+        errors = self.relative_errors[metric]
+        return sum(errors) / len(errors) if errors else 0.0
+
+    def error_bound(self, metric: str, quantile: float = 90) -> float:
+        """표본 상대 오차 절댓값의 quantile (전체 trace 지표의 상대 오차 추정값)"""
+        errors = self.relative_errors[metric]
+        return float(np.percentile(np.abs(errors), quantile)) if errors else math.nan
+
+@dataclass
+class FluidResult:
+    metrics: Dict[str, float]
+    errors: Dict[str, float]  # 지표별 추정 오차 (절댓값, 검증하지 않으면 비어 있음)
+    class_metrics: Dict[str, Dict[str, float]]  # "레벨/priority" -> class별 지표
+    cohorts: int
+    events: int
+    wall_seconds: float
+    validation: Optional[FluidValidation] = None
+
+def _check_policy(policy: str) -> str:
+    if policy not in FLUID_POLICIES:
+        raise ValueError(f"Fluid mode does not support {policy} (available: {', '.join(FLUID_POLICIES)})")
+    return policy
+
+class _Group:
+    """같은 우선순위로 CPU를 받는 cohort 묶음 (ps=True이면 processor sharing, 아니면 FIFO)"""
+    def __init__(self, ps: bool):
+        self.ps = ps
+        self.jobs = 0
+        self.virtual = 0.0  # PS: 작업 하나가 지금까지 받은 서비스 (finish key는 진입 시점 virtual + 평균 burst)
+        self.heap = []  # PS: (finish virtual, cohort)
+        self.fifo = deque()  # FIFO: cohort 순서
+        self.head_left = 0  # FIFO: 맨 앞 cohort의 남은 작업 수
+        self.head_remaining = 0.0  # FIFO: 맨 앞 작업의 남은 실행 시간
+
+class FluidModel:
+    """
+    프로세스를 (window, QueueLevel, priority, burst 구간) cohort로 묶어 계산하는 fluid 근사 (의존성은 무시)
+    - burst 구간은 2의 거듭제곱 단위 (짧은 작업과 긴 작업이 한 cohort에서 평균되지 않도록)
+    - add()는 cohort별 작업 수 / 도착 시간 합 / burst 합만 누적하므로 trace를 chunk로 나눠 넣을 수 있음
+    - cohort는 평균 도착 시간에 평균 burst 작업 count개로 도착, 이벤트(cohort 도착 / 완료) 단위로 시간 진행
+    - 정책별 근사: RR은 전체 processor sharing, FCFS는 도착 순 FIFO, Priority는 priority 값별 엄격한 우선순위 +
+      같은 값 안에서 FIFO, MLQ는 레벨별 엄격한 우선순위 + 레벨 알고리즘이 RR이면 PS, FCFS는 FIFO,
+      SJF는 burst 구간별 우선순위 + FIFO
+    - PS 그룹은 virtual time(작업 하나가 받은 서비스) 기준 finish key heap으로 관리하여 대기 cohort를 갱신하지 않음
+    """
+    def __init__(self, policy: str = "RR", window: int = 10,
+                 queue_algorithms: Optional[Dict[str, str]] = None, spread: int = 4):
+        self.policy = _check_policy(policy)
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.queue_algorithms = dict(queue_algorithms or DEFAULT_MLQ_ALGORITHMS)
+        self.spread = max(1, spread)
+        # chunk별 cohort 요약 (key 열 window, level, priority, burst 구간 / 값 열 작업 수, 도착 시간 합,
+        # 도착 시간 제곱 합, burst 합), 일정 개수가 쌓이면 하나로 합침
+        self._parts: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.num_processes = 0
+
+    def add(self, arrivals: np.ndarray, bursts: np.ndarray, priorities: np.ndarray,
+            queue_levels: np.ndarray):
+        """trace chunk 추가 (queue_levels는 WorkloadBatch와 같은 레벨 code)"""
+        arrivals = np.asarray(arrivals, dtype=np.int64)
+        if len(arrivals) == 0:
+            return
+        bursts = np.asarray(bursts, dtype=np.int64)
+        keys = np.stack([arrivals // self.window, np.asarray(queue_levels, dtype=np.int64),
+                         np.asarray(priorities, dtype=np.int64),
+                         np.floor(np.log2(np.maximum(bursts, 1))).astype(np.int64)])
+        arrivals = arrivals.astype(np.float64)
+        values = np.stack([np.ones(len(arrivals)), arrivals, arrivals * arrivals, bursts.astype(np.float64)])
+        self._parts.append(_reduce(keys, values))
+        if len(self._parts) >= 16:
+            self._parts = [_reduce(*_concat(self._parts))]
+        self.num_processes += len(arrivals)
+
+    def _group_of(self, level: int, priority: int, bucket: int) -> Tuple:
+        """(그룹 정렬 key, PS 여부)"""
+        if self.policy == "RR":
+            return (0, 0), True
+        if self.policy == "FCFS":
+            return (0, 0), False
+        if self.policy == "Priority":
+            return (priority, 0), False
+        algorithm = self.queue_algorithms.get(QUEUE_LEVELS[level].value)
+        return (level, bucket if algorithm == "SJF" else 0), algorithm == "RR"
+
+    def _cohorts(self) -> List[Tuple]:
+        """
+        도착 시간 순 (도착 시간, 평균 burst, 작업 수, level, priority, burst 구간) 목록
+        - cohort 하나를 도착 시간의 평균 / 분산이 같은 균등 구간에 spread개로 나눠 배치 (한 시점에 몰리지 않도록)
+        - 같은 window의 여러 cohort 조각이 같은 시점에 겹치지 않도록 cohort마다 조각 위치를 다르게 어긋나게 함
+        """
+        if not self._parts:
+            return []
+        keys, values = _reduce(*_concat(self._parts))
+        counts, arrival_sums, square_sums, burst_sums = values
+        means = arrival_sums / counts
+        half_width = np.sqrt(3 * np.maximum(square_sums / counts - means * means, 0))
+        pieces = np.minimum(counts, self.spread).astype(np.int64)
+        index = np.repeat(np.arange(len(counts)), pieces)
+        position = np.arange(len(index)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        piece_counts = counts[index] // pieces[index] + (position < counts[index] % pieces[index])
+        phase = (np.arange(len(counts)) * 0.6180339887498949) % 1  # golden ratio 수열
+        offsets = np.where(pieces[index] > 1, (position + phase[index]) / pieces[index] * 2 - 1, 0)
+        piece_arrivals = means[index] + half_width[index] * offsets
+        order = np.argsort(piece_arrivals, kind="stable")
+        index = index[order]
+        return list(zip(piece_arrivals[order].tolist(), (burst_sums / counts)[index].tolist(),
+                        piece_counts[order].astype(np.int64).tolist(), keys[1][index].tolist(),
+                        keys[2][index].tolist(), keys[3][index].tolist()))
+
+    def solve(self) -> FluidResult:
+        started = time.perf_counter()
+        cohorts = self._cohorts()
+        group_keys = sorted({self._group_of(*cohort[3:]) for cohort in cohorts})
+        group_index = {key: i for i, key in enumerate(group_keys)}
+        groups = [_Group(ps) for _, ps in group_keys]
+
+        n = len(cohorts)
+        departure_sum = [0.0] * n  # cohort 작업들의 완료 시간 합
+        last_departure = [0.0] * n
+        active = []  # 작업이 남은 그룹 index heap (값이 작을수록 우선, 비었는지는 꺼낼 때 확인)
+        now = 0.0
+        next_cohort = 0
+        events = 0
+
+        def inject(i: int):
+            _, burst, count = cohorts[i][:3]
+            g = group_index[self._group_of(*cohorts[i][3:])]
+            group = groups[g]
+            if group.jobs == 0:
+                heapq.heappush(active, g)
+            group.jobs += count
+            if group.ps:
+                heapq.heappush(group.heap, (group.virtual + burst, i))
+            else:
+                if not group.fifo:
+                    group.head_left = count
+                    group.head_remaining = burst
+                group.fifo.append(i)
+
+        while next_cohort < n or active:
+            events += 1
+            while active and groups[active[0]].jobs == 0:
+                heapq.heappop(active)
+            if not active and next_cohort == n:
+                break
+            next_arrival = cohorts[next_cohort][0] if next_cohort < n else math.inf
+            if not active:
+                now = next_arrival
+                inject(next_cohort)
+                next_cohort += 1
+                continue
+            group = groups[active[0]]
+            if group.ps:
+                finish, i = group.heap[0]
+                done_at = now + (finish - group.virtual) * group.jobs
+                if done_at <= next_arrival:
+                    heapq.heappop(group.heap)
+                    group.virtual = finish
+                    now = done_at
+                    count = cohorts[i][2]
+                    group.jobs -= count
+                    departure_sum[i] = count * now
+                    last_departure[i] = now
+                    continue
+                group.virtual += (next_arrival - now) / group.jobs
+            else:
+                i = group.fifo[0]
+                burst = cohorts[i][1]
+                left, remaining = group.head_left, group.head_remaining
+                done_at = now + remaining + (left - 1) * burst
+                if done_at <= next_arrival:
+                    # 남은 작업이 now + remaining부터 burst 간격으로 차례로 완료
+                    departure_sum[i] += left * (now + remaining) + burst * left * (left - 1) / 2
+                    last_departure[i] = done_at
+                    group.jobs -= left
+                    now = done_at
+                    group.fifo.popleft()
+                    if group.fifo:
+                        group.head_left = cohorts[group.fifo[0]][2]
+                        group.head_remaining = cohorts[group.fifo[0]][1]
+                    continue
+                served = next_arrival - now
+                if served >= remaining:
+                    finished = min(left - 1, 1 + int((served - remaining) // burst))
+                    departure_sum[i] += finished * (now + remaining) + burst * finished * (finished - 1) / 2
+                    group.jobs -= finished
+                    group.head_left = left - finished
+                    group.head_remaining = remaining + finished * burst - served
+                else:
+                    group.head_remaining = remaining - served
+            now = next_arrival
+            inject(next_cohort)
+            next_cohort += 1
+
+        return self._result(cohorts, departure_sum, last_departure, events, time.perf_counter() - started)
+
+    def _result(self, cohorts, departure_sum, last_departure, events: int, wall_seconds: float) -> FluidResult:
+        total = sum(c[2] for c in cohorts)
+        work = sum(c[1] * c[2] for c in cohorts)
+        turnaround = 0.0
+        max_wait = 0.0
+        makespan = max(last_departure, default=0.0)
+        per_class: Dict[str, List[float]] = {}
+        for (arrival, burst, count, level, priority, _), departures, last in zip(cohorts, departure_sum, last_departure):
+            cohort_turnaround = departures - count * arrival
+            turnaround += cohort_turnaround
+            max_wait = max(max_wait, last - arrival - burst)
+            stats = per_class.setdefault(f"{QUEUE_LEVELS[level].value}/{priority}", [0, 0.0, 0.0])
+            stats[0] += count
+            stats[1] += cohort_turnaround
+            stats[2] += burst * count
+        metrics = {
+            "avg_waiting_time": (turnaround - work) / total if total else 0,
+            "avg_turnaround_time": turnaround / total if total else 0,
+            "cpu_utilization": work / makespan * 100 if makespan > 0 else 0,
+            "max_waiting_time": max_wait,
+            "makespan": makespan,
+        }
+        class_metrics = {
+            name: {"processes": count, "avg_turnaround_time": tat / count,
+                   "avg_waiting_time": (tat - burst) / count}
+            for name, (count, tat, burst) in sorted(per_class.items())
+        }
+        return FluidResult(metrics=metrics, errors={}, class_metrics=class_metrics,
+                           cohorts=len(cohorts), events=events, wall_seconds=wall_seconds)
+
+def _concat(parts: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    return np.concatenate([keys for keys, _ in parts], axis=1), np.concatenate([values for _, values in parts], axis=1)
+
+def _reduce(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """같은 key 열을 가진 항목의 값 열 합 (lexsort 후 구간별 reduceat)"""
+    order = np.lexsort(keys[::-1])
+    keys = keys[:, order]
+    values = values[:, order]
+    starts = np.flatnonzero(np.concatenate([[True], (keys[:, 1:] != keys[:, :-1]).any(axis=0)]))
+    return keys[:, starts], np.add.reduceat(values, starts, axis=1)
+
+def _exact_params(policy: str, time_quantum: Optional[int], queue_algorithms: Optional[Dict[str, str]]) -> Dict:
+    if policy == "RR":
+        return {"time_quantum": time_quantum or DEFAULT_TIME_QUANTUM}
+    if policy == "MLQ":
+        return {"time_quantum": time_quantum or DEFAULT_TIME_QUANTUM,
+                "queue_algorithms": dict(queue_algorithms or DEFAULT_MLQ_ALGORITHMS)}
+    return {}
+
+def validate_fluid(arrivals: np.ndarray, bursts: np.ndarray, priorities: np.ndarray, queue_levels: np.ndarray,
+                   policy: str = "RR", window: int = 10, time_quantum: Optional[int] = None,
+                   queue_algorithms: Optional[Dict[str, str]] = None, samples: int = 8,
+                   sample_size: int = 200, seed: Optional[int] = None) -> FluidValidation:
+    """
+    trace에서 도착 순으로 연속된 sample_size개 구간을 samples개 골라 fluid 근사와 tick 엔진(Non-IPC) 결과 비교
+    - 구간은 도착 시간을 0부터 다시 시작하고 빈 시스템에서 출발하므로 전체 trace보다 backlog가 작을 수 있음
+    """
+    started = time.perf_counter()
+    _check_policy(policy)
+    arrivals = np.asarray(arrivals)
+    order = np.argsort(arrivals, kind="stable")
+    n = len(order)
+    size = min(sample_size, n)
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, n - size + 1, size=samples).tolist() if n else []
+    factory = scheduler_factory(resolve_name(policy), False, **_exact_params(policy, time_quantum, queue_algorithms))
+
+    relative_errors: Dict[str, List[float]] = {metric: [] for metric in FLUID_METRICS}
+    for start in starts:
+        segment = order[start:start + size]
+        segment_arrivals = arrivals[segment] - arrivals[segment].min()
+        model = FluidModel(policy, window, queue_algorithms)
+        model.add(segment_arrivals, bursts[segment], priorities[segment], queue_levels[segment])
+        approx = model.solve().metrics
+
+        processes = [
+            Process(pid, arrival, burst, priority, QUEUE_LEVELS[level], [])
+            for pid, (arrival, burst, priority, level) in enumerate(zip(
+                segment_arrivals.tolist(), bursts[segment].tolist(),
+                priorities[segment].tolist(), queue_levels[segment].tolist()), start=1)
+        ]
+        scheduler = factory()
+        scheduler.set_history_sink(NullHistorySink())
+        scheduler.schedule(processes)
+        exact = scheduler.calculate_metrics()
+        for metric in FLUID_METRICS:
+            if exact[metric]:
+                relative_errors[metric].append((approx[metric] - exact[metric]) / exact[metric])
+    return FluidValidation(samples=len(starts), sample_size=size, relative_errors=relative_errors,
+                           wall_seconds=time.perf_counter() - started)
+
+def synthetic_trace(num_processes: int, utilization: float = 0.9, burst_range: Tuple[int, int] = (1, 10),
+                    max_priority: int = 5, seed: Optional[int] = None) -> Tuple[np.ndarray, ...]:
+    """평균 CPU 사용률이 utilization이 되도록 도착 시간을 균등 분포로 뽑은 대용량 trace (도착 순 정렬)"""
+    if not 0 < utilization:
+        raise ValueError("utilization must be positive")
+    rng = np.random.default_rng(seed)
+    mean_burst = (burst_range[0] + burst_range[1]) / 2
+    horizon = max(1, int(num_processes * mean_burst / utilization))
+    arrivals = np.sort(rng.integers(0, horizon, num_processes))
+    bursts = rng.integers(burst_range[0], burst_range[1] + 1, num_processes)
+    priorities = rng.integers(1, max_priority + 1, num_processes)
+    queue_levels = rng.integers(0, len(QUEUE_LEVELS), num_processes)
+    return arrivals, bursts, priorities, queue_levels
+
+def workload_arrays(processes: List[Process]) -> Tuple[np.ndarray, ...]:
+    """프로세스 목록을 fluid 입력 배열로 변환 (의존성은 사용하지 않음)"""
+    return (np.array([p.arrival_time for p in processes], dtype=np.int64),
+            np.array([p.burst_time for p in processes], dtype=np.int64),
+            np.array([p.priority for p in processes], dtype=np.int64),
+            np.array([QUEUE_LEVELS.index(p.queue_level) for p in processes], dtype=np.int64))
+
+def simulate_fluid(arrivals: np.ndarray, bursts: np.ndarray, priorities: np.ndarray, queue_levels: np.ndarray,
+                   policy: str = "RR", window: int = 10, time_quantum: Optional[int] = None,
+                   queue_algorithms: Optional[Dict[str, str]] = None, validate: bool = True,
+                   samples: int = 8, sample_size: int = 200, seed: Optional[int] = None) -> FluidResult:
+    """
+    trace 전체를 fluid 근사로 계산하고, validate이면 부분 trace 검증의 상대 오차로 지표별 오차 추정
+    (오차 = |지표| x 표본 상대 오차 절댓값의 90% quantile)
+    """
+    model = FluidModel(policy, window, queue_algorithms)
+    model.add(arrivals, bursts, priorities, queue_levels)
+    result = model.solve()
+    if validate:
+        result.validation = validate_fluid(arrivals, bursts, priorities, queue_levels, policy, window,
+                                           time_quantum, queue_algorithms, samples, sample_size, seed)
+        result.errors = {metric: abs(result.metrics[metric]) * result.validation.error_bound(metric)
+                         for metric in FLUID_METRICS}
+    return result
@@ -1,6 +1,7 @@
 import random
 import json
 import os
+import hashlib
 from enum import Enum
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Tuple
@@ -100,6 +101,11 @@ class Process:
             dependencies=data["dependencies"]
         )
 
+def workload_fingerprint(processes: List[Process]) -> str:
+    """워크로드 내용(순서 포함)의 SHA-256 해시 (실행 상태는 제외)"""
+    data = json.dumps([p.to_dict() for p in processes], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
 def save_processes(processes: List[Process], time_quantum: int = 4, 
                   mlq_algorithms: Dict[str, str] = None, 
                   filename: str = "process_config.json"):
@@ -135,29 +141,23 @@ def load_processes(filename: str = "process_config.json") -> Tuple[Optional[List
     except FileNotFoundError:
         return None, None
 
-def create_processes(num_processes: int = 10, max_dependencies: int = 3) -> Tuple[List[Process], Dict]:
-    """프로세스 생성 또는 불러오기"""
-    config_file = "process_config.json"
-    loaded_data = load_processes(config_file)
-    
-    if loaded_data[0] is not None:
-        print(f"Configuration loaded from {config_file}")
-        return loaded_data
-    
-    # 설정 파일이 없으면 새로 생성
-    print(f"No configuration file found. Creating new processes...")
+def generate_processes(num_processes: int = 10, max_dependencies: int = 3,
+                       seed: Optional[int] = None, max_arrival: int = 20,
+                       burst_range: Tuple[int, int] = (10, 20)) -> List[Process]:
+    """랜덤 프로세스 목록 생성 (seed를 지정하면 같은 워크로드를 재현)"""
+    rng = random.Random(seed) if seed is not None else random
     processes = []
     priorities = list(range(1, num_processes + 1))
-    random.shuffle(priorities)
+    rng.shuffle(priorities)
 
     # 프로세스 생성
     for i in range(num_processes):
         process = Process(
             process_id=i+1,
-            arrival_time=random.randint(0, 20),
-            burst_time=random.randint(10, 20),
+            arrival_time=rng.randint(0, max_arrival),
+            burst_time=rng.randint(*burst_range),
             priority=priorities[i],
-            queue_level=random.choice(list(QueueLevel)),
+            queue_level=rng.choice(list(QueueLevel)),
             dependencies=[]
         )
         processes.append(process)
@@ -165,11 +165,26 @@ def create_processes(num_processes: int = 10, max_dependencies: int = 3) -> Tupl
     # 의존성 설정
     if max_dependencies > 0:
         num_dependent = min(max_dependencies + 1, num_processes)
-        dependent_processes = random.sample(processes, num_dependent)
+        dependent_processes = rng.sample(processes, num_dependent)
         
         for i in range(1, len(dependent_processes)):
             dependent_processes[i].dependencies.append(dependent_processes[i-1].process_id)
     
+    return processes
+
+def create_processes(num_processes: int = 10, max_dependencies: int = 3) -> Tuple[List[Process], Dict]:
+    """프로세스 생성 또는 불러오기"""
+    config_file = "process_config.json"
+    loaded_data = load_processes(config_file)
+    
+    if loaded_data[0] is not None:
+        print(f"Configuration loaded from {config_file}")
+        return loaded_data
+    
+    # 설정 파일이 없으면 새로 생성
+    print(f"No configuration file found. Creating new processes...")
+    processes = generate_processes(num_processes, max_dependencies)
+    
     # 생성된 설정 저장
     scheduler_settings = {
         "time_quantum": 4,
@@ -0,0 +1,435 @@
+import os
+import select
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from src.process import Process, ProcessState
+from src.schedulers.base import Scheduler
+
+Commands = Union[Dict[int, Sequence[str]], Callable[[Process], Sequence[str]]]
+
+# burst_time x tick_seconds 만큼 CPU를 사용하는 자식 프로세스 (시뮬레이션과 비교 / 보정용 기본 워크로드)
+_BURN_SCRIPT = (
+    "import sys, time\n"
+    "end = time.process_time() + float(sys.argv[1])\n"
+    "while time.process_time() < end:\n"
+    "    pass\n"
+)
+
+def cpu_burn_command(tick_seconds: float) -> Callable[[Process], List[str]]:
+    """프로세스마다 burst_time tick 분량의 CPU 시간을 소비하는 명령 생성 함수"""
+    def command(process: Process) -> List[str]:
+        return [sys.executable, "-c", _BURN_SCRIPT, str(process.burst_time * tick_seconds)]
+    return command
+
+class SignalGate:
+    """SIGSTOP / SIGCONT로 자식 프로세스 그룹 전체를 멈추고 재개"""
+    name = "signal"
+
+    def attach(self, pid: int):
+        pass
+
+    def pause(self, pid: int):
+        try:
+            os.killpg(pid, signal.SIGSTOP)
+        except ProcessLookupError:
+            pass
+
+    def resume(self, pid: int):
+        try:
+            os.killpg(pid, signal.SIGCONT)
+        except ProcessLookupError:
+            pass
+
+    def detach(self, pid: int):
+        pass
+
+    def close(self):
+        pass
+
+class CgroupFreezerGate:
+    """
+    프로세스마다 cgroup을 만들어 freezer로 멈추고 재개 (권한이 필요, 자식이 만든 프로세스까지 함께 정지)
+    - cgroup v2: cgroup.freeze (0 / 1)
+    - cgroup v1: freezer 계층의 freezer.state (THAWED / FROZEN)
+    """
+    name = "cgroup"
+
+    def __init__(self, root: Optional[str] = None):
+        root = root or self.find_root()
+        if root is None:
+            raise OSError("No writable cgroup freezer hierarchy found")
+        if os.path.exists(os.path.join(root, "cgroup.freeze")) or \
+                os.path.exists(os.path.join(root, "cgroup.controllers")):
+            self._state_file, self._frozen, self._thawed = "cgroup.freeze", "1", "0"
+        else:
+            self._state_file, self._frozen, self._thawed = "freezer.state", "FROZEN", "THAWED"
+        self.group = os.path.join(root, f"scheduler-{os.getpid()}")
+        os.makedirs(self.group, exist_ok=True)
+        self._paths: Dict[int, str] = {}
+
+    @staticmethod
+    def find_root() -> Optional[str]:
+        """사용 가능한 cgroup 계층 (v2 통합 계층 우선)"""
+        for root in ("/sys/fs/cgroup", "/sys/fs/cgroup/unified", "/sys/fs/cgroup/freezer"):
+            v2 = os.path.exists(os.path.join(root, "cgroup.controllers"))
+            v1 = os.path.exists(os.path.join(root, "freezer.state")) or root.endswith("/freezer")
+            if (v2 or v1) and os.access(root, os.W_OK):
+                return root
+        return None
+
+    def _write(self, path: str, name: str, value: str):
+        with open(os.path.join(path, name), "w") as f:
+            f.write(value)
+
+    def attach(self, pid: int):
+        # 멈춘 상태로 cgroup에 넣고 freeze한 뒤 SIGSTOP을 풀어 이후 정지 / 재개는 freezer가 담당
+        path = os.path.join(self.group, str(pid))
+        os.makedirs(path, exist_ok=True)
+        self._write(path, "cgroup.procs", str(pid))
+        self._write(path, self._state_file, self._frozen)
+        self._paths[pid] = path
+        os.kill(pid, signal.SIGCONT)
+
+    def pause(self, pid: int):
+        self._write(self._paths[pid], self._state_file, self._frozen)
+
+    def resume(self, pid: int):
+        self._write(self._paths[pid], self._state_file, self._thawed)
+
+    def detach(self, pid: int):
+        path = self._paths.pop(pid, None)
+        if path is not None:
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+    def close(self):
+        for pid in list(self._paths):
+            self.detach(pid)
+        try:
+            os.rmdir(self.group)
+        except OSError:
+            pass
+
+def make_gate(kind: str = "auto"):
+    """auto: cgroup freezer를 쓸 수 있으면 사용하고 아니면 signal"""
+    if kind == "signal":
+        return SignalGate()
+    if kind == "cgroup":
+        return CgroupFreezerGate()
+    if kind != "auto":
+        raise ValueError(f"Unknown gate: {kind}")
+    try:
+        return CgroupFreezerGate()
+    except OSError:
+        return SignalGate()
+
+@dataclass
+class ProcessMeasurement:
+    """실제 자식 프로세스 한 개의 측정값 (시간은 실행 시작 기준 초)"""
+    process_id: int
+    command: List[str]
+    os_pid: int = 0
+    launch_time: float = 0.0
+    first_dispatch: Optional[float] = None
+    exit_time: Optional[float] = None
+    user_cpu: float = 0.0
+    system_cpu: float = 0.0
+    max_rss_kb: int = 0
+    returncode: Optional[int] = None
+    ticks: int = 0
+
+    @property
+    def cpu_time(self) -> float:
+        return self.user_cpu + self.system_cpu
+
+    @property
+    def wall_time(self) -> float:
+        return (self.exit_time or self.launch_time) - self.launch_time
+
+    @property
+    def response_time(self) -> float:
+        return (self.first_dispatch if self.first_dispatch is not None else self.launch_time) - self.launch_time
+
+    @property
+    def wait_time(self) -> float:
+        return max(0.0, self.wall_time - self.cpu_time)
+
+@dataclass
+class RealRunResult:
+    """실제 실행 결과 (tick 단위 실행 기록 / 지표와 wall / CPU 측정값)"""
+    execution_history: List
+    metrics: Dict[str, float]
+    measurements: Dict[int, ProcessMeasurement]
+    wall_seconds: float
+    tick_seconds: float
+    gate: str
+    timer_drift_mean: float = 0.0
+    timer_drift_max: float = 0.0
+    gate_seconds: float = 0.0
+    failed: List[int] = field(default_factory=list)
+
+    def measured_metrics(self) -> Dict[str, float]:
+        """wall / CPU 시간 기준 지표 (초)"""
+        items = list(self.measurements.values())
+        n = len(items) or 1
+        total_cpu = sum(m.cpu_time for m in items)
+        return {
+            "avg_wall_turnaround": sum(m.wall_time for m in items) / n,
+            "avg_wall_waiting": sum(m.wait_time for m in items) / n,
+            "avg_response": sum(m.response_time for m in items) / n,
+            "total_cpu_seconds": total_cpu,
+            "cpu_utilization": total_cpu / self.wall_seconds * 100 if self.wall_seconds > 0 else 0,
+            "wall_seconds": self.wall_seconds,
+        }
+
+class RealProcessBackend:
+    """
+    스케줄러의 get_next_process 결정을 실제 Linux 자식 프로세스에 적용
+    - 도착 tick에 명령을 멈춘 상태로 실행하고, 선택된 프로세스만 gate로 재개 (전환 시에만 signal / freezer 조작)
+    - tick은 tick_seconds 간격의 절대 deadline으로 진행, 대기는 pidfd poll로 하여 실행 중인 프로세스가
+      끝나면 남은 tick을 기다리지 않고 바로 다음 결정
+    - 종료는 os.wait4로 회수하여 user / system CPU 시간과 최대 RSS 기록
+    - burst_time은 추정치로만 사용 (추정보다 오래 실행되면 remaining_time을 1로 유지, 실제 종료가 완료 기준)
+    """
+    def __init__(self, scheduler: Scheduler, commands: Optional[Commands] = None,
+                 tick_seconds: float = 0.01, gate: str = "auto", timeout: Optional[float] = None):
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("RealProcessBackend requires Linux")
+        self.scheduler = scheduler
+        self.commands = commands if commands is not None else cpu_burn_command(tick_seconds)
+        self.tick_seconds = tick_seconds
+        self.gate_kind = gate
+        self.timeout = timeout
+
+    def _command(self, process: Process) -> List[str]:
+        if callable(self.commands):
+            return list(self.commands(process))
+        return list(self.commands[process.process_id])
+
+    def _launch(self, process: Process, started: float) -> ProcessMeasurement:
+        """새 session에서 자식을 만들고 exec 직전에 스스로 멈추게 하여 멈춘 상태로 대기"""
+        command = self._command(process)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.setsid()
+                os.kill(os.getpid(), signal.SIGSTOP)
+                os.execvp(command[0], command)
+            finally:
+                os._exit(127)
+        os.waitpid(pid, os.WUNTRACED)
+        self._gate.attach(pid)
+        measurement = ProcessMeasurement(process.process_id, command, os_pid=pid,
+                                         launch_time=time.perf_counter() - started)
+        if self._poller is not None:
+            fd = os.pidfd_open(pid)
+            self._poller.register(fd, select.POLLIN)
+            self._fds[fd] = pid
+            self._fd_of[pid] = fd
+        return measurement
+
+    def _wait_until(self, deadline: float, live: Dict[int, Process]) -> List[int]:
+        """deadline까지 대기하며 종료된 자식의 os pid 반환 (실행 중인 프로세스가 끝나면 바로 반환)"""
+        timeout = max(0.0, deadline - time.perf_counter())
+        if self._poller is not None:
+            events = self._poller.poll(timeout * 1000)
+            return [self._fds[fd] for fd, _ in events]
+        time.sleep(timeout)
+        return [pid for pid in live if os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)]
+
+    def _reap(self, pid: int, measurement: ProcessMeasurement, started: float) -> bool:
+        reaped, status, rusage = os.wait4(pid, os.WNOHANG)
+        if reaped == 0:
+            return False
+        measurement.exit_time = time.perf_counter() - started
+        measurement.user_cpu = rusage.ru_utime
+        measurement.system_cpu = rusage.ru_stime
+        measurement.max_rss_kb = rusage.ru_maxrss
+        measurement.returncode = os.waitstatus_to_exitcode(status)
+        fd = self._fd_of.pop(pid, None)
+        if fd is not None:
+            self._poller.unregister(fd)
+            del self._fds[fd]
+            os.close(fd)
+        self._gate.detach(pid)
+        return True
+
+    def _kill_all(self, live: Dict[int, Process]):
+        for pid in list(live):
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            try:
+                self._gate.resume(pid)
+            except OSError:
+                pass
+            os.waitpid(pid, 0)
+            fd = self._fd_of.pop(pid, None)
+            if fd is not None:
+                os.close(fd)
+            self._gate.detach(pid)
+        live.clear()
+
+    def run(self, processes: List[Process]) -> RealRunResult:
+        scheduler = self.scheduler
+        scheduler.reset_run(processes)
+        self._gate = make_gate(self.gate_kind)
+        self._poller = select.poll() if hasattr(os, "pidfd_open") else None
+        self._fds: Dict[int, int] = {}
+        self._fd_of: Dict[int, int] = {}
+
+        pending = sorted(processes, key=lambda p: p.arrival_time)
+        cursor = 0
+        measurements: Dict[int, ProcessMeasurement] = {}
+        live: Dict[int, Process] = {}  # os pid -> Process
+        running: Optional[Process] = None
+        drift_total, drift_max, gate_seconds = 0.0, 0.0, 0.0
+        ticks = 0
+
+        started = time.perf_counter()
+        deadline = started
+        try:
+            while len(scheduler.completed_processes) < len(processes):
+                if self.timeout is not None and time.perf_counter() - started > self.timeout:
+                    raise TimeoutError(f"Real execution exceeded {self.timeout} seconds")
+
+                # 도착 tick이 된 프로세스를 멈춘 상태로 실행하고 ready queue에 추가
+                while cursor < len(pending) and pending[cursor].arrival_time <= scheduler.current_time:
+                    process = pending[cursor]
+                    cursor += 1
+                    measurement = self._launch(process, started)
+                    measurements[process.process_id] = measurement
+                    live[measurement.os_pid] = process
+                    process.state = ProcessState.READY
+                    scheduler.ready_queue.append(process)
+
+                current = scheduler.get_next_process(scheduler.ready_queue)
+
+                # 선택이 바뀐 경우에만 이전 프로세스를 멈추고 새 프로세스를 재개
+                if current is not running:
+                    t0 = time.perf_counter()
+                    if running is not None and running.state != ProcessState.TERMINATED:
+                        self._gate.pause(measurements[running.process_id].os_pid)
+                    if current is not None:
+                        measurement = measurements[current.process_id]
+                        self._gate.resume(measurement.os_pid)
+                        if measurement.first_dispatch is None:
+                            measurement.first_dispatch = time.perf_counter() - started
+                    gate_seconds += time.perf_counter() - t0
+                    running = current
+
+                if current is not None:
+                    if scheduler.last_process_id is not None and scheduler.last_process_id != current.process_id:
+                        scheduler.context_switches += 1
+                    scheduler.last_process_id = current.process_id
+                    scheduler.last_process = current
+                    current.state = ProcessState.RUNNING
+
+                deadline += self.tick_seconds
+                exited = self._wait_until(deadline, live)
+                now = time.perf_counter()
+                if now >= deadline:
+                    drift = now - deadline
+                    drift_total += drift
+                    drift_max = max(drift_max, drift)
+                    ticks += 1
+                    # 크게 밀린 경우 밀린 tick을 몰아서 실행하지 않도록 기준 시각 재설정
+                    if drift > self.tick_seconds:
+                        deadline = now
+                else:
+                    # tick 중간에 프로세스가 끝나면 남은 시간을 기다리지 않고 다음 tick 시작
+                    deadline = now
+
+                if current is not None:
+                    scheduler.add_to_history(current, scheduler.current_time, scheduler.current_time + 1,
+                                             ProcessState.RUNNING)
+                    measurements[current.process_id].ticks += 1
+                    current.remaining_time = max(1, current.remaining_time - 1)
+
+                for pid in exited:
+                    process = live.get(pid)
+                    if process is None or not self._reap(pid, measurements[process.process_id], started):
+                        continue
+                    del live[pid]
+                    process.remaining_time = 0
+                    process.state = ProcessState.TERMINATED
+                    scheduler.completed_processes.append(process.process_id)
+                    if process in scheduler.ready_queue:
+                        scheduler.ready_queue.remove(process)
+                    scheduler.update_process_metrics(process)
+                    if process is running:
+                        running = None
+
+                scheduler.current_time += 1
+        finally:
+            self._kill_all(live)
+            self._gate.close()
+
+        scheduler.execution_history.close()
+        wall_seconds = time.perf_counter() - started
+        failed = [pid for pid, m in measurements.items() if m.returncode not in (0, None)]
+        return RealRunResult(
+            execution_history=scheduler.execution_history,
+            metrics=scheduler.calculate_metrics(),
+            measurements=measurements,
+            wall_seconds=wall_seconds,
+            tick_seconds=self.tick_seconds,
+            gate=self._gate.name,
+            timer_drift_mean=drift_total / ticks if ticks else 0.0,
+            timer_drift_max=drift_max,
+            gate_seconds=gate_seconds,
+            failed=failed,
+        )
+
+def calibrated_processes(processes: List[Process], result: RealRunResult) -> List[Process]:
+    """측정된 CPU 시간을 tick 단위 burst로 바꾼 워크로드 (시뮬레이터 보정용)"""
+    calibrated = []
+    for process in processes:
+        copy = process.copy()
+        measurement = result.measurements.get(process.process_id)
+        if measurement is not None:
+            copy.burst_time = max(1, round(measurement.cpu_time / result.tick_seconds))
+            copy.remaining_time = copy.burst_time
+        calibrated.append(copy)
+    return calibrated
+
+def compare_with_simulation(scheduler_factory: Callable[[], Scheduler], processes: List[Process],
+                            result: RealRunResult) -> Dict[str, Dict[str, float]]:
+    """
+    같은 정책의 시뮬레이션 지표와 실제 실행 지표 비교 (모두 tick 단위)
+    - simulated: 원래 burst 추정치로 시뮬레이션
+    - calibrated: 측정된 CPU 시간으로 보정한 burst로 시뮬레이션
+    - measured: 실제 실행의 tick 단위 지표
+    """
+    comparison = {}
+    for name, workload in (("simulated", [p.copy() for p in processes]),
+                           ("calibrated", calibrated_processes(processes, result))):
+        scheduler = scheduler_factory()
+        scheduler.schedule(workload)
+        comparison[name] = scheduler.calculate_metrics()
+    comparison["measured"] = result.metrics
+    return comparison
+
+def format_comparison(comparison: Dict[str, Dict[str, float]], result: RealRunResult) -> str:
+    names = ["avg_waiting_time", "avg_turnaround_time", "p99_waiting_time",
+             "cpu_utilization", "context_switches"]
+    lines = [f"{'metric':<22}" + "".join(f"{column:>12}" for column in comparison)]
+    for name in names:
+        lines.append(f"{name:<22}" + "".join(f"{metrics.get(name, 0):>12.2f}"
+                                                for metrics in comparison.values()))
+    lines.append("")
+    lines.append(f"gate: {result.gate}, tick: {result.tick_seconds * 1000:.1f} ms, "
+                 f"timer drift mean / max: {result.timer_drift_mean * 1000:.3f} / "
+                 f"{result.timer_drift_max * 1000:.3f} ms, gate time: {result.gate_seconds * 1000:.1f} ms")
+    for name, value in result.measured_metrics().items():
+        lines.append(f"{name:<22}{value:>12.4f}")
+    if result.failed:
+        lines.append(f"non-zero exit: {', '.join(map(str, result.failed))}")
+    return "\n".join(lines)
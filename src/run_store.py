@@ -0,0 +1,219 @@
+import json
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.process import Process, workload_fingerprint
+from src.schedulers.base import ENGINE_VERSION, Scheduler
+
+DEFAULT_STORE_PATH = "runs.sqlite"
+
+# 요약 지표 열 (calculate_metrics의 key)
+SUMMARY_METRICS = ("avg_waiting_time", "avg_turnaround_time", "cpu_utilization",
+                   "context_switches", "p99_waiting_time")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workloads (
+    fingerprint TEXT PRIMARY KEY,
+    workload_class TEXT,
+    num_processes INTEGER NOT NULL,
+    total_burst INTEGER NOT NULL,
+    max_arrival INTEGER NOT NULL,
+    num_dependencies INTEGER NOT NULL,
+    processes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    sweep TEXT,
+    workload_fingerprint TEXT NOT NULL REFERENCES workloads(fingerprint),
+    workload_class TEXT,
+    scheduler TEXT NOT NULL,
+    params TEXT NOT NULL,
+    time_quantum INTEGER,
+    use_ipc INTEGER NOT NULL,
+    engine_version INTEGER NOT NULL,
+    avg_waiting_time REAL,
+    avg_turnaround_time REAL,
+    cpu_utilization REAL,
+    context_switches INTEGER,
+    p99_waiting_time REAL,
+    metrics TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS histories (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+    process_ids BLOB NOT NULL,
+    start_times BLOB NOT NULL,
+    end_times BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_class_scheduler_quantum
+    ON runs(workload_class, scheduler, use_ipc, time_quantum);
+CREATE INDEX IF NOT EXISTS idx_runs_scheduler_version
+    ON runs(scheduler, engine_version);
+CREATE INDEX IF NOT EXISTS idx_runs_workload ON runs(workload_fingerprint);
+CREATE INDEX IF NOT EXISTS idx_runs_sweep ON runs(sweep);
+"""
+
+_RUN_COLUMNS = ("created_at", "sweep", "workload_fingerprint", "workload_class", "scheduler",
+                "params", "time_quantum", "use_ipc", "engine_version") + SUMMARY_METRICS + ("metrics",)
+
+class RunStore:
+    """
+    스케줄링 실행 결과를 로컬 SQLite DB에 저장하고 실험 간 분석 query 제공
+    - WAL 모드로 열어 읽기와 쓰기가 서로 막지 않음
+    - record()는 buffer에 모았다가 batch_size마다 하나의 transaction으로 삽입
+    """
+    def __init__(self, path: str = DEFAULT_STORE_PATH, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        # transaction은 flush()에서 직접 관리
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(_SCHEMA)
+        self._workloads: Dict[str, tuple] = {}
+        self._runs: List[tuple] = []
+        self._histories: List[Optional[tuple]] = []
+
+    def __enter__(self) -> 'RunStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def record(self, scheduler: Scheduler, processes: List[Process], metrics: Dict,
+               history=None, workload_class: Optional[str] = None, sweep: Optional[str] = None):
+        """
+        실행 결과 한 건을 buffer에 추가
+        - history를 주면 병합된 실행 구간도 저장
+        - workload_class: 워크로드 묶음 이름 (기본: 프로세스 수 기준 "n=10" 형식)
+        """
+        fingerprint = workload_fingerprint(processes)
+        if workload_class is None:
+            workload_class = f"n={len(processes)}"
+        if fingerprint not in self._workloads:
+            self._workloads[fingerprint] = (
+                fingerprint,
+                workload_class,
+                len(processes),
+                sum(p.burst_time for p in processes),
+                max((p.arrival_time for p in processes), default=0),
+                sum(len(p.dependencies) for p in processes),
+                json.dumps([p.to_dict() for p in processes]),
+            )
+
+        params = scheduler.get_params()
+        self._runs.append((
+            datetime.now().isoformat(timespec="seconds"),
+            sweep,
+            fingerprint,
+            workload_class,
+            type(scheduler).__name__,
+            json.dumps(params, sort_keys=True),
+            params.get("time_quantum"),
+            int(scheduler.use_ipc),
+            ENGINE_VERSION,
+            *(metrics.get(name) for name in SUMMARY_METRICS),
+            json.dumps(metrics, sort_keys=True),
+        ))
+        self._histories.append(self._encode_history(history) if history is not None else None)
+        if len(self._runs) >= self.batch_size:
+            self.flush()
+
+    @staticmethod
+    def _encode_history(history) -> tuple:
+        from src.visualizer.segments import Segments
+        segments = Segments.from_history(history)
+        return tuple(np.ascontiguousarray(values, dtype=np.int64).tobytes()
+                     for values in (segments.process_ids, segments.start_times, segments.end_times))
+
+    def flush(self):
+        """buffer의 실행 결과를 하나의 transaction으로 삽입"""
+        if not self._runs:
+            return
+        placeholders = ", ".join("?" for _ in _RUN_COLUMNS)
+        connection = self.connection
+        # 쓰기 lock을 먼저 잡아 run id가 MAX(id) + 1부터 연속으로 할당되도록 함
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            first_id = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM runs").fetchone()[0]
+            connection.executemany("INSERT OR IGNORE INTO workloads VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                   self._workloads.values())
+            connection.executemany(
+                f"INSERT INTO runs (id, {', '.join(_RUN_COLUMNS)}) VALUES (?, {placeholders})",
+                ((first_id + i, *row) for i, row in enumerate(self._runs)))
+            connection.executemany(
+                "INSERT INTO histories VALUES (?, ?, ?, ?)",
+                ((first_id + i, *history) for i, history in enumerate(self._histories)
+                 if history is not None))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._workloads.clear()
+        self._runs.clear()
+        self._histories.clear()
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        """임의 SQL 조회 (결과를 dict 목록으로 반환)"""
+        self.flush()
+        return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def load_history(self, run_id: int):
+        """저장된 실행 구간을 Segments로 불러오기 (없으면 None)"""
+        from src.visualizer.segments import Segments
+        self.flush()
+        row = self.connection.execute(
+            "SELECT process_ids, start_times, end_times FROM histories WHERE run_id = ?",
+            (run_id,)).fetchone()
+        if row is None:
+            return None
+        return Segments(*(np.frombuffer(row[key], dtype=np.int64)
+                          for key in ("process_ids", "start_times", "end_times")))
+
+    def best_quantum(self, metric: str = "avg_waiting_time",
+                     scheduler: str = "RoundRobinScheduler",
+                     use_ipc: Optional[bool] = None) -> List[Dict]:
+        """워크로드 묶음별로 metric 평균이 가장 작은 time quantum"""
+        if metric not in SUMMARY_METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        where = "scheduler = ? AND time_quantum IS NOT NULL"
+        params = [scheduler]
+        if use_ipc is not None:
+            where += " AND use_ipc = ?"
+            params.append(int(use_ipc))
+        return self.query(f"""
+            SELECT workload_class, time_quantum, mean_value, runs FROM (
+                SELECT workload_class, time_quantum, AVG({metric}) AS mean_value, COUNT(*) AS runs,
+                       ROW_NUMBER() OVER (PARTITION BY workload_class
+                                          ORDER BY AVG({metric}), time_quantum) AS rank
+                FROM runs
+                WHERE {where}
+                GROUP BY workload_class, time_quantum
+            )
+            WHERE rank = 1
+            ORDER BY workload_class
+        """, tuple(params))
+
+    def metric_trend(self, metric: str = "p99_waiting_time",
+                     scheduler: Optional[str] = None) -> List[Dict]:
+        """엔진 버전별 (스케줄러, IPC 모드) metric 평균 / 최대값 추이"""
+        if metric not in SUMMARY_METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        where, params = ("WHERE scheduler = ?", (scheduler,)) if scheduler else ("", ())
+        return self.query(f"""
+            SELECT engine_version, scheduler, use_ipc,
+                   AVG({metric}) AS mean_value, MAX({metric}) AS max_value, COUNT(*) AS runs
+            FROM runs
+            {where}
+            GROUP BY engine_version, scheduler, use_ipc
+            ORDER BY scheduler, use_ipc, engine_version
+        """, params)
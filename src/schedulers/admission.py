@@ -0,0 +1,248 @@
+import heapq
+import itertools
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+from src.process import Process, QueueLevel
+
+ADMISSION_POLICIES = ("reject", "drop_oldest", "defer")
+DROP_REASONS = ("rejected", "evicted", "rate_limited", "deadline", "dependency")
+
+@dataclass
+class TokenBucket:
+    """레벨별 admission 속도 제한 (tick마다 rate개씩 최대 burst개까지 충전, 프로세스 하나가 token 1개 사용)"""
+    rate: float
+    burst: float = 1
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError("token bucket rate must be positive and burst at least 1")
+
+class AdmissionControl:
+    """
+    도착한 프로세스를 ready queue에 넣기 전에 적용하는 admission 정책 (Scheduler.set_admission으로 사용)
+    - capacity: ready queue 최대 길이, 가득 차면 policy에 따라
+      reject(새 프로세스 drop) / drop_oldest(실행 중이 아닌 가장 오래된 프로세스를 drop) / defer(자리가 날 때까지 대기)
+    - level_rates: QueueLevel별 token bucket, token이 없으면 defer는 대기, 나머지는 새 프로세스 drop
+    - deadline / deadlines: 도착 기준 상대 마감 시간 (전체 기본값 / process id별), 지금부터 쉬지 않고 실행해도
+      마감까지 끝낼 수 없는 프로세스는 drop (마감 시간 - 남은 실행 시간 순 heap을 필요할 때만 다시 확인)
+    - IPC 모드에서 drop된 프로세스의 후행 프로세스는 실행될 수 없으므로 함께 drop
+    - IPC 모드의 defer는 선행이 끝나지 않은 프로세스를 ready queue 밖에서 기다리게 함
+      (ready queue가 실행할 수 없는 프로세스로 가득 차서 선행을 받지 못하는 교착 방지)
+    - drop된 프로세스는 대기 / 반환 시간 지표에서 빠지고 drop / defer 수와 goodput으로 따로 집계
+    """
+    def __init__(self, capacity: Optional[int] = None, policy: str = "reject",
+                 level_rates: Optional[Dict[str, TokenBucket]] = None,
+                 deadline: Optional[int] = None, deadlines: Optional[Dict[int, int]] = None):
+        if policy not in ADMISSION_POLICIES:
+            raise ValueError(f"Unknown admission policy: {policy} (available: {', '.join(ADMISSION_POLICIES)})")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.policy = policy
+        self.level_rates = dict(level_rates or {})
+        self.deadline = deadline
+        self.deadlines = dict(deadlines or {})
+        self.reset([])
+
+    def get_params(self) -> Dict:
+        """결과에 영향을 주는 설정 (결과 캐시 key에 사용)"""
+        return {
+            "capacity": self.capacity,
+            "policy": self.policy,
+            "level_rates": {level: asdict(bucket) for level, bucket in sorted(self.level_rates.items())},
+            "deadline": self.deadline,
+            "deadlines": {str(pid): deadline for pid, deadline in sorted(self.deadlines.items())},
+        }
+
+    def reset(self, processes: List[Process], use_ipc: bool = False):
+        """실행 시작 시 admission 상태 초기화"""
+        self.processes = list(processes)
+        self.use_ipc = use_ipc
+        self.dependents: Dict[int, List[Process]] = {}
+        if use_ipc:
+            for process in processes:
+                for dependency in process.dependencies:
+                    self.dependents.setdefault(dependency, []).append(process)
+        self.deadline_of: Dict[int, int] = {}  # process id -> 절대 마감 시간
+        for process in processes:
+            relative = self.deadlines.get(process.process_id, self.deadline)
+            if relative is not None:
+                self.deadline_of[process.process_id] = process.arrival_time + relative
+        self.dropped: Dict[int, str] = {}  # process id -> drop 이유
+        self.wasted_time = 0  # drop된 프로세스가 이미 사용한 CPU 시간
+        self.admitted_at: Dict[int, int] = {}
+        self.defer_time: Dict[int, int] = {}  # 실행 가능해진 뒤 ready queue에 들어가기까지 기다린 시간 (defer된 프로세스만)
+        self.max_queue_length = 0
+        self._seq = itertools.count()
+        self._deferred: Dict[QueueLevel, List] = {level: [] for level in QueueLevel}  # 레벨별 (도착 순서, 프로세스) heap
+        self._eligible_at: Dict[int, int] = {}  # defer 대기 시작 시간
+        self._held: Dict[int, tuple] = {}  # 선행을 기다리는 process id -> (도착 순서, 프로세스)
+        self._holders: Dict[int, List[int]] = {}  # 선행 process id -> 기다리는 process id
+        self._missing: Dict[int, int] = {}
+        self._completed = set()
+        self._completed_seen = 0  # 이미 읽은 completed_processes 길이
+        self._tokens = {level: bucket.burst for level, bucket in self.level_rates.items()}
+        self._refilled = {level: 0 for level in self.level_rates}  # 마지막으로 token을 계산한 시간
+        self._expiry = []  # (마감 시간 - 남은 실행 시간, 순서, 프로세스)
+
+    def _has_token(self, process: Process, now: int) -> bool:
+        """token 수는 마지막 계산 시점부터 지난 시간으로 필요할 때만 갱신"""
+        level = process.queue_level.value
+        bucket = self.level_rates.get(level)
+        if bucket is None:
+            return True
+        self._tokens[level] = min(bucket.burst, self._tokens[level] + bucket.rate * (now - self._refilled[level]))
+        self._refilled[level] = now
+        return self._tokens[level] >= 1
+
+    def _misses_deadline(self, process: Process, now: int) -> bool:
+        deadline = self.deadline_of.get(process.process_id)
+        return deadline is not None and now + process.remaining_time > deadline
+
+    def _full(self, scheduler) -> bool:
+        return self.capacity is not None and len(scheduler.ready_queue) >= self.capacity
+
+    def step(self, scheduler, arrivals: List[Process]):
+        """현재 tick에 도착한 프로세스에 정책을 적용하여 ready queue에 추가 (마감을 놓친 프로세스 drop 포함)"""
+        now = scheduler.current_time
+        self._shed_expired(scheduler, now)
+        defer = self.policy == "defer"
+        if defer and self.use_ipc:
+            self._release(scheduler, now)
+        for process in arrivals:
+            if process.process_id in self.dropped:
+                continue  # 선행 프로세스와 함께 도착 전에 drop됨
+            if self._misses_deadline(process, now):
+                self._drop(scheduler, process, "deadline")
+            elif defer:
+                self._defer(process, next(self._seq), now)
+            else:
+                self._offer(scheduler, process, now)
+        if defer:
+            self._drain(scheduler, now)
+        self.max_queue_length = max(self.max_queue_length, len(scheduler.ready_queue))
+
+    def _defer(self, process: Process, order: int, now: int):
+        pid = process.process_id
+        missing = [d for d in process.dependencies if d not in self._completed] if self.use_ipc else []
+        if missing:
+            self._held[pid] = (order, process)
+            self._missing[pid] = len(missing)
+            for dependency in missing:
+                self._holders.setdefault(dependency, []).append(pid)
+            return
+        self._eligible_at[pid] = now
+        heapq.heappush(self._deferred[process.queue_level], (order, process))
+
+    def _release(self, scheduler, now: int):
+        """새로 완료된 선행 프로세스를 기다리던 프로세스를 defer 대기열로 이동 (completed_processes 끝만 읽음)"""
+        completed = scheduler.completed_processes
+        for pid in completed[self._completed_seen:]:
+            self._completed.add(pid)
+            for holder in self._holders.pop(pid, ()):
+                if holder not in self._held:
+                    continue  # drop된 프로세스
+                self._missing[holder] -= 1
+                if self._missing[holder] == 0:
+                    del self._missing[holder]
+                    order, process = self._held.pop(holder)
+                    self._defer(process, order, now)
+        self._completed_seen = len(completed)
+
+    def _offer(self, scheduler, process: Process, now: int):
+        if not self._has_token(process, now):
+            self._drop(scheduler, process, "rate_limited")
+            return
+        if self._full(scheduler):
+            victim = self._oldest(scheduler) if self.policy == "drop_oldest" else None
+            if victim is None:
+                self._drop(scheduler, process, "rejected")
+                return
+            self._drop(scheduler, victim, "evicted")
+        self._admit(scheduler, process, now)
+
+    def _oldest(self, scheduler) -> Optional[Process]:
+        """직전 tick에 실행한 프로세스를 제외하고 가장 먼저 admission된 프로세스"""
+        candidates = [p for p in scheduler.ready_queue if p is not scheduler.last_process]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda p: self.admitted_at[p.process_id])
+
+    def _drain(self, scheduler, now: int):
+        """defer된 프로세스를 도착 순서대로 token과 자리가 있는 만큼 admission (레벨별 FIFO)"""
+        while not self._full(scheduler):
+            best = None
+            for level, waiting in self._deferred.items():
+                while waiting and (waiting[0][1].process_id in self.dropped or
+                                   self._misses_deadline(waiting[0][1], now)):
+                    _, process = heapq.heappop(waiting)
+                    if process.process_id not in self.dropped:
+                        self._drop(scheduler, process, "deadline")
+                if waiting and (best is None or waiting[0][0] < best[0]) and self._has_token(waiting[0][1], now):
+                    best = (waiting[0][0], level)
+            if best is None:
+                return
+            _, process = heapq.heappop(self._deferred[best[1]])
+            waited = now - self._eligible_at.pop(process.process_id)
+            if waited > 0:
+                self.defer_time[process.process_id] = waited
+            self._admit(scheduler, process, now)
+
+    def _admit(self, scheduler, process: Process, now: int):
+        level = process.queue_level.value
+        if level in self._tokens:
+            self._tokens[level] -= 1
+        scheduler.enqueue(process)
+        self.admitted_at[process.process_id] = now
+        deadline = self.deadline_of.get(process.process_id)
+        if deadline is not None:
+            heapq.heappush(self._expiry, (deadline - process.remaining_time, next(self._seq), process))
+
+    def _shed_expired(self, scheduler, now: int):
+        """마감까지 끝낼 수 없게 된 ready queue 프로세스 drop (실행하면 key가 커지므로 꺼낼 때 다시 계산)"""
+        expiry = self._expiry
+        while expiry and expiry[0][0] < now:
+            _, _, process = heapq.heappop(expiry)
+            if process.process_id in self.dropped or process.remaining_time == 0:
+                continue
+            latest_start = self.deadline_of[process.process_id] - process.remaining_time
+            if latest_start < now:
+                self._drop(scheduler, process, "deadline")
+            else:
+                heapq.heappush(expiry, (latest_start, next(self._seq), process))
+
+    def _drop(self, scheduler, process: Process, reason: str):
+        """프로세스와 (IPC 모드에서) 그 프로세스를 기다리는 후행 프로세스 전체를 drop"""
+        stack = [(process, reason)]
+        while stack:
+            process, reason = stack.pop()
+            self.dropped[process.process_id] = reason
+            self._held.pop(process.process_id, None)
+            self.wasted_time += process.burst_time - process.remaining_time
+            scheduler.drop_process(process)
+            for dependent in self.dependents.get(process.process_id, ()):
+                if dependent.process_id not in self.dropped and dependent.remaining_time > 0:
+                    stack.append((dependent, "dependency"))
+
+    def metrics(self, total_time: int) -> Dict[str, float]:
+        """
+        overload 지표 (drop된 프로세스는 대기 / 반환 시간 지표에서 제외)
+        - goodput: 전체 시간 중 완료된 프로세스의 실행에 쓴 시간 비율 (%)
+        - wasted_cpu_time: drop된 프로세스가 drop 전까지 사용한 CPU 시간
+        - avg_defer_time: defer된 프로세스가 실행 가능해진 뒤(도착 및 선행 완료) ready queue에 들어가기까지 기다린 평균 시간
+        """
+        completed = [p for p in self.processes if p.process_id not in self.dropped]
+        useful = sum(p.burst_time for p in completed)
+        metrics = {
+            "completed_processes": len(completed),
+            "dropped_processes": len(self.dropped),
+            "deferred_processes": len(self.defer_time),
+            "avg_defer_time": sum(self.defer_time.values()) / len(self.defer_time) if self.defer_time else 0,
+            "goodput": useful / total_time * 100 if total_time > 0 else 0,
+            "wasted_cpu_time": self.wasted_time,
+            "max_queue_length": self.max_queue_length,
+        }
+        for reason in DROP_REASONS:
+            metrics[f"dropped_{reason}"] = sum(1 for r in self.dropped.values() if r == reason)
+        return metrics
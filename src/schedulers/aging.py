@@ -0,0 +1,39 @@
+import math
+from dataclasses import dataclass, asdict
+from typing import Dict
+
+AGING_POLICIES = ("linear", "exponential")
+
+@dataclass
+class Aging:
+    """
+    기다린 시간에 따라 유효 우선순위를 높이는 aging 설정 (값이 작을수록 높은 우선순위)
+    - linear: 유효 우선순위 = priority - rate x 대기 시간
+    - exponential: 유효 우선순위 = priority x 2^(-대기 시간 / half_life)
+    - 두 방식 모두 key(priority, since)의 대소가 시간에 따라 바뀌지 않으므로
+      대기 중인 프로세스를 tick마다 갱신하지 않고 대기 시작 시간(since)으로 한 번만 계산한 key로 비교
+    """
+    policy: str = "linear"
+    rate: float = 0.1
+    half_life: float = 50
+
+    def __post_init__(self):
+        if self.policy not in AGING_POLICIES:
+            raise ValueError(f"Unknown aging policy: {self.policy} (available: {', '.join(AGING_POLICIES)})")
+        if self.policy == "linear" and self.rate <= 0:
+            raise ValueError("aging_rate must be positive")
+        if self.policy == "exponential" and self.half_life <= 0:
+            raise ValueError("aging_half_life must be positive")
+
+    def get_params(self) -> Dict:
+        return asdict(self)
+
+    def key(self, priority: float, since: int) -> float:
+        """since부터 기다린 프로세스의 비교 key (같은 시점의 유효 우선순위와 순서가 같음)"""
+        if self.policy == "linear":
+            # priority - rate x (now - since)에서 모든 프로세스에 공통인 -rate x now를 뺀 값
+            return priority + self.rate * since
+        if priority <= 0:
+            return -math.inf
+        # log2(priority x 2^(-(now - since) / half_life))에서 공통인 -now / half_life를 뺀 값
+        return math.log2(priority) + since / self.half_life
@@ -1,30 +1,16 @@
+import math
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from src.process import Process, ProcessState
+from src.schedulers.history import (
+    ProcessExecution, HistorySink, HistoryStats, InMemoryHistorySink
+)
+from src.schedulers.instrumentation import Instrumentation
 
-@dataclass
-class ProcessExecution:
-    """프로세스 실행 기록을 저장하는 클래스"""
-    process_id: int
-    start_time: int
-    end_time: int
-    state: ProcessState
-
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Dict, Optional
-from datetime import datetime
-from src.process import Process, ProcessState
-
-@dataclass
-class ProcessExecution:
-    """프로세스 실행 기록을 저장하는 클래스"""
-    process_id: int
-    start_time: int
-    end_time: int
-    state: ProcessState
+# 스케줄링 결과가 달라지는 엔진 변경 시 증가 (결과 캐시 무효화에 사용)
+ENGINE_VERSION = 5
 
 class Scheduler(ABC):
     def __init__(self, name: str, use_ipc: bool = False):
@@ -36,18 +22,160 @@ class Scheduler(ABC):
         self.completed_processes = []
         self.context_switches = 0
         self.all_processes = []
+        self.history_sink: Optional[HistorySink] = None
+        self.history_stats = HistoryStats()
+        self.last_process_id: Optional[int] = None
+        self.last_process: Optional[Process] = None
+        self.instrumentation: Optional[Instrumentation] = None
+        self._history_index: Optional["IntervalIndex"] = None
+        self.telemetry: Optional["Telemetry"] = None
+        self.channels: Optional["ChannelModel"] = None
+        self.admission: Optional["AdmissionControl"] = None
+        # False이면 closed-form 계산이 가능한 정책도 항상 tick 루프로 실행
+        self.use_fast_path = True
+
+    def set_history_sink(self, sink: Optional[HistorySink]):
+        """실행 기록을 저장할 sink 지정 (None이면 매 실행마다 새 in-memory list 사용)"""
+        self.history_sink = sink
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]):
+        """스케줄러 루프 계측 활성화 (None이면 비활성화, 비활성 시 오버헤드 없음)"""
+        self.instrumentation = instrumentation
+
+    def get_params(self) -> Dict:
+        """스케줄링 결과에 영향을 주는 생성자 인자 (use_ipc 제외)"""
+        return {}
+
+    def set_telemetry(self, telemetry: Optional["Telemetry"]):
+        """tick별 시계열(큐 길이, 의존성 대기, 처리량, 사용률) 수집 활성화 (None이면 비활성화)"""
+        self.telemetry = telemetry
+
+    def set_channels(self, channels: Optional["ChannelModel"]):
+        """IPC 메시지 전달 지연 / 채널 용량 모델 지정 (None이면 선행 완료 즉시 실행 가능, IPC 모드에서만 사용)"""
+        self.channels = channels
+
+    def set_admission(self, admission: Optional["AdmissionControl"]):
+        """ready queue admission 정책(크기 제한 / 레벨별 속도 제한 / 마감 시간) 지정 (None이면 도착 즉시 추가)"""
+        self.admission = admission
 
     def can_execute(self, process: Process) -> bool:
         """프로세스가 실행 가능한지 확인"""
         if not self.use_ipc:
             return True
+        if self.instrumentation is not None:
+            self.instrumentation.counters["dependency_checks"] += 1
+        if self.channels is not None:
+            return self.channels.ready(process)
         return process.can_execute(self.completed_processes)
+
+    def on_message_delivered(self, sender_id: int, receiver_id: int):
+        """채널 모델 사용 시 선행 프로세스의 메시지가 도착하면 호출 (의존성을 직접 추적하는 정책용)"""
+        pass
+
+    def on_process_dropped(self, process: Process):
+        """admission 정책이 ready queue의 프로세스를 drop하면 호출 (ready queue를 직접 추적하는 정책용)"""
+        pass
+
+    def enqueue(self, process: Process):
+        """프로세스를 READY 상태로 ready queue에 추가"""
+        process.state = ProcessState.READY
+        self.ready_queue.append(process)
+        if self.telemetry is not None:
+            self.telemetry.enqueue(process)
+
+    def drop_process(self, process: Process):
+        """프로세스를 완료 처리 없이 실행 대상에서 제외 (ready queue에 있으면 제거)"""
+        for index, item in enumerate(self.ready_queue):
+            if item is process:
+                del self.ready_queue[index]
+                if self.telemetry is not None:
+                    self.telemetry.remove(process)
+                self.on_process_dropped(process)
+                break
+        process.state = ProcessState.TERMINATED
+
+    def add_remote_completion(self, process_id: int):
+        """다른 노드 등 외부에서 완료된 선행 프로세스를 의존성 판단에 반영 (completed_processes에 추가)"""
+        self.completed_processes.append(process_id)
+        if self.telemetry is not None:
+            self.telemetry.complete(process_id)
     
     @abstractmethod
     def get_next_process(self, ready_queue: List[Process]) -> Optional[Process]:
         """다음에 실행할 프로세스를 선택하는 메서드"""
         pass
 
+    def history_index(self) -> "IntervalIndex":
+        """
+        마지막 스케줄링 결과의 interval index (실행마다 한 번만 생성)
+        - 시각화 / 구간 query용, calculate_metrics는 스케줄링 중 집계한 history_stats 사용
+        """
+        if self._history_index is None:
+            from src.schedulers.interval_index import IntervalIndex
+            self._history_index = IntervalIndex.from_history(self.execution_history, self.all_processes)
+        return self._history_index
+
+    def has_closed_form(self) -> bool:
+        """tick 루프 없이 전체 스케줄을 계산할 수 있는 정책인지 여부"""
+        return False
+
+    def closed_form_timings(self, arrivals: "np.ndarray", bursts: "np.ndarray"):
+        """실행 순서의 (프로세스 index, 시작 시간, 종료 시간) 배열 반환 (has_closed_form이 True일 때만 호출)"""
+        raise NotImplementedError
+
+    def closed_form_batch_timings(self, offsets: "np.ndarray", arrivals: "np.ndarray", bursts: "np.ndarray"):
+        """offsets로 나뉜 여러 워크로드의 closed-form 스케줄 (기본은 워크로드별로 closed_form_timings 호출)"""
+        from src.schedulers.closed_form import segmented_timings
+        return segmented_timings(self.closed_form_timings, offsets, arrivals, bursts)
+
+    def _schedule_closed_form(self, processes: List[Process]) -> bool:
+        """
+        closed-form fast path로 스케줄링 (적용할 수 없으면 False 반환)
+        - 도착 시간 >= 0, burst >= 1인 정수 워크로드만 대상 (burst 0은 tick 루프에서 1 tick을 소비)
+        - 실행 기록은 프로세스마다 병합된 구간 하나로 추가
+        """
+        if not processes:
+            return False
+        import numpy as np
+        arrivals = np.array([p.arrival_time for p in processes])
+        bursts = np.array([p.burst_time for p in processes])
+        if arrivals.dtype.kind not in "iu" or bursts.dtype.kind not in "iu":
+            return False
+        if arrivals.min() < 0 or bursts.min() < 1:
+            return False
+        
+        order, starts, ends = self.closed_form_timings(arrivals, bursts)
+        process_ids = np.array([p.process_id for p in processes])[order]
+        self.context_switches = int(np.count_nonzero(process_ids[1:] != process_ids[:-1]))
+        
+        pid_list = process_ids.tolist()
+        start_list = starts.tolist()
+        end_list = ends.tolist()
+        self.execution_history.extend(
+            ProcessExecution(pid, start, end, ProcessState.RUNNING)
+            for pid, start, end in zip(pid_list, start_list, end_list)
+        )
+        self.history_stats.add_running(pid_list, start_list, end_list)
+        
+        # tick 루프와 동일하게 마지막 실행 tick의 시작 시간(end - 1)을 완료 시간으로 기록
+        completion = ends - 1
+        turnaround = completion - arrivals[order]
+        waiting = turnaround - bursts[order]
+        for i, completion_time, turnaround_time, waiting_time in zip(
+                order.tolist(), completion.tolist(), turnaround.tolist(), waiting.tolist()):
+            process = processes[i]
+            process.remaining_time = 0
+            process.state = ProcessState.TERMINATED
+            process.completion_time = completion_time
+            process.turnaround_time = turnaround_time
+            process.waiting_time = waiting_time
+        self.completed_processes = pid_list
+        
+        self.current_time = int(ends[-1])
+        self.last_process = processes[int(order[-1])]
+        self.last_process_id = self.last_process.process_id
+        return True
+
     def add_to_history(self, process: Process, start_time: int, end_time: int, state: ProcessState):
         """실행 기록 추가"""
         execution = ProcessExecution(
@@ -57,68 +185,207 @@ class Scheduler(ABC):
             state=state
         )
         self.execution_history.append(execution)
+        self.history_stats.add(execution)
 
-    def update_process_metrics(self, process: Process):
-        """프로세스의 성능 지표 업데이트"""
-        process.completion_time = self.current_time
+    def update_process_metrics(self, process: Process, completion_time: Optional[int] = None):
+        """프로세스의 성능 지표 업데이트 (completion_time을 생략하면 현재 tick)"""
+        process.completion_time = self.current_time if completion_time is None else completion_time
         process.turnaround_time = process.completion_time - process.arrival_time
         process.waiting_time = process.turnaround_time - process.burst_time
 
-    def schedule(self, processes: List[Process]) -> List[ProcessExecution]:
-        """프로세스 스케줄링 실행"""
+    def reset_run(self, processes: List[Process]):
+        """실행 상태와 프로세스 상태 초기화 (schedule 및 외부 실행 backend가 시작 시 호출)"""
         self.current_time = 0
-        self.execution_history = []
+        if self.history_sink is None:
+            self.execution_history = InMemoryHistorySink()
+        else:
+            self.history_sink.reset()
+            self.execution_history = self.history_sink
+        self.history_stats = HistoryStats()
+        self._history_index = None
+        self.last_process_id = None
+        self.last_process = None
         self.ready_queue = []
         self.completed_processes = []
         self.context_switches = 0
         self.all_processes = processes.copy()  # 모든 프로세스 저장
+        if self.channels is not None:
+            self.channels.reset(processes if self.use_ipc else [])
+        if self.admission is not None:
+            self.admission.reset(processes, self.use_ipc)
         
         # 모든 프로세스의 상태 초기화
         for process in processes:
             process.reset()
+
+    def schedule(self, processes: List[Process]) -> List[ProcessExecution]:
+        """프로세스 스케줄링 실행"""
+        self.reset_run(processes)
+        
+        # 계측 / telemetry가 꺼져 있으면 아래 루프의 instr, telemetry 분기는 모두 건너뜀
+        instr = self.instrumentation
+        telemetry = self.telemetry
+        channels = self.channels if self.use_ipc else None
+        if telemetry is not None:
+            telemetry.reset(channels, self.use_ipc)
+        admission = self.admission
         
-        # 모든 프로세스가 완료될 때까지 반복
-        while len(self.completed_processes) < len(processes):
+        # 비선점 정책은 tick 루프 대신 closed-form으로 계산 (계측 / telemetry 수집, admission 정책 사용 시에는 tick 루프 사용)
+        if (self.use_fast_path and instr is None and telemetry is None and admission is None
+                and self.has_closed_form() and self._schedule_closed_form(processes)):
+            self.execution_history.close()
+            return self.execution_history
+        
+        clock = time.perf_counter
+        if instr is not None:
+            instr.start_run(self)
+            counters = instr.counters
+            phases = instr.phase_seconds
+        
+        # 도착 시간 순 admission cursor (같은 도착 시간은 입력 순서 유지, tick마다 전체 목록을 훑지 않음)
+        arrival_order = sorted(processes, key=lambda p: p.arrival_time)
+        cursor = 0
+        
+        # 모든 프로세스가 완료(또는 admission 정책에 의해 drop)될 때까지 반복
+        while len(self.completed_processes) + (len(admission.dropped) if admission else 0) < len(processes):
+            if instr is not None:
+                t0 = clock()
+                counters["ticks"] += 1
+            
+            # 메시지 쓰기를 마친 송신자 종료, 도착한 메시지 전달
+            if channels is not None:
+                self._advance_channels(channels)
+            
             # 현재 시간에 도착한 프로세스들을 ready queue에 추가
-            for process in processes:
+            arrivals = []
+            while cursor < len(arrival_order) and arrival_order[cursor].arrival_time <= self.current_time:
+                process = arrival_order[cursor]
+                cursor += 1
                 if (process.arrival_time == self.current_time and 
                     process.state == ProcessState.NEW):
-                    process.state = ProcessState.READY
-                    self.ready_queue.append(process)
+                    if admission is not None:
+                        arrivals.append(process)
+                        continue
+                    self.enqueue(process)
+                    if instr is not None:
+                        counters["admissions"] += 1
+            if admission is not None:
+                # 정책에 따라 ready queue에 추가 / 대기 / drop (이전에 defer된 프로세스 포함)
+                admission.step(self, arrivals)
+            
+            if instr is not None:
+                phases["admission"] += clock() - t0
+                instr.observe_queue(len(self.ready_queue))
+            
+            self._run_tick(channels, instr, telemetry)
+        
+        self.execution_history.close()
+        if instr is not None:
+            instr.end_run(self)
+        return self.execution_history
+
+    def _run_tick(self, channels: Optional["ChannelModel"], instr: Optional[Instrumentation],
+                  telemetry: Optional["Telemetry"]) -> Optional[Process]:
+        """
+        도착 처리 이후의 tick 하나 실행 (schedule과 ClusterNode.advance가 공유)
+        - telemetry 기록, 다음 프로세스 선택 / 1 tick 실행 / 완료 처리 후 current_time 증가
+        - 실행한 프로세스 반환 (실행할 프로세스가 없으면 None)
+        """
+        if instr is not None:
+            clock = time.perf_counter
+            counters = instr.counters
+            phases = instr.phase_seconds
+            t1 = clock()
+        if telemetry is not None:
+            completed_before = len(self.completed_processes)
+            telemetry.sample_queue(self.current_time)
+        
+        # 실행 가능한 다음 프로세스 선택
+        current_process = self.get_next_process(self.ready_queue)
+        
+        if instr is not None:
+            t2 = clock()
+            phases["select"] += t2 - t1
+            counters["decisions"] += 1
+        
+        if current_process:
+            # 이전에 실행중이던 프로세스가 있었다면 context switch 발생
+            if self.last_process_id is not None and self.last_process_id != current_process.process_id:
+                self.context_switches += 1
+                if instr is not None:
+                    counters["context_switches"] += 1
+                    if self.last_process.state != ProcessState.TERMINATED:
+                        counters["preemptions"] += 1
+            self.last_process_id = current_process.process_id
+            self.last_process = current_process
+            
+            # 프로세스 실행
+            execution_time = min(1, current_process.remaining_time)  # 1 시간 단위로 실행
+            current_process.state = ProcessState.RUNNING
+            current_process.remaining_time -= execution_time
+            
+            if instr is not None:
+                t3 = clock()
             
-            # 실행 가능한 다음 프로세스 선택
-            current_process = self.get_next_process(self.ready_queue)
+            self.add_to_history(
+                current_process, 
+                self.current_time, 
+                self.current_time + execution_time,
+                ProcessState.RUNNING
+            )
             
-            if current_process:
-                # 이전에 실행중이던 프로세스가 있었다면 context switch 발생
-                if self.execution_history and self.execution_history[-1].process_id != current_process.process_id:
-                    self.context_switches += 1
-                
-                # 프로세스 실행
-                execution_time = min(1, current_process.remaining_time)  # 1 시간 단위로 실행
-                current_process.state = ProcessState.RUNNING
-                current_process.remaining_time -= execution_time
-                
-                self.add_to_history(
-                    current_process, 
-                    self.current_time, 
-                    self.current_time + execution_time,
-                    ProcessState.RUNNING
-                )
-                
-                # 프로세스가 완료되었는지 확인
-                if current_process.remaining_time == 0:
+            if instr is not None:
+                t4 = clock()
+                phases["history"] += t4 - t3
+            
+            # 프로세스가 완료되었는지 확인
+            if current_process.remaining_time == 0:
+                # dataclass __eq__ 비교 대신 identity로 위치를 찾아 제거 (긴 ready queue에서 비용 큼)
+                del self.ready_queue[index_of(self.ready_queue, current_process)]
+                if telemetry is not None:
+                    telemetry.remove(current_process)
+                if (channels is not None and
+                        channels.start_send(current_process, self.current_time + 1) > self.current_time + 1):
+                    # 송신 buffer가 가득 차면 메시지를 모두 쓸 때까지 block
+                    current_process.state = ProcessState.WAITING
+                else:
                     current_process.state = ProcessState.TERMINATED
                     self.completed_processes.append(current_process.process_id)
-                    self.ready_queue.remove(current_process)
+                    if telemetry is not None:
+                        telemetry.complete(current_process.process_id)
                     self.update_process_metrics(current_process)
+                if instr is not None:
+                    counters["completions"] += 1
             
-            self.current_time += 1
-            
-        return self.execution_history
+            if instr is not None:
+                phases["execute"] += (t3 - t2) + (clock() - t4)
+        elif instr is not None:
+            counters["idle_ticks"] += 1
+        
+        if telemetry is not None:
+            telemetry.end_tick(self.current_time, current_process is not None,
+                               len(self.completed_processes) - completed_before)
+        
+        self.current_time += 1
+        return current_process
+
+    def _advance_channels(self, channels: "ChannelModel"):
+        unblocked, delivered = channels.advance(self.current_time)
+        for process in unblocked:
+            # block된 구간은 WAITING 실행 기록으로 남겨 반환 시간에 포함
+            self.add_to_history(process, channels.cpu_end[process.process_id], self.current_time,
+                                ProcessState.WAITING)
+            process.state = ProcessState.TERMINATED
+            self.completed_processes.append(process.process_id)
+            self.update_process_metrics(process, self.current_time - 1)
+        for sender_id, receiver_id in delivered:
+            if self.telemetry is not None:
+                self.telemetry.deliver(receiver_id)
+            self.on_message_delivered(sender_id, receiver_id)
 
     def calculate_detailed_metrics(self) -> Tuple[Dict[str, float], str]:
         """스케줄링 성능 지표 계산 및 상세 계산 과정 출력"""
+        started = time.perf_counter()
         process_stats = {}
         detailed_output = []
         
@@ -126,8 +393,11 @@ class Scheduler(ABC):
         detailed_output.append(f"\n{self.__class__.__name__} 상세 계산 과정:")
         detailed_output.append("=" * 50)
         
-        # 모든 프로세스의 arrival_time 설정
+        # 모든 프로세스의 arrival_time 설정 (admission 정책으로 drop된 프로세스는 제외)
+        dropped = self.admission.dropped if self.admission is not None else {}
         for process in self.all_processes:
+            if process.process_id in dropped:
+                continue
             process_stats[process.process_id] = {
                 'arrival_time': process.arrival_time,
                 'burst_time': process.burst_time,
@@ -136,25 +406,36 @@ class Scheduler(ABC):
                 'start_time': float('inf')
             }
         
-        # 각 프로세스별로 실행 기록 정리
-        for exec in self.execution_history:
-            stats = process_stats[exec.process_id]
-            stats['last_end'] = max(stats['last_end'], exec.end_time)
-            stats['start_time'] = min(stats['start_time'], exec.start_time)
-            if exec.state == ProcessState.RUNNING:
-                stats['total_run_time'] += (exec.end_time - exec.start_time)
+        # 스케줄링 중 스트리밍으로 집계한 실행 기록 통계 반영
+        history_stats = self.history_stats
+        for pid, stats in process_stats.items():
+            if pid in history_stats.last_end:
+                stats['last_end'] = max(stats['last_end'], history_stats.last_end[pid])
+                stats['start_time'] = min(stats['start_time'], history_stats.first_start[pid])
+                stats['total_run_time'] = history_stats.run_time[pid]
         
         # 전체 지표 계산 및 상세 정보 출력
         total_waiting_time = 0
         total_turnaround_time = 0
         total_processes = len(process_stats)
+        waiting_times = []
         
         detailed_output.append("각 프로세스별 계산 과정:")
         detailed_output.append("-" * 50)
         
+        # 채널 모델 사용 시 통신 시간(송신 block + 메시지 대기)은 스케줄링 대기 시간에서 제외
+        communication_times = (self.channels.communication_times()
+                               if self.channels is not None and self.use_ipc else {})
+        
         for pid, stats in process_stats.items():
             turnaround_time = stats['last_end'] - stats['arrival_time']
-            waiting_time = turnaround_time - stats['total_run_time']
+            communication_time = communication_times.get(pid, 0)
+            waiting_time = turnaround_time - stats['total_run_time'] - communication_time
+            if communication_time:
+                waiting_detail = (f"- Waiting Time = {turnaround_time} - {stats['total_run_time']} - "
+                                  f"{communication_time} (communication) = {waiting_time}")
+            else:
+                waiting_detail = f"- Waiting Time = {turnaround_time} - {stats['total_run_time']} = {waiting_time}"
             
             process_detail = [
                 f"Process {pid}:",
@@ -164,17 +445,22 @@ class Scheduler(ABC):
                 f"- Completion Time: {stats['last_end']}",
                 f"- Total Run Time: {stats['total_run_time']}",
                 f"- Turnaround Time = {stats['last_end']} - {stats['arrival_time']} = {turnaround_time}",
-                f"- Waiting Time = {turnaround_time} - {stats['total_run_time']} = {waiting_time}",
+                waiting_detail,
                 ""
             ]
             detailed_output.extend(process_detail)
             
             total_waiting_time += waiting_time
+            waiting_times.append(waiting_time)
             total_turnaround_time += turnaround_time
         
         # 평균값 계산 및 출력
         avg_waiting_time = total_waiting_time / total_processes if total_processes > 0 else 0
         avg_turnaround_time = total_turnaround_time / total_processes if total_processes > 0 else 0
+        # 꼬리 대기 시간 (선형 보간 백분위수)
+        p99_waiting_time = percentile(waiting_times, 99) if waiting_times else 0
+        # 기아(starvation) 확인용 최대 대기 시간
+        max_waiting_time = max(waiting_times, default=0)
         
         summary = [
             "최종 계산 결과:",
@@ -183,6 +469,8 @@ class Scheduler(ABC):
             f"Average Waiting Time = {total_waiting_time} / {total_processes} = {avg_waiting_time:.2f}",
             f"Total Turnaround Time = {total_turnaround_time}",
             f"Average Turnaround Time = {total_turnaround_time} / {total_processes} = {avg_turnaround_time:.2f}",
+            f"P99 Waiting Time = {p99_waiting_time:.2f}",
+            f"Max Waiting Time = {max_waiting_time}",
             f"Context Switches = {self.context_switches}",
             "=" * 50,
             ""
@@ -191,22 +479,45 @@ class Scheduler(ABC):
         
         # CPU 사용률 계산
         total_time = self.current_time
-        cpu_busy_time = sum(
-            exec.end_time - exec.start_time 
-            for exec in self.execution_history 
-            if exec.state == ProcessState.RUNNING
-        )
+        cpu_busy_time = history_stats.busy_time
         
         metrics = {
             "avg_waiting_time": avg_waiting_time,
             "avg_turnaround_time": avg_turnaround_time,
             "cpu_utilization": (cpu_busy_time / total_time) * 100 if total_time > 0 else 0,
-            "context_switches": self.context_switches
+            "context_switches": self.context_switches,
+            "p99_waiting_time": p99_waiting_time,
+            "max_waiting_time": max_waiting_time
         }
+        if self.channels is not None and self.use_ipc:
+            metrics.update(self.channels.metrics())
+        if self.admission is not None:
+            metrics.update(self.admission.metrics(total_time))
         
+        if self.instrumentation is not None:
+            self.instrumentation.record_metrics(self, time.perf_counter() - started)
         return metrics, "\n".join(detailed_output)
 
     def calculate_metrics(self) -> Dict[str, float]:
         """기존의 성능 지표 계산 메서드"""
         metrics, _ = self.calculate_detailed_metrics()
-        return metrics
\ No newline at end of file
+        return metrics
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (numpy.percentile 기본 방식과 같은 값, 지표 계산에 numpy를 import하지 않음)"""
+    data = sorted(values)
+    index = (len(data) - 1) * (q / 100)
+    lo = math.floor(index)
+    hi = min(lo + 1, len(data) - 1)
+    gamma = index - lo
+    diff = data[hi] - data[lo]
+    if gamma >= 0.5:
+        return float(data[hi] - diff * (1 - gamma))
+    return float(data[lo] + diff * gamma)
+
+def index_of(items: List, target) -> int:
+    """identity 기준 위치 (list.index는 앞선 원소마다 __eq__를 호출)"""
+    for index, item in enumerate(items):
+        if item is target:
+            return index
+    raise ValueError(f"{target!r} is not in list")
@@ -0,0 +1,285 @@
+import heapq
+import itertools
+from typing import Dict, List, Optional
+from src.schedulers.base import Scheduler
+from src.process import Process, QueueLevel
+
+# Linux sched_prio_to_weight (nice -20 .. 19), nice 0 = 1024
+PRIO_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+NICE_0_LOAD = 1024
+
+class _RunQueue:
+    """vruntime 순 heap 하나와 runnable 총 weight (실행 중인 프로세스는 heap에서 빠져 있지만 load에는 포함)"""
+    def __init__(self):
+        self.heap = []
+        self.load = 0
+        self.min_vruntime = 0.0
+
+class CFSScheduler(Scheduler):
+    """
+    Linux CFS 방식의 가중 vruntime 스케줄러
+    - weight는 priority에서 nice로 변환하여 결정 (priority 1 = nice base_nice, 1 증가마다 nice 1 증가)
+    - 실행한 tick마다 vruntime += NICE_0_LOAD / weight, run queue는 (vruntime, 도착 순) heap
+    - time slice = period x weight / 총 weight (period = max(target_latency, 실행 가능 수 x min_granularity))
+    - slice를 다 쓰고 더 작은 vruntime이 있거나, 새로 runnable이 된 프로세스의 vruntime이
+      wakeup_granularity 이상 작으면 선점
+    - group_by_level: QueueLevel별 그룹을 상위 CFS 단계로 두어 레벨 간에도 가중 공정 분배
+    - 새로 도착한 프로세스는 ready queue 끝에서만 읽고 완료 / 의존성 해제를 직접 추적하므로
+      결정마다 O(log N) (ready queue 전체를 훑지 않음)
+    """
+    def __init__(self, use_ipc: bool = False, target_latency: int = 6, min_granularity: int = 1,
+                 wakeup_granularity: float = 1, base_nice: int = 0, group_by_level: bool = False,
+                 group_weights: Optional[Dict[str, int]] = None):
+        super().__init__("CFS", use_ipc)
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self.wakeup_granularity = wakeup_granularity
+        self.base_nice = base_nice
+        self.group_by_level = group_by_level
+        self.group_weights = dict(group_weights or {level.value: NICE_0_LOAD for level in QueueLevel})
+        self._init_state()
+
+    def get_params(self) -> Dict:
+        return {
+            "target_latency": self.target_latency,
+            "min_granularity": self.min_granularity,
+            "wakeup_granularity": self.wakeup_granularity,
+            "base_nice": self.base_nice,
+            "group_by_level": self.group_by_level,
+            "group_weights": dict(self.group_weights),
+        }
+
+    def weight_of(self, process: Process) -> int:
+        nice = min(19, max(-20, self.base_nice + process.priority - 1))
+        return PRIO_TO_WEIGHT[nice + 20]
+
+    def _init_state(self):
+        self._queue_len = 0  # 직전 결정 시점의 ready queue 길이 (새로 추가된 프로세스 판별용)
+        self._seq = itertools.count()
+        self._vruntime: Dict[int, float] = {}
+        self._weight: Dict[int, int] = {}
+        self._completed = set()
+        self._waiters: Dict[int, List[Process]] = {}  # 선행 process id -> 기다리는 프로세스
+        self._missing: Dict[int, int] = {}  # process id -> 완료되지 않은 선행 수
+        self._admitted: Dict[int, Process] = {}
+        self._queues: Dict[QueueLevel, _RunQueue] = {level: _RunQueue() for level in QueueLevel}
+        self._root = _RunQueue()  # group_by_level이 아닐 때의 run queue
+        self._group_vruntime: Dict[QueueLevel, float] = {level: 0.0 for level in QueueLevel}
+        self._group_min_vruntime = 0.0
+        self._current: Optional[Process] = None
+        self._slice_used = 0
+        self._woken: List[Process] = []
+
+    def reset_run(self, processes: List[Process]):
+        super().reset_run(processes)
+        self._init_state()
+
+    def schedule(self, processes: List[Process]):
+        history = super().schedule(processes)
+        # 마지막으로 완료된 프로세스는 다음 결정이 없으므로 여기서 정산
+        current = self._current
+        if current is not None and current.remaining_time == 0:
+            self._charge(current, 1)
+            self._complete(current)
+            self._current = None
+        return history
+
+    def add_remote_completion(self, process_id: int):
+        super().add_remote_completion(process_id)
+        self._release(process_id)
+
+    def _queue_of(self, process: Process) -> _RunQueue:
+        return self._queues[process.queue_level] if self.group_by_level else self._root
+
+    def _group_load(self, level: QueueLevel) -> int:
+        return self.group_weights.get(level.value, NICE_0_LOAD)
+
+    def _enqueue(self, process: Process, vruntime: float):
+        queue = self._queue_of(process)
+        if self.group_by_level and queue.load == 0:
+            # 그룹이 다시 runnable이 되면 그룹 vruntime을 다른 그룹 최소값 이상으로 맞춤
+            level = process.queue_level
+            self._group_vruntime[level] = max(self._group_vruntime[level], self._group_min_vruntime)
+        self._vruntime[process.process_id] = vruntime
+        queue.load += self._weight[process.process_id]
+        heapq.heappush(queue.heap, (vruntime, next(self._seq), process))
+
+    def _requeue(self, process: Process):
+        """선점된 프로세스를 heap에 다시 넣음 (실행 중에도 load에 포함되어 있으므로 load는 그대로)"""
+        queue = self._queue_of(process)
+        heapq.heappush(queue.heap, (self._vruntime[process.process_id], next(self._seq), process))
+
+    def _place(self, process: Process, sleeper_credit: bool):
+        """새 프로세스는 min_vruntime에서, 의존성 대기 후 깨어난 프로세스는 target_latency / 2만큼 앞에서 시작"""
+        queue = self._queue_of(process)
+        start = queue.min_vruntime - (self.target_latency / 2 if sleeper_credit else 0)
+        vruntime = max(self._vruntime.get(process.process_id, 0.0), start)
+        self._enqueue(process, vruntime)
+        self._woken.append(process)
+
+    def _admit(self, ready_queue: List[Process], removed: int):
+        """ready queue 끝에 새로 추가된 프로세스를 run queue 또는 의존성 대기 목록에 추가"""
+        added = len(ready_queue) - (self._queue_len - removed)
+        for process in ready_queue[len(ready_queue) - added:]:
+            self._weight[process.process_id] = self.weight_of(process)
+            self._admitted[process.process_id] = process
+            if self.use_ipc and self.channels is not None:
+                # 채널 모델 사용 시 메시지 도착(on_message_delivered)으로 대기 해제
+                pending = self.channels.pending.get(process.process_id, 0)
+                if pending:
+                    self._missing[process.process_id] = pending
+                else:
+                    self._place(process, sleeper_credit=False)
+                continue
+            missing = [d for d in process.dependencies if d not in self._completed] if self.use_ipc else []
+            if missing:
+                self._missing[process.process_id] = len(missing)
+                for dependency in missing:
+                    self._waiters.setdefault(dependency, []).append(process)
+            else:
+                self._place(process, sleeper_credit=False)
+
+    def on_message_delivered(self, sender_id: int, receiver_id: int):
+        if receiver_id in self._missing:
+            self._missing[receiver_id] -= 1
+            if self._missing[receiver_id] == 0:
+                del self._missing[receiver_id]
+                self._place(self._admitted[receiver_id], sleeper_credit=True)
+
+    def on_process_dropped(self, process: Process):
+        pid = process.process_id
+        if self._admitted.pop(pid, None) is None:
+            return  # 이번 tick에 추가되어 아직 읽지 않은 프로세스
+        self._queue_len -= 1
+        if self._missing.pop(pid, None) is not None:
+            return  # 의존성 대기 중이라 run queue에 없음
+        queue = self._queue_of(process)
+        queue.load -= self._weight[pid]
+        if process is self._current:
+            self._current = None
+            return
+        self._woken = [p for p in self._woken if p is not process]
+        index = next(i for i, entry in enumerate(queue.heap) if entry[2] is process)
+        queue.heap[index] = queue.heap[-1]
+        queue.heap.pop()
+        heapq.heapify(queue.heap)
+
+    def _complete(self, process: Process):
+        queue = self._queue_of(process)
+        queue.load -= self._weight[process.process_id]
+        self._release(process.process_id)
+
+    def _release(self, process_id: int):
+        """완료된 선행 프로세스를 기다리던 프로세스 중 대기가 끝난 것을 run queue에 추가"""
+        self._completed.add(process_id)
+        for waiter in self._waiters.pop(process_id, []):
+            if waiter.process_id not in self._missing:
+                continue  # drop된 프로세스
+            self._missing[waiter.process_id] -= 1
+            if self._missing[waiter.process_id] == 0:
+                del self._missing[waiter.process_id]
+                self._place(waiter, sleeper_credit=True)
+
+    def _charge(self, process: Process, ticks: int):
+        """실행한 tick만큼 프로세스 (및 그룹) vruntime 증가"""
+        pid = process.process_id
+        self._vruntime[pid] += ticks * NICE_0_LOAD / self._weight[pid]
+        if self.group_by_level:
+            level = process.queue_level
+            self._group_vruntime[level] += ticks * NICE_0_LOAD / self._group_load(level)
+
+    def _ideal_slice(self, process: Process) -> float:
+        queue = self._queue_of(process)
+        running = len(queue.heap) + 1
+        period = max(self.target_latency, running * self.min_granularity)
+        slice_ = period * self._weight[process.process_id] / max(queue.load, 1)
+        if self.group_by_level:
+            total = sum(self._group_load(level) for level in QueueLevel if self._queues[level].load > 0)
+            slice_ *= self._group_load(process.queue_level) / max(total, 1)
+        return max(self.min_granularity, slice_)
+
+    def _pick_queue(self) -> Optional[_RunQueue]:
+        """heap이 비어 있지 않은 run queue (그룹 모드에서는 그룹 vruntime이 가장 작은 레벨)"""
+        if not self.group_by_level:
+            return self._root if self._root.heap else None
+        candidates = [level for level in QueueLevel if self._queues[level].heap]
+        if not candidates:
+            return None
+        return self._queues[min(candidates, key=lambda level: self._group_vruntime[level])]
+
+    def _update_min_vruntime(self, queue: _RunQueue, current: Optional[Process]):
+        values = []
+        if current is not None and self._queue_of(current) is queue:
+            values.append(self._vruntime[current.process_id])
+        if queue.heap:
+            values.append(queue.heap[0][0])
+        if values:
+            queue.min_vruntime = max(queue.min_vruntime, min(values))
+
+    def _should_preempt(self, current: Process) -> bool:
+        queue = self._queue_of(current)
+        if self.group_by_level:
+            # 다른 그룹의 vruntime이 현재 그룹보다 slice 이상 작으면 그룹 간 선점
+            level = current.queue_level
+            others = [l for l in QueueLevel if l != level and self._queues[l].heap]
+            if others and self._slice_used >= self.min_granularity:
+                lowest = min(self._group_vruntime[l] for l in others)
+                if self._group_vruntime[level] - lowest > self._ideal_slice(current):
+                    return True
+        if not queue.heap:
+            return False
+        leftmost = queue.heap[0][0]
+        vruntime = self._vruntime[current.process_id]
+        # 새로 runnable이 된 프로세스의 wakeup 선점
+        if any(self._queue_of(p) is queue for p in self._woken) and \
+                vruntime - leftmost > self.wakeup_granularity:
+            return True
+        if self._slice_used < self.min_granularity:
+            return False
+        ideal = self._ideal_slice(current)
+        return (self._slice_used >= ideal and leftmost < vruntime) or vruntime - leftmost > ideal
+
+    def get_next_process(self, ready_queue: List[Process]) -> Optional[Process]:
+        current = self._current
+        removed = 0
+        if current is not None:
+            # 직전 tick에 실행한 프로세스 정산
+            self._charge(current, 1)
+            self._slice_used += 1
+            # 채널 모델에서 메시지를 쓰는 중이면 TERMINATED 대신 WAITING이므로 남은 실행 시간으로 판단
+            if current.remaining_time == 0:
+                self._complete(current)
+                current = None
+                removed = 1  # 완료된 프로세스는 엔진이 ready queue에서 제거함
+
+        self._admit(ready_queue, removed)
+
+        if current is not None and self._should_preempt(current):
+            self._requeue(current)
+            current = None
+
+        if current is None:
+            queue = self._pick_queue()
+            if queue is not None:
+                _, _, current = heapq.heappop(queue.heap)
+                self._slice_used = 0
+                if self.group_by_level:
+                    levels = [l for l in QueueLevel if self._queues[l].load > 0]
+                    self._group_min_vruntime = max(self._group_min_vruntime,
+                                                   min(self._group_vruntime[l] for l in levels))
+
+        if current is not None:
+            self._update_min_vruntime(self._queue_of(current), current)
+        self._woken.clear()
+        self._current = current
+        self._queue_len = len(ready_queue)
+        return current
@@ -0,0 +1,147 @@
+import heapq
+import itertools
+import math
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+from src.process import Process
+
+@dataclass
+class ChannelSpec:
+    """채널 하나의 전송 특성 (시간 단위는 tick, 크기 단위는 message_size와 같음)"""
+    latency: int = 0  # 전송을 마친 데이터가 수신자에 도착하기까지의 지연
+    bandwidth: Optional[float] = None  # tick당 전송량 (None이면 무제한)
+    capacity: Optional[float] = None  # 송신 buffer 크기 (None이면 무제한)
+
+    def write(self, size: float, start: int) -> Tuple[int, int]:
+        """start에 쓰기 시작한 메시지의 (송신자가 쓰기를 마치는 시간, 수신자 도착 시간)"""
+        if self.bandwidth is None:
+            return start, start + self.latency
+        transfer = math.ceil(size / self.bandwidth)
+        # buffer에 들어가지 않는 나머지는 buffer가 bandwidth로 비워지는 동안 기다렸다가 씀
+        blocked = 0 if self.capacity is None else max(0, math.ceil((size - self.capacity) / self.bandwidth))
+        return start + blocked, start + transfer + self.latency
+
+class ChannelModel:
+    """
+    IPC 의존성(선행 -> 후행)마다 채널을 두고 메시지 전달을 모델링 (Scheduler.set_channels로 사용)
+    - 선행 프로세스는 CPU 실행을 마친 다음 tick부터 후행 프로세스마다(process id 순) 메시지를 차례로 씀
+    - 메시지는 송신 buffer(capacity)에 들어가고 buffer는 bandwidth로 비워짐, buffer가 가득 차면
+      송신자는 나머지를 쓸 때까지 block (WAITING, 실행 기록에 WAITING 구간으로 남음)
+    - 후행 프로세스는 모든 선행의 메시지가 도착해야 실행 가능 (도착 = 전송 완료 + latency)
+    - 기본값(latency 0, bandwidth / capacity 무제한)이면 기존 IPC 모드와 결과가 같음
+    - 단순화: 의존성 하나가 메시지 하나만 나르는 채널이므로 buffer는 메시지마다 비어 있는 상태에서 시작
+      (capacity는 한 메시지 중 block 없이 쓸 수 있는 양만 결정, 메시지 간 buffer 점유는 모델링하지 않음)
+    - 송신 block 시간과 메시지 대기 시간은 통신 시간으로 따로 집계하고 스케줄링 대기 시간에서 제외
+    """
+    def __init__(self, latency: int = 0, bandwidth: Optional[float] = None,
+                 capacity: Optional[float] = None, message_size: float = 1,
+                 message_sizes: Optional[Dict[int, float]] = None,
+                 channels: Optional[Dict[Tuple[int, int], ChannelSpec]] = None):
+        self.default = ChannelSpec(latency, bandwidth, capacity)
+        self.message_size = message_size
+        self.message_sizes = dict(message_sizes or {})  # 선행 process id -> 메시지 크기
+        self.channels = dict(channels or {})  # (선행, 후행) -> 채널별 설정
+        self.reset([])
+
+    def get_params(self) -> Dict:
+        """결과에 영향을 주는 설정 (결과 캐시 key에 사용)"""
+        return {
+            "default": asdict(self.default),
+            "message_size": self.message_size,
+            "message_sizes": {str(pid): size for pid, size in sorted(self.message_sizes.items())},
+            "channels": {f"{src}->{dst}": asdict(spec) for (src, dst), spec in sorted(self.channels.items())},
+        }
+
+    def channel(self, sender: int, receiver: int) -> ChannelSpec:
+        return self.channels.get((sender, receiver), self.default)
+
+    def reset(self, processes: List[Process]):
+        """실행 시작 시 채널 상태 초기화"""
+        self.dependents: Dict[int, List[int]] = {}
+        self.senders = {p.process_id: list(p.dependencies) for p in processes}
+        self.pending: Dict[int, int] = {}  # 후행 process id -> 아직 도착하지 않은 메시지 수
+        for process in processes:
+            self.pending[process.process_id] = len(process.dependencies)
+            for dependency in process.dependencies:
+                self.dependents.setdefault(dependency, []).append(process.process_id)
+        for receivers in self.dependents.values():
+            receivers.sort()
+        self.arrival_times = {p.process_id: p.arrival_time for p in processes}
+        self._events = []  # (시간, 순서, 송신자, 수신자 또는 None(쓰기 완료))
+        self._writers: Dict[int, Process] = {}  # 쓰기 중 block된 송신자
+        self._seq = itertools.count()
+        self.cpu_end: Dict[int, int] = {}  # CPU 실행을 마친 시간
+        self.send_blocked: Dict[int, int] = {}
+        self.last_delivery: Dict[int, int] = {}
+        self.delivered = 0
+        self.volume = 0.0
+
+    def ready(self, process: Process) -> bool:
+        return self.pending.get(process.process_id, 0) == 0
+
+    def start_send(self, process: Process, now: int) -> int:
+        """CPU 실행을 마친 프로세스의 메시지 쓰기 시작, 쓰기를 모두 마치는 시간 반환"""
+        pid = process.process_id
+        self.cpu_end[pid] = now
+        size = self.message_sizes.get(pid, self.message_size)
+        write_end = now
+        for receiver in self.dependents.get(pid, ()):
+            write_end, arrival = self.channel(pid, receiver).write(size, write_end)
+            heapq.heappush(self._events, (arrival, next(self._seq), pid, receiver))
+            self.volume += size
+        self.send_blocked[pid] = write_end - now
+        if write_end > now:
+            self._writers[pid] = process
+            heapq.heappush(self._events, (write_end, next(self._seq), pid, None))
+        return write_end
+
+    def advance(self, now: int) -> Tuple[List[Process], List[Tuple[int, int]]]:
+        """now까지 쓰기를 마친 송신자 목록과 도착한 (송신자 id, 수신자 id) 메시지 목록"""
+        unblocked, delivered = [], []
+        events = self._events
+        while events and events[0][0] <= now:
+            _, _, sender, receiver = heapq.heappop(events)
+            if receiver is None:
+                unblocked.append(self._writers.pop(sender))
+                continue
+            self.pending[receiver] -= 1
+            self.last_delivery[receiver] = now
+            self.delivered += 1
+            delivered.append((sender, receiver))
+        return unblocked, delivered
+
+    def message_waits(self) -> Dict[int, int]:
+        """후행 process id -> 선행이 모두 CPU 실행을 마친 뒤 마지막 메시지가 도착할 때까지 기다린 시간 (도착 전 시간은 제외)"""
+        waits = {}
+        for receiver, last in self.last_delivery.items():
+            if self.pending[receiver]:
+                continue
+            arrival = self.arrival_times[receiver]
+            cpu_ready = max([arrival] + [self.cpu_end[src] for src in self.senders[receiver]])
+            waits[receiver] = max(0, max(arrival, last) - cpu_ready)
+        return waits
+
+    def communication_times(self) -> Dict[int, int]:
+        """process id -> 통신 시간 (송신 block 시간 + 메시지 대기 시간)"""
+        times = dict(self.send_blocked)
+        for pid, wait in self.message_waits().items():
+            times[pid] = times.get(pid, 0) + wait
+        return times
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        통신 지표 (스케줄링 대기 시간에는 포함하지 않음)
+        - avg_send_blocked_time: 송신 buffer가 가득 차서 송신자가 block된 시간 (전체 프로세스 평균)
+        - avg_message_wait_time: 선행이 모두 CPU 실행을 마친 뒤 메시지가 도착할 때까지 기다린 시간
+          (선행이 있는 프로세스 평균, 도착 전 시간은 제외)
+        """
+        count = len(self.arrival_times)
+        waits = list(self.message_waits().values())
+        return {
+            "avg_send_blocked_time": sum(self.send_blocked.values()) / count if count else 0,
+            "avg_message_wait_time": sum(waits) / len(waits) if waits else 0,
+            "messages_delivered": self.delivered,
+            "message_volume": self.volume,
+        }
+
@@ -0,0 +1,103 @@
+import heapq
+from typing import Tuple
+
+import numpy as np
+
+# (실행 순서의 프로세스 index, 시작 시간, 종료 시간)
+Timings = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+def admission_order(arrivals: np.ndarray) -> np.ndarray:
+    """ready queue에 들어가는 순서 (도착 시간, 입력 순서 기준 stable 정렬)"""
+    return np.argsort(arrivals, kind="stable")
+
+def fcfs_timings(arrivals: np.ndarray, bursts: np.ndarray) -> Timings:
+    """
+    비선점 FCFS 스케줄을 정렬 + 누적합으로 계산
+    - 종료 시간: end_i = C_i + max_{j<=i}(a_j - C_{j-1}), C는 burst 누적합
+    """
+    order = admission_order(arrivals)
+    a = arrivals[order].astype(np.int64)
+    b = bursts[order].astype(np.int64)
+    cumulative = np.cumsum(b)
+    previous = cumulative - b
+    ends = cumulative + np.maximum.accumulate(a - previous)
+    return order, ends - b, ends
+
+def sjf_timings(arrivals: np.ndarray, bursts: np.ndarray) -> Timings:
+    """
+    비선점 SJF 스케줄을 heap으로 계산 (O(N log N))
+    - 같은 burst는 ready queue에 먼저 들어온 프로세스 우선 (tick 루프의 min()과 동일)
+    """
+    n = len(arrivals)
+    admitted = admission_order(arrivals).tolist()
+    arrival_list = arrivals.tolist()
+    burst_list = bursts.tolist()
+    order = np.empty(n, dtype=np.int64)
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+
+    heap = []
+    now = 0
+    k = 0
+    for j in range(n):
+        if not heap and now < arrival_list[admitted[k]]:
+            now = arrival_list[admitted[k]]
+        while k < n and arrival_list[admitted[k]] <= now:
+            i = admitted[k]
+            heapq.heappush(heap, (burst_list[i], k, i))
+            k += 1
+        _, _, i = heapq.heappop(heap)
+        order[j] = i
+        starts[j] = now
+        now += burst_list[i]
+        ends[j] = now
+    return order, starts, ends
+
+def segmented_timings(timings, offsets: np.ndarray, arrivals: np.ndarray,
+                      bursts: np.ndarray) -> Timings:
+    """
+    offsets로 나뉜 여러 워크로드에 timings 함수를 워크로드별로 적용
+    - 반환하는 index는 전체 배열 기준이며, 워크로드 순서대로 이어 붙임
+    """
+    orders, starts, ends = [], [], []
+    for lo, hi in zip(offsets[:-1].tolist(), offsets[1:].tolist()):
+        if lo == hi:
+            continue
+        order, start, end = timings(arrivals[lo:hi], bursts[lo:hi])
+        orders.append(order + lo)
+        starts.append(start)
+        ends.append(end)
+    if not orders:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    return np.concatenate(orders), np.concatenate(starts), np.concatenate(ends)
+
+def fcfs_batch_timings(offsets: np.ndarray, arrivals: np.ndarray, bursts: np.ndarray) -> Timings:
+    """
+    여러 워크로드의 FCFS 스케줄을 워크로드 구분 없이 한 번에 벡터화하여 계산
+    - (워크로드, 도착 시간) stable 정렬 후 워크로드별 누적합과 누적 최대값 사용
+    - 누적 최대값은 워크로드마다 충분히 큰 offset을 더해 구간 간 전파를 막음
+    """
+    counts = np.diff(offsets)
+    workload = np.repeat(np.arange(len(counts)), counts)
+    order = np.lexsort((arrivals, workload))
+    a = arrivals[order].astype(np.int64)
+    b = bursts[order].astype(np.int64)
+    workload = workload[order]
+    if len(order) == 0:
+        return order, a, a
+
+    cumulative = np.cumsum(b)
+    before = np.zeros(len(counts), dtype=np.int64)
+    nonempty = counts > 0
+    before[nonempty] = (cumulative - b)[offsets[:-1][nonempty]]
+    cumulative -= before[workload]
+    relative = a - (cumulative - b)
+
+    span = int(relative.max() - relative.min()) + 1
+    if span * len(counts) >= 2 ** 62:
+        # offset이 int64 범위를 넘으면 워크로드별로 계산
+        return segmented_timings(fcfs_timings, offsets, arrivals, bursts)
+    shift = workload * span
+    ends = cumulative + np.maximum.accumulate(relative + shift) - shift
+    return order, ends - b, ends
@@ -6,6 +6,18 @@ class FCFSScheduler(Scheduler):
     def __init__(self, use_ipc: bool = False):
         super().__init__("FCFS", use_ipc)
     
+    def has_closed_form(self) -> bool:
+        """Non-IPC FCFS는 도착 순 정렬 + 누적합으로 계산 가능"""
+        return not self.use_ipc
+    
+    def closed_form_timings(self, arrivals, bursts):
+        from src.schedulers.closed_form import fcfs_timings
+        return fcfs_timings(arrivals, bursts)
+    
+    def closed_form_batch_timings(self, offsets, arrivals, bursts):
+        from src.schedulers.closed_form import fcfs_batch_timings
+        return fcfs_batch_timings(offsets, arrivals, bursts)
+    
     def get_next_process(self, ready_queue: List[Process]) -> Optional[Process]:
         """FCFS는 큐의 맨 앞에 있는 프로세스를 선택"""
         if not ready_queue:
@@ -14,7 +26,7 @@ class FCFSScheduler(Scheduler):
         if self.use_ipc:
             # IPC 모드에서는 의존성 체크
             for process in ready_queue:
-                if process.can_execute(self.completed_processes):
+                if self.can_execute(process):
                     return process
             return None
         else:
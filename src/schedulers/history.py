@@ -0,0 +1,261 @@
+import os
+import glob
+import queue
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.process import ProcessState
+
+@dataclass
+class ProcessExecution:
+    """프로세스 실행 기록을 저장하는 클래스"""
+    process_id: int
+    start_time: int
+    end_time: int
+    state: ProcessState
+
+# 파일 저장 시 ProcessState를 정수 코드로 변환
+STATE_CODES = {state: code for code, state in enumerate(ProcessState)}
+CODE_STATES = list(ProcessState)
+
+class HistoryStats:
+    """실행 기록을 저장하지 않고 스트리밍으로 성능 지표용 통계를 집계"""
+    def __init__(self):
+        self.first_start: Dict[int, int] = {}
+        self.last_end: Dict[int, int] = {}
+        self.run_time: Dict[int, int] = {}
+        self.busy_time = 0
+        self.count = 0
+
+    def add(self, execution: ProcessExecution):
+        pid = execution.process_id
+        if pid in self.last_end:
+            if execution.end_time > self.last_end[pid]:
+                self.last_end[pid] = execution.end_time
+            if execution.start_time < self.first_start[pid]:
+                self.first_start[pid] = execution.start_time
+        else:
+            self.last_end[pid] = execution.end_time
+            self.first_start[pid] = execution.start_time
+            self.run_time[pid] = 0
+        if execution.state == ProcessState.RUNNING:
+            duration = execution.end_time - execution.start_time
+            self.run_time[pid] += duration
+            self.busy_time += duration
+        self.count += 1
+
+    def add_running(self, process_ids: List[int], start_times: List[int], end_times: List[int]):
+        """RUNNING 구간 여러 개를 한 번에 집계 (빈 통계에 process id가 모두 다르면 dict를 일괄 생성)"""
+        if self.count == 0 and len(set(process_ids)) == len(process_ids):
+            durations = [end - start for start, end in zip(start_times, end_times)]
+            self.first_start = dict(zip(process_ids, start_times))
+            self.last_end = dict(zip(process_ids, end_times))
+            self.run_time = dict(zip(process_ids, durations))
+            self.busy_time = sum(durations)
+            self.count = len(process_ids)
+            return
+        for pid, start, end in zip(process_ids, start_times, end_times):
+            self.add(ProcessExecution(pid, start, end, ProcessState.RUNNING))
+
+class HistorySink(ABC):
+    """스케줄러가 생성하는 실행 기록을 받아 저장하는 sink의 공통 인터페이스"""
+    @abstractmethod
+    def append(self, execution: ProcessExecution):
+        """실행 기록 한 건 추가"""
+        pass
+
+    @abstractmethod
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[List[ProcessExecution]]:
+        """저장된 실행 기록을 chunk 단위로 지연 로딩"""
+        pass
+
+    def extend(self, executions: Iterable[ProcessExecution]):
+        """실행 기록 여러 건 추가"""
+        for execution in executions:
+            self.append(execution)
+
+    def reset(self):
+        """새 스케줄링 실행 전에 이전 기록 삭제"""
+        pass
+
+    def close(self):
+        """스케줄링 종료 후 남은 기록 정리"""
+        pass
+
+    def __iter__(self) -> Iterator[ProcessExecution]:
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+class InMemoryHistorySink(list, HistorySink):
+    """기존 동작과 동일하게 모든 실행 기록을 메모리의 list에 저장"""
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[List[ProcessExecution]]:
+        for i in range(0, len(self), chunk_size):
+            yield self[i:i + chunk_size]
+
+    def reset(self):
+        self.clear()
+
+class NullHistorySink(HistorySink):
+    """실행 기록을 저장하지 않고 listener(스트리밍 지표 등)에만 전달"""
+    def __init__(self, listeners: Optional[List[Callable[[ProcessExecution], None]]] = None):
+        self.listeners = listeners or []
+        self.count = 0
+
+    def append(self, execution: ProcessExecution):
+        self.count += 1
+        for listener in self.listeners:
+            listener(execution)
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[List[ProcessExecution]]:
+        return iter(())
+
+    def reset(self):
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+class ChunkedFileHistorySink(HistorySink):
+    """실행 기록을 열(column) 단위 NPZ chunk 파일로 백그라운드 스레드에서 저장"""
+    def __init__(self, directory: str, chunk_size: int = 65536,
+                 prefix: str = "history", max_pending_chunks: int = 4,
+                 compress: bool = False):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.prefix = prefix
+        self.compress = compress
+        self.max_pending_chunks = max_pending_chunks
+        self.count = 0
+        self._chunk_index = 0
+        self._writer = None
+        self._queue = None
+        self._error = None
+        self._clear_buffer()
+
+    def _clear_buffer(self):
+        self._process_ids = []
+        self._start_times = []
+        self._end_times = []
+        self._states = []
+
+    def _chunk_paths(self) -> List[str]:
+        pattern = os.path.join(self.directory, f"{self.prefix}_*.npz")
+        return sorted(glob.glob(pattern))
+
+    def reset(self):
+        """기존 chunk 파일을 지우고 writer 스레드 시작"""
+        self.close()
+        os.makedirs(self.directory, exist_ok=True)
+        for path in self._chunk_paths():
+            os.remove(path)
+        self.count = 0
+        self._chunk_index = 0
+        self._error = None
+        self._clear_buffer()
+        # chunk 대기열 크기를 제한하여 writer가 느려도 메모리가 무한히 늘지 않도록 함
+        self._queue = queue.Queue(maxsize=self.max_pending_chunks)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def _write_loop(self):
+        import numpy as np
+        save = np.savez_compressed if self.compress else np.savez
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, columns = item
+                save(path,
+                     process_id=np.asarray(columns[0], dtype=np.int64),
+                     start_time=np.asarray(columns[1], dtype=np.int64),
+                     end_time=np.asarray(columns[2], dtype=np.int64),
+                     state=np.asarray(columns[3], dtype=np.int8))
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def append(self, execution: ProcessExecution):
+        if self._writer is None:
+            self.reset()
+        self._process_ids.append(execution.process_id)
+        self._start_times.append(execution.start_time)
+        self._end_times.append(execution.end_time)
+        self._states.append(STATE_CODES[execution.state])
+        self.count += 1
+        if len(self._process_ids) >= self.chunk_size:
+            self._submit_buffer()
+
+    def _submit_buffer(self):
+        if not self._process_ids:
+            return
+        path = os.path.join(self.directory, f"{self.prefix}_{self._chunk_index:06d}.npz")
+        self._chunk_index += 1
+        columns = (self._process_ids, self._start_times, self._end_times, self._states)
+        self._clear_buffer()
+        self._queue.put((path, columns))
+
+    def flush(self):
+        """버퍼에 남은 기록을 파일로 내보내고 writer가 끝날 때까지 대기"""
+        if self._writer is None:
+            return
+        self._submit_buffer()
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def iter_arrays(self) -> Iterator[Dict[str, "np.ndarray"]]:
+        """chunk 파일을 하나씩 numpy 배열(dict)로 읽기"""
+        import numpy as np
+        self.flush()
+        for path in self._chunk_paths():
+            with np.load(path) as data:
+                yield {name: data[name] for name in data.files}
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[List[ProcessExecution]]:
+        chunk = []
+        for arrays in self.iter_arrays():
+            for pid, start, end, state in zip(arrays["process_id"].tolist(),
+                                              arrays["start_time"].tolist(),
+                                              arrays["end_time"].tolist(),
+                                              arrays["state"].tolist()):
+                chunk.append(ProcessExecution(pid, start, end, CODE_STATES[state]))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def __len__(self) -> int:
+        return self.count
+
+def merge_executions(executions: Iterable[ProcessExecution]) -> List[ProcessExecution]:
+    """같은 프로세스의 연속된(끊김 없는) 실행 기록을 하나의 구간으로 병합"""
+    merged = []
+    last = None
+    for execution in executions:
+        if (last is not None and
+            last.process_id == execution.process_id and
+            last.state == execution.state and
+            last.end_time == execution.start_time):
+            last.end_time = execution.end_time
+            continue
+        last = ProcessExecution(
+            process_id=execution.process_id,
+            start_time=execution.start_time,
+            end_time=execution.end_time,
+            state=execution.state
+        )
+        merged.append(last)
+    return merged
@@ -0,0 +1,183 @@
+import json
+import time
+from abc import ABC
+from typing import Dict, List, Optional
+
+# 스케줄러 루프의 측정 단계
+PHASES = ("admission", "select", "execute", "history", "metrics")
+
+class InstrumentationSink(ABC):
+    """계측 결과를 받는 sink (필요한 hook만 구현)"""
+    def on_run_start(self, scheduler):
+        pass
+
+    def on_run_end(self, scheduler, summary: Dict):
+        pass
+
+    def on_metrics(self, scheduler, seconds: float):
+        pass
+
+class SummarySink(InstrumentationSink):
+    """실행별 요약을 메모리에 보관"""
+    def __init__(self):
+        self.summaries: List[Dict] = []
+
+    def on_run_end(self, scheduler, summary: Dict):
+        self.summaries.append(summary)
+
+    def on_metrics(self, scheduler, seconds: float):
+        if self.summaries:
+            self.summaries[-1]["phase_seconds"]["metrics"] += seconds
+
+    @property
+    def last(self) -> Optional[Dict]:
+        return self.summaries[-1] if self.summaries else None
+
+class JSONLinesSink(InstrumentationSink):
+    """실행 요약과 지표 계산 시간을 JSON-lines 파일에 한 줄씩 추가"""
+    def __init__(self, path: str):
+        self.path = path
+
+    def _write(self, record: Dict):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def on_run_end(self, scheduler, summary: Dict):
+        self._write({"event": "run", **summary})
+
+    def on_metrics(self, scheduler, seconds: float):
+        self._write({"event": "metrics", "scheduler": scheduler.__class__.__name__,
+                     "use_ipc": scheduler.use_ipc, "seconds": seconds})
+
+class ProfilerSink(InstrumentationSink):
+    """스케줄링 실행 구간을 cProfile 또는 pyinstrument로 프로파일링"""
+    def __init__(self, kind: str = "cprofile", output_prefix: Optional[str] = None,
+                 print_top: int = 15):
+        if kind not in ("cprofile", "pyinstrument"):
+            raise ValueError(f"Unknown profiler: {kind}")
+        self.kind = kind
+        self.output_prefix = output_prefix
+        self.print_top = print_top
+        self._profiler = None
+        self._runs = 0
+
+    def on_run_start(self, scheduler):
+        if self.kind == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise ImportError("pyinstrument is not installed (pip install pyinstrument)")
+            self._profiler = Profiler()
+            self._profiler.start()
+        else:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def on_run_end(self, scheduler, summary: Dict):
+        if self._profiler is None:
+            return
+        name = f"{scheduler.__class__.__name__}_{'ipc' if scheduler.use_ipc else 'non_ipc'}"
+        self._runs += 1
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+            if self.output_prefix:
+                path = f"{self.output_prefix}_{self._runs:03d}_{name}.html"
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(self._profiler.output_html())
+            else:
+                print(self._profiler.output_text(unicode=True, color=False))
+        else:
+            import pstats
+            self._profiler.disable()
+            if self.output_prefix:
+                self._profiler.dump_stats(f"{self.output_prefix}_{self._runs:03d}_{name}.prof")
+            else:
+                print(f"\n[profile] {name}")
+                pstats.Stats(self._profiler).sort_stats("cumulative").print_stats(self.print_top)
+        self._profiler = None
+
+class Instrumentation:
+    """스케줄러 루프의 단계별 시간과 카운터를 수집 (Scheduler.set_instrumentation으로 활성화)"""
+    def __init__(self, sinks: Optional[List[InstrumentationSink]] = None):
+        self.sinks = sinks if sinks is not None else [SummarySink()]
+        self.reset()
+
+    def reset(self):
+        self.phase_seconds = dict.fromkeys(PHASES, 0.0)
+        self.counters = {
+            "ticks": 0,
+            "idle_ticks": 0,
+            "decisions": 0,
+            "admissions": 0,
+            "completions": 0,
+            "context_switches": 0,
+            "preemptions": 0,
+            "dependency_checks": 0,
+        }
+        self.queue_size_max = 0
+        self.queue_size_sum = 0
+        self._run_started = 0.0
+
+    def observe_queue(self, size: int):
+        self.queue_size_sum += size
+        if size > self.queue_size_max:
+            self.queue_size_max = size
+
+    def start_run(self, scheduler):
+        self.reset()
+        for sink in self.sinks:
+            sink.on_run_start(scheduler)
+        self._run_started = time.perf_counter()
+
+    def end_run(self, scheduler):
+        total = time.perf_counter() - self._run_started
+        summary = self.summary(scheduler, total)
+        for sink in self.sinks:
+            sink.on_run_end(scheduler, summary)
+        return summary
+
+    def record_metrics(self, scheduler, seconds: float):
+        self.phase_seconds["metrics"] += seconds
+        for sink in self.sinks:
+            sink.on_metrics(scheduler, seconds)
+
+    def summary(self, scheduler, total_seconds: float) -> Dict:
+        ticks = self.counters["ticks"]
+        return {
+            "scheduler": scheduler.__class__.__name__,
+            "use_ipc": scheduler.use_ipc,
+            "total_seconds": total_seconds,
+            "phase_seconds": dict(self.phase_seconds),
+            "counters": dict(self.counters),
+            "queue_size_max": self.queue_size_max,
+            "queue_size_avg": self.queue_size_sum / ticks if ticks else 0.0,
+        }
+
+def format_summary(summary: Dict) -> str:
+    """계측 요약을 사람이 읽기 쉬운 문자열로 변환"""
+    mode = "with IPC" if summary["use_ipc"] else "without IPC"
+    lines = [f"{summary['scheduler']} ({mode}): {summary['total_seconds'] * 1000:.2f} ms"]
+    total = summary["total_seconds"] or 1.0
+    for phase, seconds in summary["phase_seconds"].items():
+        lines.append(f"  {phase:<10} {seconds * 1000:10.3f} ms  ({seconds / total * 100:5.1f}%)")
+    counters = summary["counters"]
+    lines.append("  " + ", ".join(f"{name}={value}" for name, value in counters.items()))
+    lines.append(f"  ready queue: max={summary['queue_size_max']}, avg={summary['queue_size_avg']:.2f}")
+    return "\n".join(lines)
+
+def build_instrumentation(mode: str, output: Optional[str] = None) -> Instrumentation:
+    """
+    --profile 옵션 값으로 Instrumentation 생성
+    - summary: 메모리 요약만
+    - jsonl: 요약 + JSON-lines 파일 (output, 기본 profile.jsonl)
+    - cprofile / pyinstrument: 요약 + 프로파일러 (output을 파일 접두어로 사용)
+    """
+    sinks: List[InstrumentationSink] = [SummarySink()]
+    if mode == "jsonl":
+        sinks.append(JSONLinesSink(output or "profile.jsonl"))
+    elif mode in ("cprofile", "pyinstrument"):
+        sinks.append(ProfilerSink(mode, output_prefix=output))
+    elif mode != "summary":
+        raise ValueError(f"Unknown profile mode: {mode}")
+    return Instrumentation(sinks)
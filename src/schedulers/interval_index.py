@@ -0,0 +1,138 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+Intervals = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+class IntervalIndex:
+    """
+    병합된 실행 구간에 대한 정렬 배열 기반 index (한 번 생성 후 query마다 O(log N))
+    - 시간 순 배열 + 끝 시간 누적 최대값: 시점 / 구간 겹침 query
+    - 프로세스별 CSR 배열 + 실행 시간 누적합: 프로세스별 구간, 구간 내 실행 시간
+    - 도착 / 완료 시간 정렬 배열: 시점별 ready queue 길이
+    """
+    def __init__(self, process_ids: np.ndarray, start_times: np.ndarray, end_times: np.ndarray,
+                 arrival_times: Optional[Dict[int, int]] = None):
+        process_ids = np.asarray(process_ids, dtype=np.int64)
+        start_times = np.asarray(start_times)
+        end_times = np.asarray(end_times)
+
+        # 시간 순 배열
+        order = np.argsort(start_times, kind="stable")
+        self.process_ids = process_ids[order]
+        self.start_times = start_times[order]
+        self.end_times = end_times[order]
+        self._max_end = np.maximum.accumulate(self.end_times) if len(order) else self.end_times
+        self._busy_prefix = np.concatenate([[0], np.cumsum(self.end_times - self.start_times)])
+
+        # 프로세스별 CSR 배열 (행 안에서는 시작 시간 순)
+        order = np.lexsort((start_times, process_ids))
+        pids = process_ids[order]
+        self.row_process_ids, row_first = np.unique(pids, return_index=True)
+        self.row_offsets = np.append(row_first, len(pids)).astype(np.int64)
+        self.row_start_times = start_times[order]
+        self.row_end_times = end_times[order]
+        self._row_prefix = np.concatenate([[0], np.cumsum(self.row_end_times - self.row_start_times)])
+        self._row_of = {pid: row for row, pid in enumerate(self.row_process_ids.tolist())}
+
+        # ready queue 길이 계산용 (실행되지 않은 프로세스는 완료되지 않은 것으로 간주)
+        self.arrival_times = dict(arrival_times or {})
+        completions = [self.last_end(pid) for pid in self.arrival_times]
+        self._sorted_arrivals = np.sort(np.array(list(self.arrival_times.values()), dtype=np.float64))
+        self._sorted_completions = np.sort(np.array(
+            [np.inf if end is None else end for end in completions], dtype=np.float64))
+
+    @classmethod
+    def from_history(cls, history, processes=None) -> 'IntervalIndex':
+        """실행 기록(tick 단위 기록, sink, Segments)으로 index 생성 (processes가 있으면 도착 시간 사용)"""
+        if not hasattr(history, "process_ids"):
+            from src.visualizer.segments import Segments
+            history = Segments.from_history(history)
+        arrivals = {p.process_id: p.arrival_time for p in processes} if processes else None
+        return cls(history.process_ids, history.start_times, history.end_times, arrivals)
+
+    def __len__(self) -> int:
+        return len(self.start_times)
+
+    @staticmethod
+    def _clipped_sum(starts: np.ndarray, ends: np.ndarray, prefix: np.ndarray,
+                     lo: int, hi: int, t0: float, t1: float) -> float:
+        """겹치지 않는 정렬된 구간 starts/ends 중 [t0, t1)에 포함되는 길이 (prefix는 lo 기준 누적합)"""
+        first = lo + int(np.searchsorted(ends[lo:hi], t0, side="right"))
+        last = lo + int(np.searchsorted(starts[lo:hi], t1, side="left"))
+        if first >= last:
+            return 0
+        total = prefix[last] - prefix[first]
+        total -= max(0, t0 - starts[first])
+        total -= max(0, ends[last - 1] - t1)
+        return total
+
+    def running_at(self, t: float) -> np.ndarray:
+        """시점 t에 실행 중인 프로세스 id (start <= t < end)"""
+        lo = int(np.searchsorted(self._max_end, t, side="right"))
+        hi = int(np.searchsorted(self.start_times, t, side="right"))
+        return self.process_ids[lo:hi][self.end_times[lo:hi] > t]
+
+    def overlapping(self, t0: float, t1: float) -> Intervals:
+        """[t0, t1)과 겹치는 구간들의 (process_id, start, end)"""
+        lo = int(np.searchsorted(self._max_end, t0, side="right"))
+        hi = int(np.searchsorted(self.start_times, t1, side="left"))
+        mask = self.end_times[lo:hi] > t0
+        return (self.process_ids[lo:hi][mask], self.start_times[lo:hi][mask],
+                self.end_times[lo:hi][mask])
+
+    def busy_time(self, t0: float, t1: float) -> float:
+        """[t0, t1) 동안 CPU가 실행한 시간 (구간이 서로 겹치지 않는 단일 CPU 기록 기준)"""
+        return self._clipped_sum(self.start_times, self.end_times, self._busy_prefix,
+                                 0, len(self), t0, t1)
+
+    def _row(self, process_id: int) -> Tuple[int, int]:
+        row = self._row_of.get(process_id)
+        if row is None:
+            return 0, 0
+        return int(self.row_offsets[row]), int(self.row_offsets[row + 1])
+
+    def process_intervals(self, process_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """프로세스의 실행 구간 (start, end) 배열"""
+        lo, hi = self._row(process_id)
+        return self.row_start_times[lo:hi], self.row_end_times[lo:hi]
+
+    def first_start(self, process_id: int) -> Optional[float]:
+        lo, hi = self._row(process_id)
+        return self.row_start_times[lo] if hi > lo else None
+
+    def last_end(self, process_id: int) -> Optional[float]:
+        lo, hi = self._row(process_id)
+        return self.row_end_times[hi - 1] if hi > lo else None
+
+    def run_time(self, process_id: int, t0: float = -np.inf, t1: float = np.inf) -> float:
+        """[t0, t1) 동안 프로세스가 실행된 시간"""
+        lo, hi = self._row(process_id)
+        return self._clipped_sum(self.row_start_times, self.row_end_times, self._row_prefix,
+                                 lo, hi, t0, t1)
+
+    def ready_time(self, process_id: int, t0: float = -np.inf, t1: float = np.inf) -> float:
+        """[t0, t1) 동안 도착 후 완료 전이었지만 실행되지 않은 시간 (도착 시간 필요)"""
+        arrival = self.arrival_times[process_id]
+        end = self.last_end(process_id)
+        window_start = max(t0, arrival)
+        window_end = min(t1, np.inf if end is None else end)
+        if window_end <= window_start:
+            return 0
+        return (window_end - window_start) - self.run_time(process_id, window_start, window_end)
+
+    def queue_depth(self, t: float) -> int:
+        """시점 t의 ready queue 길이 (도착했고 아직 완료되지 않은 프로세스 수, 실행 중인 프로세스 포함)"""
+        arrived = int(np.searchsorted(self._sorted_arrivals, t, side="right"))
+        completed = int(np.searchsorted(self._sorted_completions, t, side="right"))
+        return arrived - completed
+
+    def row_run_times(self) -> np.ndarray:
+        """프로세스(row_process_ids 순서)별 총 실행 시간"""
+        return self._row_prefix[self.row_offsets[1:]] - self._row_prefix[self.row_offsets[:-1]]
+
+    def row_last_ends(self) -> np.ndarray:
+        """프로세스(row_process_ids 순서)별 마지막 실행 종료 시간"""
+        if not len(self.row_process_ids):
+            return self.row_end_times[:0]
+        return self.row_end_times[self.row_offsets[1:] - 1]
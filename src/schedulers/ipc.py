@@ -4,7 +4,7 @@ from src.process import Process, ProcessState
 
 class IPCScheduler(Scheduler):
     def __init__(self):
-        super().__init__("IPC")
+        super().__init__("IPC", use_ipc=True)
         self.dependency_graph: Dict[int, Set[int]] = {}  # process_id -> set of dependent process ids
         self.process_info: Dict[int, Process] = {}  # process_id -> Process object
         
@@ -51,7 +51,7 @@ class IPCScheduler(Scheduler):
         # 실행 가능한 프로세스들 찾기
         eligible_processes = [
             p for p in ready_queue 
-            if p.can_execute(self.completed_processes)
+            if self.can_execute(p)
         ]
         
         if not eligible_processes:
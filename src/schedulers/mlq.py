@@ -1,11 +1,30 @@
 from typing import List, Optional, Dict
 from src.schedulers.base import Scheduler, ProcessExecution
+from src.schedulers.aging import Aging
 from src.process import Process, ProcessState, QueueLevel, QueueType
 
+# level aging에 사용하는 레벨별 기본 우선순위 (작을수록 높음)
+_LEVEL_RANK = {QueueLevel.A: 1, QueueLevel.B: 2, QueueLevel.C: 3}
+
 class MLQScheduler(Scheduler):
+    """
+    다단계 큐 스케줄러 (레벨별로 queue_algorithms의 알고리즘 적용)
+    - 기본값은 레벨 A -> B -> C 엄격한 우선순위
+    - level_shares: 레벨별 CPU 점유 비율 (예: {"A": 6, "B": 3, "C": 1}), stride 방식으로
+      프로세스가 있는 레벨 중 pass가 가장 작은 레벨을 골라 slice(time_quantum, 또는 그 프로세스가 끝나거나
+      실행할 수 없게 될 때까지) 동안 유지하고, slice가 끝나면 해당 레벨 pass += 사용한 tick / share
+    - aging: 레벨 우선순위(A=1, B=2, C=3)를 레벨이 마지막으로 실행된 뒤 기다린 시간만큼 높임 (Aging 참고),
+      aging으로 선택된 레벨은 그때 실행한 프로세스가 끝나거나 바뀔 때까지 선택 시점의 key를 유지
+    """
     def __init__(self, time_quantum: int = None, use_ipc: bool = False, 
-                queue_algorithms: Dict[str, str] = None):
+                queue_algorithms: Dict[str, str] = None,
+                level_shares: Optional[Dict[str, float]] = None, aging: Optional[str] = None,
+                aging_rate: float = 0.1, aging_half_life: float = 50):
         super().__init__("Multi-Level Queue", use_ipc)
+        if level_shares and aging:
+            raise ValueError("level_shares and aging cannot be used together")
+        if level_shares and any(share <= 0 for share in level_shares.values()):
+            raise ValueError("level_shares must be positive")
         self.time_quantum = time_quantum
         self.current_process = None
         # 각 레벨별 상태 관리
@@ -24,6 +43,87 @@ class MLQScheduler(Scheduler):
             "B": "FCFS",
             "C": "SJF"
         }
+        self.level_shares = dict(level_shares) if level_shares else None
+        self.aging = aging
+        self.aging_rate = aging_rate
+        self.aging_half_life = aging_half_life
+        self._aging = Aging(aging, aging_rate, aging_half_life) if aging else None
+        self._init_level_state()
+
+    def get_params(self) -> Dict:
+        return {"time_quantum": self.time_quantum, "queue_algorithms": dict(self.queue_algorithms),
+                "level_shares": dict(self.level_shares) if self.level_shares else None,
+                "aging": self.aging, "aging_rate": self.aging_rate, "aging_half_life": self.aging_half_life}
+
+    def _init_level_state(self):
+        self._pass = {level: 0.0 for level in QueueLevel}  # level_shares의 레벨별 pass
+        self._slice = None  # level_shares: [실행 중인 레벨, 프로세스, 사용한 tick]
+        self._since = {level: 0 for level in QueueLevel}  # aging의 레벨별 대기 시작 시간
+        self._active = set()  # 직전 결정 시점에 프로세스가 있던 레벨
+        self._earned = None  # aging: (실행 중인 레벨, 프로세스, 선택 시점의 대기 시작 시간)
+
+    def reset_run(self, processes: List[Process]):
+        super().reset_run(processes)
+        self._init_level_state()
+
+    def _level_order(self) -> List[QueueLevel]:
+        """프로세스가 있는 레벨을 실행을 시도할 순서로 정렬 (같은 값이면 A -> B -> C)"""
+        levels = [level for level in QueueLevel if self.queues[level]]
+        if self.level_shares:
+            if self._slice is not None and not self._slice_continues():
+                self._close_slice()
+            # 다시 프로세스가 생긴 레벨은 비어 있던 동안의 몫을 쌓아두지 않도록 pass를 다른 레벨 최소값 이상으로 맞춤
+            floor = min((self._pass[level] for level in self._active), default=None)
+            for level in levels:
+                if level not in self._active and floor is not None:
+                    self._pass[level] = max(self._pass[level], floor)
+            order = sorted(levels, key=lambda level: self._pass[level])
+            if self._slice is not None:
+                # slice가 남은 레벨을 먼저 시도
+                order.remove(self._slice[0])
+                order.insert(0, self._slice[0])
+        elif self._aging is not None:
+            for level in levels:
+                if level not in self._active:
+                    self._since[level] = self.current_time
+            order = sorted(levels, key=lambda level: self._aging.key(_LEVEL_RANK[level], self._aging_since(level)))
+        else:
+            order = levels
+        self._active = set(levels)
+        return order
+
+    def _slice_continues(self) -> bool:
+        level, process, used = self._slice
+        return (used < (self.time_quantum or 1)
+                and any(p is process for p in self.queues[level])
+                and (not self.use_ipc or self.can_execute(process)))
+
+    def _close_slice(self):
+        level, _, used = self._slice
+        self._pass[level] += used / self.level_shares.get(level.value, 1)
+        self._slice = None
+
+    def _aging_since(self, level: QueueLevel) -> int:
+        """실행 중인 프로세스가 남아 있는 레벨은 선택 시점의 대기 시작 시간 사용"""
+        earned = self._earned
+        if earned is not None and earned[0] == level and any(p is earned[1] for p in self.queues[level]):
+            return earned[2]
+        return self._since[level]
+
+    def _charge_level(self, level: QueueLevel, process: Process):
+        """이번 tick에 실행한 레벨의 pass / 대기 시작 시간 갱신"""
+        if self.level_shares:
+            if self._slice is not None and self._slice[0] == level and self._slice[1] is process:
+                self._slice[2] += 1
+            else:
+                if self._slice is not None:
+                    self._close_slice()
+                self._slice = [level, process, 1]
+        elif self._aging is not None:
+            earned = self._earned
+            if earned is None or earned[0] != level or earned[1] is not process:
+                self._earned = (level, process, self._aging_since(level))
+            self._since[level] = self.current_time + 1
 
     def update_queues(self, ready_queue: List[Process]):
         """ready_queue의 프로세스들을 각각의 레벨 큐로 분류"""
@@ -41,7 +141,7 @@ class MLQScheduler(Scheduler):
             # FCFS 로직
             if self.use_ipc:
                 for process in queue:
-                    if process.can_execute(self.completed_processes):
+                    if self.can_execute(process):
                         return process
                 return None
             return queue[0]
@@ -50,13 +150,13 @@ class MLQScheduler(Scheduler):
             # SJF 로직 - level_states 사용
             state = self.level_states[level]
             if state["current_process"] and state["current_process"] in queue:
-                if self.use_ipc and not state["current_process"].can_execute(self.completed_processes):
+                if self.use_ipc and not self.can_execute(state["current_process"]):
                     state["current_process"] = None
                 else:
                     return state["current_process"]
                     
             if self.use_ipc:
-                eligible_processes = [p for p in queue if p.can_execute(self.completed_processes)]
+                eligible_processes = [p for p in queue if self.can_execute(p)]
                 if not eligible_processes:
                     return None
                 shortest_process = min(eligible_processes, key=lambda p: p.remaining_time)
@@ -85,7 +185,7 @@ class MLQScheduler(Scheduler):
                     process = queue[0]
                     queue.append(queue.pop(0))
                     
-                    if not self.use_ipc or process.can_execute(self.completed_processes):
+                    if not self.use_ipc or self.can_execute(process):
                         state["current_process"] = process
                         state["current_quantum"] = 0
                         return process
@@ -99,7 +199,7 @@ class MLQScheduler(Scheduler):
         """MLQ 방식으로 다음 실행할 프로세스를 선택"""
         self.update_queues(ready_queue)
         
-        for level in QueueLevel:
+        for level in self._level_order():
             if self.queues[level]:
                 algorithm = self.queue_algorithms[level.value]
                 next_process = self.get_next_process_by_algorithm(
@@ -108,6 +208,7 @@ class MLQScheduler(Scheduler):
                     level
                 )
                 if next_process:
+                    self._charge_level(level, next_process)
                     return next_process
         
         return None
\ No newline at end of file
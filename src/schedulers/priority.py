@@ -1,19 +1,53 @@
-from typing import List, Optional
+import heapq
+import itertools
+from typing import Dict, List, Optional
 from src.schedulers.base import Scheduler, ProcessExecution
+from src.schedulers.aging import Aging
 from src.process import Process, ProcessState
 
 class PriorityScheduler(Scheduler):
-    def __init__(self, use_ipc: bool = False):
+    """
+    선점형 우선순위 스케줄러 (priority 값이 작을수록 먼저 실행)
+    - aging("linear" / "exponential")을 지정하면 ready 상태로 기다린 시간만큼 유효 우선순위가 높아져
+      낮은 우선순위 프로세스도 무한히 기다리지 않음 (Aging 참고)
+    - aging 모드의 대기 프로세스는 (대기 시작 시간 기반 key, 도착 순) heap에 두고,
+      실행 중인 프로세스는 선택될 때까지 쌓은 key를 유지하여 heap 최상위 key가 더 작을 때만 선점
+      (선점되면 같은 key로 heap에 돌아감)
+    """
+    def __init__(self, use_ipc: bool = False, aging: Optional[str] = None,
+                 aging_rate: float = 0.1, aging_half_life: float = 50):
         super().__init__("Priority", use_ipc)
         self.current_process = None
-    
+        self.aging = aging
+        self.aging_rate = aging_rate
+        self.aging_half_life = aging_half_life
+        self._aging = Aging(aging, aging_rate, aging_half_life) if aging else None
+        self._init_state()
+
+    def get_params(self) -> Dict:
+        return {"aging": self.aging, "aging_rate": self.aging_rate, "aging_half_life": self.aging_half_life}
+
+    def _init_state(self):
+        self._queue_len = 0  # 직전 결정 시점의 ready queue 길이 (새로 추가된 프로세스 판별용)
+        self._seq = itertools.count()
+        self._heap = []  # (aging key, 순서, 프로세스), 실행 중인 프로세스는 빠져 있음
+        self._current: Optional[Process] = None
+        self._current_key = 0.0  # 실행 중인 프로세스가 선택될 때의 key
+
+    def reset_run(self, processes: List[Process]):
+        super().reset_run(processes)
+        self._init_state()
+
     def get_next_process(self, ready_queue: List[Process]) -> Optional[Process]:
+        if self._aging is not None:
+            return self._get_next_aged(ready_queue)
+
         if not ready_queue:
             return None
             
         if self.use_ipc:
             # IPC 모드
-            eligible_processes = [p for p in ready_queue if p.can_execute(self.completed_processes)]
+            eligible_processes = [p for p in ready_queue if self.can_execute(p)]
             if not eligible_processes:
                 return None
             highest_priority_process = min(eligible_processes, key=lambda p: p.priority)
@@ -27,4 +61,65 @@ class PriorityScheduler(Scheduler):
             return self.current_process
             
         self.current_process = highest_priority_process
-        return highest_priority_process
\ No newline at end of file
+        return highest_priority_process
+
+    def on_process_dropped(self, process: Process):
+        if self._aging is None:
+            return
+        if process is self._current:
+            self._current = None
+        else:
+            index = next((i for i, entry in enumerate(self._heap) if entry[2] is process), None)
+            if index is None:
+                return  # 이번 tick에 추가되어 아직 읽지 않은 프로세스
+            self._heap[index] = self._heap[-1]
+            self._heap.pop()
+            heapq.heapify(self._heap)
+        self._queue_len -= 1
+
+    def _push(self, process: Process, since: int):
+        heapq.heappush(self._heap, (self._aging.key(process.priority, since), next(self._seq), process))
+
+    def _pop_eligible(self) -> Optional[tuple]:
+        """key가 가장 작은 실행 가능 항목을 heap에서 꺼냄 (의존성 대기 중인 항목은 그대로 둠)"""
+        skipped = []
+        entry = None
+        while self._heap:
+            candidate = heapq.heappop(self._heap)
+            if self.can_execute(candidate[2]):
+                entry = candidate
+                break
+            skipped.append(candidate)
+        for candidate in skipped:
+            heapq.heappush(self._heap, candidate)
+        return entry
+
+    def _get_next_aged(self, ready_queue: List[Process]) -> Optional[Process]:
+        now = self.current_time
+        current = self._current
+        removed = 0
+        # 채널 모델에서 메시지를 쓰는 중이면 TERMINATED 대신 WAITING이므로 남은 실행 시간으로 판단
+        if current is not None and current.remaining_time == 0:
+            current = None
+            removed = 1  # 완료된 프로세스는 엔진이 ready queue에서 제거함
+
+        # ready queue 끝에 새로 추가된 프로세스는 지금부터 대기 시작
+        added = len(ready_queue) - (self._queue_len - removed)
+        for process in ready_queue[len(ready_queue) - added:]:
+            self._push(process, now)
+        self._queue_len = len(ready_queue)
+
+        entry = self._pop_eligible()
+        if current is None:
+            if entry is not None:
+                self._current_key, _, current = entry
+        elif entry is not None:
+            # 실행 중에도 대기하며 쌓은 key를 유지 (바로 기본 우선순위로 돌아가 1 tick만에 선점되지 않도록)
+            if entry[0] < self._current_key:
+                heapq.heappush(self._heap, (self._current_key, next(self._seq), current))
+                self._current_key, _, current = entry
+            else:
+                heapq.heappush(self._heap, entry)
+
+        self._current = current
+        return current
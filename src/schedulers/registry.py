@@ -0,0 +1,56 @@
+import functools
+import importlib
+from typing import Callable, Dict, List, Tuple, Type
+
+DEFAULT_TIME_QUANTUM = 4
+DEFAULT_MLQ_ALGORITHMS = {"A": "RR", "B": "FCFS", "C": "SJF"}
+
+# 스케줄러 이름 -> (모듈 경로, 클래스 이름, 기본 생성 인자), 모듈은 처음 사용할 때 import
+_REGISTRY: Dict[str, Tuple[str, str, Dict]] = {}
+
+def register_scheduler(name: str, module: str, class_name: str, **defaults):
+    """스케줄러 등록 (모듈을 import하지 않으므로 등록 비용 없음)"""
+    _REGISTRY[name] = (module, class_name, defaults)
+
+register_scheduler("FCFS", "src.schedulers.fcfs", "FCFSScheduler")
+register_scheduler("SJF", "src.schedulers.sjf", "SJFScheduler")
+register_scheduler("RR", "src.schedulers.round_robin", "RoundRobinScheduler",
+                   time_quantum=DEFAULT_TIME_QUANTUM)
+register_scheduler("Priority", "src.schedulers.priority", "PriorityScheduler", aging=None)
+register_scheduler("MLQ", "src.schedulers.mlq", "MLQScheduler",
+                   time_quantum=DEFAULT_TIME_QUANTUM, queue_algorithms=DEFAULT_MLQ_ALGORITHMS,
+                   level_shares=None, aging=None)
+register_scheduler("CFS", "src.schedulers.cfs", "CFSScheduler")
+
+def available_schedulers() -> List[str]:
+    return list(_REGISTRY)
+
+def resolve_name(name: str) -> str:
+    """등록된 이름으로 변환 (대소문자 무시)"""
+    if name in _REGISTRY:
+        return name
+    for registered in _REGISTRY:
+        if registered.lower() == name.lower():
+            return registered
+    raise ValueError(f"Unknown scheduler: {name} (available: {', '.join(_REGISTRY)})")
+
+def _lookup(name: str) -> Tuple[str, str, Dict]:
+    return _REGISTRY[resolve_name(name)]
+
+def default_params(name: str) -> Dict:
+    """등록된 기본 생성 인자 (use_ipc 제외)"""
+    return dict(_lookup(name)[2])
+
+def get_scheduler_class(name: str) -> Type:
+    module, class_name, _ = _lookup(name)
+    return getattr(importlib.import_module(module), class_name)
+
+def create_scheduler(name: str, use_ipc: bool = False, **params):
+    """등록된 기본 인자에 params를 덮어써서 스케줄러 생성"""
+    _, _, defaults = _lookup(name)
+    return get_scheduler_class(name)(use_ipc=use_ipc, **{**defaults, **params})
+
+def scheduler_factory(name: str, use_ipc: bool = False, **params) -> Callable:
+    """pickle 가능한 인자 없는 생성 함수 (worker 프로세스로 전달 가능)"""
+    _lookup(name)
+    return functools.partial(create_scheduler, name, use_ipc=use_ipc, **params)
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import random
+from typing import Dict, List, Optional
 from src.schedulers.base import Scheduler, ProcessExecution
 from src.process import Process, ProcessState
 
@@ -9,6 +10,9 @@ class RoundRobinScheduler(Scheduler):
         self.current_process = None
         self.current_quantum = 0
     
+    def get_params(self) -> Dict:
+        return {"time_quantum": self.time_quantum}
+    
     def get_next_process(self, ready_queue: List[Process]) -> Optional[Process]:
         if not ready_queue:
             return None
@@ -28,7 +32,7 @@ class RoundRobinScheduler(Scheduler):
                 # 실행 가능한 프로세스 찾기
                 for _ in range(len(ready_queue)):
                     process = ready_queue[0]
-                    if process.can_execute(self.completed_processes):
+                    if self.can_execute(process):
                         self.current_process = process
                         self.current_quantum = 0
                         return process
@@ -7,20 +7,28 @@ class SJFScheduler(Scheduler):
         super().__init__("SJF", use_ipc)
         self.current_process = None
     
+    def has_closed_form(self) -> bool:
+        """Non-IPC SJF는 heap으로 계산 가능 (이전 실행의 current_process가 남아 있으면 tick 루프 사용)"""
+        return not self.use_ipc and self.current_process is None
+    
+    def closed_form_timings(self, arrivals, bursts):
+        from src.schedulers.closed_form import sjf_timings
+        return sjf_timings(arrivals, bursts)
+    
     def get_next_process(self, ready_queue: List[Process]) -> Optional[Process]:
         if not ready_queue:
             return None
             
         # 현재 실행 중인 프로세스가 있다면 계속 실행
         if self.current_process and self.current_process in ready_queue:
-            if self.use_ipc and not self.current_process.can_execute(self.completed_processes):
+            if self.use_ipc and not self.can_execute(self.current_process):
                 self.current_process = None
             else:
                 return self.current_process
             
         if self.use_ipc:
             # IPC 모드
-            eligible_processes = [p for p in ready_queue if p.can_execute(self.completed_processes)]
+            eligible_processes = [p for p in ready_queue if self.can_execute(p)]
             if not eligible_processes:
                 return None
             shortest_process = min(eligible_processes, key=lambda p: p.remaining_time)
@@ -0,0 +1,168 @@
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.process import Process, QueueLevel
+
+class TimeSeriesBuffer:
+    """
+    고정 크기 bucket 배열에 시계열을 누적 (메모리는 capacity에 비례, 실행 길이와 무관)
+    - bucket 하나는 bucket_width tick의 합계 / 최대값 / 개수를 보관
+    - bucket이 가득 차면 인접한 두 bucket을 합쳐 해상도를 절반으로 낮춤 (bucket_width 2배)
+    """
+    def __init__(self, capacity: int = 1024):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity - capacity % 2
+        self.reset()
+
+    def reset(self):
+        self.bucket_width = 1
+        self.start_time: Optional[int] = None
+        self.size = 0
+        self._sums: List[float] = [0.0] * self.capacity
+        self._maxs: List[float] = [float("-inf")] * self.capacity
+        self._counts: List[int] = [0] * self.capacity
+
+    def _compact(self):
+        """인접 bucket 쌍을 병합하여 bucket 수를 절반으로 줄임"""
+        half = self.capacity // 2
+        sums, maxs, counts = self._sums, self._maxs, self._counts
+        for i in range(half):
+            a, b = 2 * i, 2 * i + 1
+            sums[i] = sums[a] + sums[b]
+            maxs[i] = max(maxs[a], maxs[b])
+            counts[i] = counts[a] + counts[b]
+        for i in range(half, self.capacity):
+            sums[i] = 0.0
+            maxs[i] = float("-inf")
+            counts[i] = 0
+        self.size = (self.size + 1) // 2
+        self.bucket_width *= 2
+
+    def add(self, time: int, value: float):
+        if self.start_time is None:
+            self.start_time = time
+        bucket = (time - self.start_time) // self.bucket_width
+        while bucket >= self.capacity:
+            self._compact()
+            bucket = (time - self.start_time) // self.bucket_width
+        self._sums[bucket] += value
+        if value > self._maxs[bucket]:
+            self._maxs[bucket] = value
+        self._counts[bucket] += 1
+        if bucket >= self.size:
+            self.size = bucket + 1
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """값이 있는 bucket의 (시작 시간, 평균, 최대값)"""
+        counts = np.array(self._counts[:self.size], dtype=np.float64)
+        filled = counts > 0
+        start = self.start_time or 0
+        times = start + np.arange(self.size) * self.bucket_width
+        means = np.divide(np.array(self._sums[:self.size]), counts,
+                          out=np.zeros(self.size), where=filled)
+        maxs = np.array(self._maxs[:self.size])
+        return times[filled], means[filled], maxs[filled]
+
+class Telemetry:
+    """
+    스케줄러 루프에서 tick마다 부하 지표를 수집하여 TimeSeriesBuffer로 보관
+    - ready_<level>: QueueLevel별 ready queue 길이 (실행 중인 프로세스 포함)
+    - blocked: IPC 모드에서 의존성이 완료되지 않아 (채널 모델에서는 선행 메시지가 아직 도착하지 않아)
+      실행할 수 없는 ready 프로세스 수
+    - throughput / utilization: 최근 window tick 동안의 완료 수 / CPU 사용 비율
+    """
+    def __init__(self, capacity: int = 1024, window: int = 50):
+        self.capacity = capacity
+        self.window = window
+        self.reset()
+
+    def reset(self, channels: Optional["ChannelModel"] = None, track_dependencies: bool = False):
+        """
+        실행 시작 시 초기화
+        - channels가 있으면 메시지 대기, track_dependencies가 True이면 의존성 대기를 blocked로 집계
+        """
+        names = [f"ready_{level.value}" for level in QueueLevel]
+        names += ["ready_total", "blocked", "throughput", "utilization"]
+        self.series: Dict[str, TimeSeriesBuffer] = {name: TimeSeriesBuffer(self.capacity) for name in names}
+        self._level_names = {level: f"ready_{level.value}" for level in QueueLevel}
+        self._recent = deque(maxlen=self.window)
+        self._recent_busy = 0
+        self._recent_completed = 0
+        # ready queue 상태는 enqueue / remove / 완료 / 메시지 도착 시 증분 갱신 (tick마다 queue를 훑지 않음)
+        self._channels = channels
+        self._track_dependencies = track_dependencies and channels is None
+        self._counts: Dict[str, int] = dict.fromkeys(self._level_names.values(), 0)
+        self._total = 0
+        self._completed: set = set()
+        self._missing: Dict[int, int] = {}  # 실행할 수 없는 ready 프로세스 id -> 남은 선행 (메시지) 수
+        self._waiters: Dict[int, List[int]] = {}  # 선행 process id -> 완료를 기다리는 ready 프로세스 id
+
+    def enqueue(self, process: Process):
+        """프로세스가 ready queue에 추가될 때 호출"""
+        self._counts[self._level_names[process.queue_level]] += 1
+        self._total += 1
+        pid = process.process_id
+        if self._channels is not None:
+            pending = self._channels.pending.get(pid, 0)
+            if pending:
+                self._missing[pid] = pending
+        elif self._track_dependencies:
+            missing = [dep for dep in process.dependencies if dep not in self._completed]
+            if missing:
+                self._missing[pid] = len(missing)
+                for dep in missing:
+                    self._waiters.setdefault(dep, []).append(pid)
+
+    def remove(self, process: Process):
+        """프로세스가 ready queue에서 빠질 때 (완료 / drop) 호출"""
+        self._counts[self._level_names[process.queue_level]] -= 1
+        self._total -= 1
+        self._missing.pop(process.process_id, None)
+
+    def complete(self, process_id: int):
+        """프로세스 완료 시 호출 (의존성 대기 중인 후행 프로세스 갱신)"""
+        if not self._track_dependencies:
+            return
+        self._completed.add(process_id)
+        for waiter in self._waiters.pop(process_id, ()):
+            self._release(waiter)
+
+    def deliver(self, receiver_id: int):
+        """채널 모델에서 메시지가 도착하면 호출"""
+        if self._channels is not None:
+            self._release(receiver_id)
+
+    def _release(self, process_id: int):
+        remaining = self._missing.get(process_id)
+        if remaining is None:
+            return
+        if remaining == 1:
+            del self._missing[process_id]
+        else:
+            self._missing[process_id] = remaining - 1
+
+    def sample_queue(self, time: int):
+        """도착 처리 직후의 ready queue 상태 기록"""
+        for name, count in self._counts.items():
+            self.series[name].add(time, count)
+        self.series["ready_total"].add(time, self._total)
+        self.series["blocked"].add(time, len(self._missing))
+
+    def end_tick(self, time: int, busy: bool, completed: int):
+        """tick 종료 시 실행 여부와 완료 수를 window에 반영"""
+        if len(self._recent) == self._recent.maxlen:
+            old_busy, old_completed = self._recent[0]
+            self._recent_busy -= old_busy
+            self._recent_completed -= old_completed
+        self._recent.append((busy, completed))
+        self._recent_busy += busy
+        self._recent_completed += completed
+        span = len(self._recent)
+        self.series["throughput"].add(time, self._recent_completed / span)
+        self.series["utilization"].add(time, self._recent_busy / span * 100)
+
+    def arrays(self, name: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.series[name].arrays()
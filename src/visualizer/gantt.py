@@ -1,16 +1,24 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from src.schedulers.base import ProcessExecution
 from src.process import ProcessState
+from src.visualizer.layout import create_panel_grid
+from src.visualizer.segments import Segments, axes_pixel_width, label_mask, segment_collection
 
 class GanttVisualizer:
-    def __init__(self):
+    def __init__(self, dpi: int = 300, label_min_points: float = 14, max_cols: int = 5):
         self.colors = plt.cm.get_cmap('Set3')
+        self.dpi = dpi
+        self.max_cols = max_cols
+        self.label_min_points = label_min_points
         
-    def _create_process_color_map(self, executions: List[ProcessExecution]) -> Dict[int, str]:
+    def _create_process_color_map(self, segments_list: Iterable[Segments]) -> Dict[int, str]:
         """각 프로세스에 고유한 색상 할당"""
-        process_ids = sorted(set(exe.process_id for exe in executions))
+        process_ids = set()
+        for segments in segments_list:
+            process_ids.update(segments.unique_process_ids().tolist())
+        process_ids = sorted(process_ids)
         return {
             pid: self.colors(i / len(process_ids))
             for i, pid in enumerate(process_ids)
@@ -18,30 +26,36 @@ class GanttVisualizer:
     
     def plot_single_scheduler(self, 
                             ax: plt.Axes,
-                            executions: List[ProcessExecution],
+                            executions: Iterable[ProcessExecution],
                             scheduler_name: str,
                             process_colors: Dict[int, str]):
-        """한 스케줄러의 Gantt Chart 그리기"""
-        current_time = 0
-        y_position = 0
-        
-        # 각 실행 구간을 막대로 표시
-        for execution in executions:
-            if execution.state == ProcessState.RUNNING:
-                ax.barh(y_position,
-                       execution.end_time - execution.start_time,
-                       left=execution.start_time,
-                       color=process_colors[execution.process_id],
-                       edgecolor='black')
-                
-                # 프로세스 ID 표시
-                ax.text(execution.start_time,
-                       y_position,
-                       f'P{execution.process_id}',
-                       ha='left',
-                       va='center')
-                
-            current_time = max(current_time, execution.end_time)
+        """한 스케줄러의 Gantt Chart 그리기 (모든 실행 구간을 axes당 하나의 collection으로 표시)"""
+        segments = Segments.from_history(executions)
+        current_time = segments.max_time
+        
+        # 해상도보다 구간이 많으면 픽셀 단위로 down-sampling
+        pixel_width = axes_pixel_width(ax, self.dpi)
+        segments = segments.downsample(0, current_time, pixel_width)
+        draw_edges = len(segments) <= pixel_width / 4
+        
+        # 모든 실행 구간을 하나의 collection으로 표시
+        ax.add_collection(segment_collection(
+            segments,
+            np.zeros(len(segments)),
+            0.8,
+            [process_colors[pid] for pid in segments.process_ids.tolist()],
+            draw_edges
+        ))
+        
+        # 화면상 라벨 폭(label_min_points)보다 넓은 구간에만 프로세스 ID 표시
+        time_per_pixel = current_time / pixel_width if current_time else 0
+        min_pixels = self.label_min_points * self.dpi / 72
+        for i in np.flatnonzero(label_mask(segments, time_per_pixel, min_pixels)):
+            ax.text(segments.start_times[i],
+                   0,
+                   f'P{segments.process_ids[i]}',
+                   ha='left',
+                   va='center')
         
         # 축 설정
         ax.set_xlim(0, current_time)
@@ -62,15 +76,13 @@ class GanttVisualizer:
         if n_schedulers == 1:
             axs = [axs]
         
-        # 모든 실행 기록을 합쳐서 프로세스별 색상 맵 생성
-        all_executions = []
-        for executions, _ in results.values():
-            all_executions.extend(executions)
-        process_colors = self._create_process_color_map(all_executions)
+        # 실행 기록을 한 번씩만 병합된 구간으로 변환한 뒤 프로세스별 색상 맵 생성
+        segments = {name: Segments.from_history(executions) for name, (executions, _) in results.items()}
+        process_colors = self._create_process_color_map(segments.values())
         
         # 각 스케줄러의 Gantt Chart 그리기
-        for (scheduler_name, (executions, metrics)), ax in zip(results.items(), axs):
-            self.plot_single_scheduler(ax, executions, scheduler_name, process_colors)
+        for (scheduler_name, (_, metrics)), ax in zip(results.items(), axs):
+            self.plot_single_scheduler(ax, segments[scheduler_name], scheduler_name, process_colors)
             
             # 성능 지표 텍스트 추가
             metrics_text = (
@@ -87,7 +99,7 @@ class GanttVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight', dpi=300)
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
             plt.close()
         else:
             plt.show()
@@ -96,27 +108,29 @@ class GanttVisualizer:
                                    ipc_results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
                                    non_ipc_results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
                                    save_path: str = None):
-        """IPC와 Non-IPC 버전의 스케줄러 결과를 2x5 그리드로 시각화"""
-        fig, axs = plt.subplots(2, 5, figsize=(25, 8))
-        
-        # 모든 실행 기록을 합쳐서 프로세스별 색상 맵 생성
-        all_executions = []
-        for results in [ipc_results, non_ipc_results]:
-            for executions, _ in results.values():
-                all_executions.extend(executions)
-        process_colors = self._create_process_color_map(all_executions)
+        """IPC와 Non-IPC 버전의 스케줄러 결과를 스케줄러 수에 맞는 그리드로 시각화"""
+        fig, (ipc_axes, non_ipc_axes) = create_panel_grid(
+            [len(ipc_results), len(non_ipc_results)],
+            max_cols=self.max_cols,
+            panel_size=(5, 4)
+        )
+        
+        # 실행 기록을 한 번씩만 병합된 구간으로 변환한 뒤 프로세스별 색상 맵 생성
+        ipc_segments = [Segments.from_history(executions) for executions, _ in ipc_results.values()]
+        non_ipc_segments = [Segments.from_history(executions) for executions, _ in non_ipc_results.values()]
+        process_colors = self._create_process_color_map(ipc_segments + non_ipc_segments)
         
         # IPC 버전 (첫 번째 행)
-        for i, (scheduler_name, (executions, metrics)) in enumerate(ipc_results.items()):
-            self.plot_single_scheduler(axs[0, i], executions, f"{scheduler_name}\n(with IPC)", process_colors)
+        for ax, scheduler_name, segments in zip(ipc_axes, ipc_results, ipc_segments):
+            self.plot_single_scheduler(ax, segments, f"{scheduler_name}\n(with IPC)", process_colors)
             
         # Non-IPC 버전 (두 번째 행)
-        for i, (scheduler_name, (executions, metrics)) in enumerate(non_ipc_results.items()):
-            self.plot_single_scheduler(axs[1, i], executions, f"{scheduler_name}\n(without IPC)", process_colors)
+        for ax, scheduler_name, segments in zip(non_ipc_axes, non_ipc_results, non_ipc_segments):
+            self.plot_single_scheduler(ax, segments, f"{scheduler_name}\n(without IPC)", process_colors)
         
         plt.tight_layout()
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight', dpi=300)
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
             plt.close()
         else:
             plt.show()
@@ -145,7 +159,7 @@ class GanttVisualizer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight', dpi=300)
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
             plt.close()
         else:
             plt.show()
@@ -181,7 +195,7 @@ class GanttVisualizer:
         
         plt.tight_layout()
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight', dpi=300)
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
             plt.close()
         else:
             plt.show()
\ No newline at end of file
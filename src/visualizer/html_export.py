@@ -0,0 +1,337 @@
+import base64
+import html
+import json
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from src.process import Process, QueueLevel
+from src.schedulers.base import ProcessExecution
+from src.schedulers.interval_index import IntervalIndex
+from src.visualizer.segments import Segments
+
+# 큐 레벨 코드 (-1: 알 수 없음)
+LEVEL_CODES = {level: i for i, level in enumerate(QueueLevel)}
+
+def _encode(array: np.ndarray) -> Dict[str, str]:
+    """numpy 배열을 little-endian typed array(base64)로 인코딩"""
+    dtype = {np.dtype(np.int32): "Int32",
+             np.dtype(np.uint32): "Uint32",
+             np.dtype(np.float64): "Float64",
+             np.dtype(np.int8): "Int8"}[array.dtype]
+    data = np.ascontiguousarray(array.astype(array.dtype.newbyteorder("<")))
+    return {"type": dtype, "data": base64.b64encode(data.tobytes()).decode("ascii")}
+
+def _time_array(values: np.ndarray) -> np.ndarray:
+    """시간 값이 정수이고 범위 안이면 Uint32, 아니면 Float64 사용"""
+    if (len(values) == 0 or
+        (np.all(values == np.floor(values)) and values.min() >= 0 and values.max() < 2 ** 32)):
+        return values.astype(np.uint32)
+    return values.astype(np.float64)
+
+class HTMLTimelineExporter:
+    """실행 기록을 오프라인에서 동작하는 단일 HTML 타임라인(canvas)으로 내보내기"""
+
+    def build_dataset(self,
+                      name: str,
+                      executions,
+                      metrics: Dict[str, float],
+                      processes: Optional[List[Process]] = None) -> Dict:
+        """한 스케줄러 결과를 프로세스 행 단위의 CSR typed array 구조로 변환"""
+        index = IntervalIndex.from_history(Segments.from_history(executions))
+        starts = index.row_start_times
+        ends = index.row_end_times
+        row_pids = index.row_process_ids
+        offsets = index.row_offsets.astype(np.uint32)
+
+        # 행(프로세스)별 툴팁 지표
+        run_time = index.row_run_times()
+        last_end = index.row_last_ends()
+        info = {p.process_id: p for p in processes or []}
+        levels, arrivals, bursts, priorities = [], [], [], []
+        for pid in row_pids.tolist():
+            process = info.get(pid)
+            levels.append(LEVEL_CODES[process.queue_level] if process else -1)
+            arrivals.append(process.arrival_time if process else 0)
+            bursts.append(process.burst_time if process else 0)
+            priorities.append(process.priority if process else 0)
+        arrivals = np.array(arrivals, dtype=np.float64)
+        turnaround = last_end - arrivals if processes else np.zeros(len(row_pids))
+        waiting = turnaround - run_time if processes else np.zeros(len(row_pids))
+
+        return {
+            "name": name,
+            "metrics": {k: float(v) for k, v in metrics.items()},
+            "hasProcessInfo": bool(processes),
+            "maxTime": float(index.end_times.max()) if len(index) else 0.0,
+            "rows": {
+                "pid": _encode(row_pids.astype(np.int32)),
+                "offset": _encode(offsets),
+                "level": _encode(np.array(levels, dtype=np.int8)),
+                "arrival": _encode(arrivals),
+                "burst": _encode(np.array(bursts, dtype=np.float64)),
+                "priority": _encode(np.array(priorities, dtype=np.float64)),
+                "turnaround": _encode(np.asarray(turnaround, dtype=np.float64)),
+                "waiting": _encode(np.asarray(waiting, dtype=np.float64)),
+            },
+            "segments": {
+                "start": _encode(_time_array(starts)),
+                "end": _encode(_time_array(ends)),
+            },
+        }
+
+    def export(self,
+               results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
+               save_path: str,
+               processes: Optional[List[Process]] = None,
+               title: str = "CPU Scheduler Timeline") -> str:
+        """여러 스케줄러 결과를 하나의 HTML 파일로 저장"""
+        datasets = [
+            self.build_dataset(name, executions, metrics, processes)
+            for name, (executions, metrics) in results.items()
+        ]
+        payload = json.dumps({
+            "title": title,
+            "levels": [level.value for level in QueueLevel],
+            "datasets": datasets,
+        }, separators=(",", ":")).replace("</", "<\\/")
+
+        page = HTML_TEMPLATE.replace("__TITLE__", html.escape(title)).replace("__DATA__", payload)
+        with open(save_path, "w", encoding="utf-8") as f:
+            f.write(page)
+        return save_path
+
+    def export_with_ipc(self,
+                        ipc_results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
+                        non_ipc_results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
+                        save_path: str,
+                        processes: Optional[List[Process]] = None) -> str:
+        """IPC / Non-IPC 결과를 함께 내보내기"""
+        results = {}
+        for name, result in ipc_results.items():
+            results[f"{name} (with IPC)"] = result
+        for name, result in non_ipc_results.items():
+            results[f"{name} (without IPC)"] = result
+        return self.export(results, save_path, processes)
+
+HTML_TEMPLATE = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  body { margin: 0; font: 13px sans-serif; display: flex; flex-direction: column; height: 100vh; }
+  #toolbar { padding: 6px 10px; border-bottom: 1px solid #ccc; display: flex; gap: 14px; align-items: center; flex-wrap: wrap; }
+  #metrics { color: #444; }
+  #view { position: relative; flex: 1; overflow: hidden; }
+  canvas { display: block; cursor: grab; }
+  #tooltip { position: absolute; pointer-events: none; background: rgba(255,255,255,0.95); border: 1px solid #888;
+             padding: 4px 6px; white-space: pre; display: none; font: 12px monospace; }
+</style>
+</head>
+<body>
+<div id="toolbar">
+  <label>Scheduler <select id="dataset"></select></label>
+  <label>Processes <input id="pidFilter" placeholder="e.g. 1-10,42" size="14"></label>
+  <span id="levelFilters"></span>
+  <button id="reset">Reset view</button>
+  <span id="metrics"></span>
+</div>
+<div id="view"><canvas id="canvas"></canvas><div id="tooltip"></div></div>
+<script>
+"use strict";
+const DATA = __DATA__;
+const ROW_HEIGHT = 18, AXIS_HEIGHT = 22, LABEL_WIDTH = 70;
+
+function decode(enc) {
+  const bin = atob(enc.data);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  const ctor = {Int32: Int32Array, Uint32: Uint32Array, Float64: Float64Array, Int8: Int8Array}[enc.type];
+  return new ctor(bytes.buffer);
+}
+
+const datasets = DATA.datasets.map(d => {
+  const rows = {}, segs = {};
+  for (const k in d.rows) rows[k] = decode(d.rows[k]);
+  for (const k in d.segments) segs[k] = decode(d.segments[k]);
+  return {name: d.name, metrics: d.metrics, maxTime: d.maxTime, info: d.hasProcessInfo, rows, segs};
+});
+
+const canvas = document.getElementById("canvas");
+const ctx = canvas.getContext("2d");
+const view = document.getElementById("view");
+const tooltip = document.getElementById("tooltip");
+let ds = null, visibleRows = [], t0 = 0, t1 = 1, scrollY = 0, pending = false;
+const levelEnabled = DATA.levels.map(() => true);
+
+function colorOf(pid) { return "hsl(" + ((pid * 137.508) % 360).toFixed(1) + ",60%,62%)"; }
+
+function parsePidFilter(text) {
+  const ranges = [];
+  for (const part of text.split(",")) {
+    const m = part.trim().match(/^(\d+)(?:\s*-\s*(\d+))?$/);
+    if (m) ranges.push([+m[1], m[2] === undefined ? +m[1] : +m[2]]);
+  }
+  return ranges;
+}
+
+function applyFilters() {
+  const ranges = parsePidFilter(document.getElementById("pidFilter").value);
+  const pids = ds.rows.pid, levels = ds.rows.level;
+  visibleRows = [];
+  for (let r = 0; r < pids.length; r++) {
+    const lv = levels[r];
+    if (lv >= 0 && !levelEnabled[lv]) continue;
+    if (ranges.length && !ranges.some(([a, b]) => pids[r] >= a && pids[r] <= b)) continue;
+    visibleRows.push(r);
+  }
+  scrollY = Math.min(scrollY, Math.max(0, visibleRows.length * ROW_HEIGHT - 1));
+  requestDraw();
+}
+
+// 구간 end 배열에서 end > t 인 첫 인덱스 (행 내부는 시작 시간 순으로 정렬되어 겹치지 않음)
+function firstEndingAfter(lo, hi, t) {
+  const ends = ds.segs.end;
+  while (lo < hi) { const mid = (lo + hi) >> 1; if (ends[mid] > t) hi = mid; else lo = mid + 1; }
+  return lo;
+}
+
+function resize() {
+  canvas.width = view.clientWidth * devicePixelRatio;
+  canvas.height = view.clientHeight * devicePixelRatio;
+  canvas.style.width = view.clientWidth + "px";
+  canvas.style.height = view.clientHeight + "px";
+  requestDraw();
+}
+
+function requestDraw() { if (!pending) { pending = true; requestAnimationFrame(draw); } }
+
+function draw() {
+  pending = false;
+  const dpr = devicePixelRatio, W = canvas.width / dpr, H = canvas.height / dpr;
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.clearRect(0, 0, W, H);
+  const plotW = W - LABEL_WIDTH, scale = plotW / (t1 - t0);
+  const starts = ds.segs.start, ends = ds.segs.end, offs = ds.rows.offset, pids = ds.rows.pid;
+
+  // 화면에 보이는 행만 그림 (세로 가상화)
+  const firstRow = Math.floor(scrollY / ROW_HEIGHT);
+  const lastRow = Math.min(visibleRows.length, Math.ceil((scrollY + H - AXIS_HEIGHT) / ROW_HEIGHT));
+  ctx.font = "11px sans-serif";
+  ctx.textBaseline = "middle";
+  for (let v = firstRow; v < lastRow; v++) {
+    const r = visibleRows[v], y = AXIS_HEIGHT + v * ROW_HEIGHT - scrollY;
+    ctx.fillStyle = v % 2 ? "#fafafa" : "#f0f0f0";
+    ctx.fillRect(LABEL_WIDTH, y, plotW, ROW_HEIGHT);
+    ctx.fillStyle = "#222";
+    ctx.fillText("P" + pids[r], 4, y + ROW_HEIGHT / 2);
+    ctx.fillStyle = colorOf(pids[r]);
+    // 보이는 시간 범위의 구간만 순회하고, 이미 칠한 픽셀 안에서 끝나는 구간은 이진 탐색으로 건너뜀
+    // (행마다 O(픽셀 수 x log 구간 수))
+    let i = firstEndingAfter(offs[r], offs[r + 1], t0), lastPx;
+    const end = offs[r + 1];
+    while (i < end && starts[i] < t1) {
+      const x0 = LABEL_WIDTH + (starts[i] - t0) * scale;
+      const x1 = LABEL_WIDTH + (ends[i] - t0) * scale;
+      const left = Math.max(LABEL_WIDTH, x0), right = Math.max(left + 1, Math.min(W, x1));
+      ctx.fillRect(left, y + 2, right - left, ROW_HEIGHT - 4);
+      lastPx = Math.ceil(right);
+      i = firstEndingAfter(i + 1, end, t0 + (lastPx - LABEL_WIDTH) / scale);
+    }
+  }
+
+  // 시간 축
+  ctx.fillStyle = "#fff";
+  ctx.fillRect(0, 0, W, AXIS_HEIGHT);
+  ctx.fillStyle = "#333";
+  ctx.strokeStyle = "#999";
+  const step = niceStep((t1 - t0) / Math.max(1, plotW / 90));
+  for (let t = Math.ceil(t0 / step) * step; t <= t1; t += step) {
+    const x = LABEL_WIDTH + (t - t0) * scale;
+    ctx.beginPath(); ctx.moveTo(x, AXIS_HEIGHT - 6); ctx.lineTo(x, AXIS_HEIGHT); ctx.stroke();
+    ctx.fillText(+t.toPrecision(8) + "", x + 2, AXIS_HEIGHT / 2);
+  }
+}
+
+function niceStep(raw) {
+  const p = Math.pow(10, Math.floor(Math.log10(raw || 1)));
+  for (const m of [1, 2, 5, 10]) if (m * p >= raw) return m * p;
+  return 10 * p;
+}
+
+function timeAt(x) { return t0 + (x - LABEL_WIDTH) * (t1 - t0) / (canvas.width / devicePixelRatio - LABEL_WIDTH); }
+
+function selectDataset(index) {
+  ds = datasets[index];
+  t0 = 0; t1 = Math.max(1, ds.maxTime); scrollY = 0;
+  const m = ds.metrics;
+  document.getElementById("metrics").textContent = Object.keys(m)
+    .map(k => k + ": " + (Number.isInteger(m[k]) ? m[k] : m[k].toFixed(2))).join("  |  ");
+  applyFilters();
+}
+
+canvas.addEventListener("wheel", e => {
+  e.preventDefault();
+  if (e.shiftKey) {
+    scrollY = Math.max(0, Math.min(scrollY + e.deltaY, visibleRows.length * ROW_HEIGHT - ROW_HEIGHT));
+  } else {
+    const t = timeAt(e.offsetX), f = Math.exp(e.deltaY * 0.0015);
+    const span = Math.max(1e-6, (t1 - t0) * f);
+    t0 = t - (t - t0) * span / (t1 - t0); t1 = t0 + span;
+  }
+  requestDraw();
+}, {passive: false});
+
+let drag = null;
+canvas.addEventListener("mousedown", e => { drag = {x: e.clientX, y: e.clientY, t0, t1, scrollY}; canvas.style.cursor = "grabbing"; });
+window.addEventListener("mouseup", () => { drag = null; canvas.style.cursor = "grab"; });
+window.addEventListener("mousemove", e => {
+  if (!drag) return;
+  const dt = (e.clientX - drag.x) * (drag.t1 - drag.t0) / (canvas.width / devicePixelRatio - LABEL_WIDTH);
+  t0 = drag.t0 - dt; t1 = drag.t1 - dt;
+  scrollY = Math.max(0, Math.min(drag.scrollY - (e.clientY - drag.y), visibleRows.length * ROW_HEIGHT - ROW_HEIGHT));
+  requestDraw();
+});
+
+canvas.addEventListener("mousemove", e => {
+  const v = Math.floor((e.offsetY - AXIS_HEIGHT + scrollY) / ROW_HEIGHT);
+  if (drag || e.offsetY < AXIS_HEIGHT || e.offsetX < LABEL_WIDTH || v < 0 || v >= visibleRows.length) {
+    tooltip.style.display = "none"; return;
+  }
+  const r = visibleRows[v], t = timeAt(e.offsetX), rows = ds.rows;
+  const i = firstEndingAfter(rows.offset[r], rows.offset[r + 1], t);
+  if (i >= rows.offset[r + 1] || ds.segs.start[i] > t) { tooltip.style.display = "none"; return; }
+  let text = "P" + rows.pid[r] + "  [" + ds.segs.start[i] + ", " + ds.segs.end[i] + ")";
+  if (ds.info) {
+    const lv = rows.level[r];
+    text += "\nqueue level: " + (lv >= 0 ? DATA.levels[lv] : "?") +
+            "\narrival: " + rows.arrival[r] + "  burst: " + rows.burst[r] + "  priority: " + rows.priority[r] +
+            "\nwaiting: " + rows.waiting[r] + "  turnaround: " + rows.turnaround[r];
+  }
+  tooltip.textContent = text;
+  tooltip.style.left = (e.offsetX + 14) + "px";
+  tooltip.style.top = (e.offsetY + 14) + "px";
+  tooltip.style.display = "block";
+});
+canvas.addEventListener("mouseleave", () => { tooltip.style.display = "none"; });
+
+const select = document.getElementById("dataset");
+datasets.forEach((d, i) => select.add(new Option(d.name, i)));
+select.addEventListener("change", () => selectDataset(+select.value));
+document.getElementById("pidFilter").addEventListener("input", applyFilters);
+document.getElementById("reset").addEventListener("click", () => { t0 = 0; t1 = Math.max(1, ds.maxTime); scrollY = 0; requestDraw(); });
+const levelBox = document.getElementById("levelFilters");
+DATA.levels.forEach((name, i) => {
+  const label = document.createElement("label");
+  const box = document.createElement("input");
+  box.type = "checkbox"; box.checked = true;
+  box.addEventListener("change", () => { levelEnabled[i] = box.checked; applyFilters(); });
+  label.append(box, " Level " + name + " ");
+  levelBox.append(label);
+});
+window.addEventListener("resize", resize);
+if (datasets.length) selectDataset(0);
+resize();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,35 @@
+import math
+import matplotlib.pyplot as plt
+from typing import List, Tuple
+
+def grid_shape(n_panels: int, max_cols: int = 5) -> Tuple[int, int]:
+    """패널 수에 맞는 (행, 열) 크기 계산"""
+    n_cols = max(1, min(max_cols, n_panels))
+    n_rows = max(1, math.ceil(n_panels / n_cols))
+    return n_rows, n_cols
+
+def create_panel_grid(group_sizes: List[int],
+                      max_cols: int = 5,
+                      panel_size: Tuple[float, float] = (5, 4)) -> Tuple[plt.Figure, List[List[plt.Axes]]]:
+    """
+    그룹(IPC / Non-IPC 등)마다 별도의 행 묶음을 사용하는 자동 그리드 생성
+    - 열 수는 가장 큰 그룹 기준 (최대 max_cols)
+    - 사용하지 않는 칸은 숨김
+    """
+    n_cols = max(1, min(max_cols, max(group_sizes, default=1)))
+    group_rows = [max(1, math.ceil(size / n_cols)) for size in group_sizes]
+    total_rows = sum(group_rows)
+
+    fig, axs = plt.subplots(total_rows, n_cols,
+                            figsize=(panel_size[0] * n_cols, panel_size[1] * total_rows),
+                            squeeze=False)
+
+    groups = []
+    row = 0
+    for size, n_rows in zip(group_sizes, group_rows):
+        cells = [axs[r, c] for r in range(row, row + n_rows) for c in range(n_cols)]
+        for ax in cells[size:]:
+            ax.set_visible(False)
+        groups.append(cells[:size])
+        row += n_rows
+    return fig, groups
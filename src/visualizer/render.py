@@ -0,0 +1,76 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.schedulers.base import ProcessExecution
+
+# 리포트 종류별 (파일 이름, 시각화 클래스, 메서드)
+REPORTS = {
+    "gantt": ("gantt_chart", "GanttVisualizer", "plot_all_schedulers_with_ipc"),
+    "performance": ("performance_comparison", "GanttVisualizer", "create_performance_comparison_with_ipc"),
+    "timeline": ("timeline_view", "TimelineVisualizer", "create_timeline_view_with_ipc"),
+}
+
+# 미리보기용 저해상도 DPI
+PREVIEW_DPI = 72
+
+Results = Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]]
+
+def _compact_results(results: Results) -> Dict:
+    """프로세스 간 전달 전에 tick 단위 기록을 병합된 구간 배열로 변환"""
+    from src.visualizer.segments import Segments
+    return {
+        name: (Segments.from_history(executions), metrics)
+        for name, (executions, metrics) in results.items()
+    }
+
+def _render_report(report: str, ipc_results: Dict, non_ipc_results: Dict,
+                   save_path: str, dpi: int) -> str:
+    """worker 프로세스에서 non-interactive backend로 리포트 하나를 렌더링"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from src.visualizer.gantt import GanttVisualizer
+    from src.visualizer.timeline import TimelineVisualizer
+
+    _, class_name, method_name = REPORTS[report]
+    visualizer_class = {"GanttVisualizer": GanttVisualizer,
+                        "TimelineVisualizer": TimelineVisualizer}[class_name]
+    visualizer = visualizer_class(dpi=dpi)
+    getattr(visualizer, method_name)(ipc_results, non_ipc_results, save_path=save_path)
+    return save_path
+
+def render_reports(ipc_results: Results,
+                   non_ipc_results: Results,
+                   output_dir: str = ".",
+                   fmt: str = "png",
+                   dpi: int = 300,
+                   preview: bool = False,
+                   reports: Optional[List[str]] = None,
+                   workers: Optional[int] = None) -> List[str]:
+    """
+    리포트 차트들을 병렬 worker 프로세스에서 렌더링
+    - fmt: png / svg / pdf (svg, pdf는 벡터 출력)
+    - preview: True이면 PREVIEW_DPI의 저해상도로 빠르게 출력
+    - workers: 1이면 현재 프로세스에서 순차 렌더링
+    """
+    reports = reports or list(REPORTS)
+    if preview:
+        dpi = PREVIEW_DPI
+    os.makedirs(output_dir, exist_ok=True)
+
+    ipc_results = _compact_results(ipc_results)
+    non_ipc_results = _compact_results(non_ipc_results)
+    jobs = [
+        (report, ipc_results, non_ipc_results,
+         os.path.join(output_dir, f"{REPORTS[report][0]}.{fmt}"), dpi)
+        for report in reports
+    ]
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_render_report(*job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_render_report, *job) for job in jobs]
+        return [future.result() for future in futures]
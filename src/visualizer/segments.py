@@ -0,0 +1,186 @@
+import numpy as np
+from matplotlib.collections import PolyCollection
+from typing import Dict, Iterable, List, Union
+from src.schedulers.history import ProcessExecution, STATE_CODES, merge_executions
+from src.process import ProcessState
+
+class Segments:
+    """병합된 RUNNING 구간들을 (process_id, start, end) numpy 배열로 보관"""
+    def __init__(self, process_ids: np.ndarray, start_times: np.ndarray, end_times: np.ndarray):
+        self.process_ids = process_ids
+        self.start_times = start_times
+        self.end_times = end_times
+
+    @classmethod
+    def from_history(cls, executions: Union['Segments', Iterable[ProcessExecution]]) -> 'Segments':
+        """실행 기록(tick 단위)을 병합된 구간 배열로 변환"""
+        if isinstance(executions, Segments):
+            return executions
+
+        if hasattr(executions, "iter_arrays"):
+            # 파일 sink는 chunk를 배열로 바로 읽어 병합
+            return cls._from_chunks(executions.iter_arrays())
+
+        merged = [exe for exe in merge_executions(executions)
+                  if exe.state == ProcessState.RUNNING]
+        return cls._merge_contiguous(
+            np.fromiter((exe.process_id for exe in merged), dtype=np.int64, count=len(merged)),
+            np.fromiter((exe.start_time for exe in merged), dtype=np.int64, count=len(merged)),
+            np.fromiter((exe.end_time for exe in merged), dtype=np.int64, count=len(merged))
+        )
+
+    @classmethod
+    def _from_chunks(cls, chunks: Iterable[Dict[str, np.ndarray]]) -> 'Segments':
+        """
+        chunk를 하나씩 병합 (전체 chunk를 한 번에 메모리에 올리지 않음)
+        - chunk의 마지막 구간은 다음 chunk에서 이어질 수 있으므로 다음 chunk 병합에 포함
+        - RUNNING 기록은 chunk 순서대로 시간 순이라고 가정 (CPU 하나의 실행 기록)
+        """
+        running = STATE_CODES[ProcessState.RUNNING]
+        done = []
+        tail = None
+        for chunk in chunks:
+            mask = chunk["state"] == running
+            process_ids = chunk["process_id"][mask]
+            start_times = chunk["start_time"][mask]
+            end_times = chunk["end_time"][mask]
+            if tail is not None:
+                process_ids = np.r_[tail.process_ids, process_ids]
+                start_times = np.r_[tail.start_times, start_times]
+                end_times = np.r_[tail.end_times, end_times]
+            merged = cls._merge_contiguous(process_ids, start_times, end_times)
+            if not len(merged):
+                continue
+            done.append(Segments(merged.process_ids[:-1], merged.start_times[:-1], merged.end_times[:-1]))
+            tail = Segments(merged.process_ids[-1:], merged.start_times[-1:], merged.end_times[-1:])
+        if tail is None:
+            return cls.empty()
+        return concat_segments(done + [tail])
+
+    @classmethod
+    def empty(cls) -> 'Segments':
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def _merge_contiguous(cls, process_ids, start_times, end_times) -> 'Segments':
+        """시작 시간 순으로 정렬 후 같은 프로세스의 맞닿은 구간을 병합"""
+        if len(start_times) == 0:
+            return cls.empty()
+        order = np.argsort(start_times, kind="stable")
+        process_ids = process_ids[order]
+        start_times = start_times[order]
+        end_times = end_times[order]
+
+        is_new = np.ones(len(start_times), dtype=bool)
+        is_new[1:] = (process_ids[1:] != process_ids[:-1]) | (start_times[1:] != end_times[:-1])
+        first = np.flatnonzero(is_new)
+        last = np.r_[first[1:] - 1, len(start_times) - 1]
+        return cls(process_ids[first], start_times[first], end_times[last])
+
+    def __len__(self) -> int:
+        return len(self.start_times)
+
+    @property
+    def max_time(self):
+        return self.end_times.max() if len(self) else 0
+
+    def unique_process_ids(self) -> np.ndarray:
+        return np.unique(self.process_ids)
+
+    def by_process(self) -> Dict[int, 'Segments']:
+        """프로세스별 구간으로 분리 (정렬 한 번으로 O(S log S))"""
+        if not len(self):
+            return {}
+        order = np.argsort(self.process_ids, kind="stable")
+        pids = self.process_ids[order]
+        bounds = np.flatnonzero(np.diff(pids)) + 1
+        groups = {}
+        for idx in np.split(order, bounds):
+            pid = int(self.process_ids[idx[0]])
+            groups[pid] = Segments(self.process_ids[idx], self.start_times[idx], self.end_times[idx])
+        return groups
+
+    def downsample(self, t_min: float, t_max: float, n_bins: int) -> 'Segments':
+        """
+        화면 해상도(n_bins 픽셀)보다 구간이 훨씬 많을 때 level of detail 적용
+        - 한 픽셀보다 긴 구간은 그대로 유지
+        - 짧은 구간들은 중점이 속한 픽셀 단위로 모아서 가장 오래 실행된 프로세스로 대표
+        """
+        n_bins = int(n_bins)
+        if n_bins <= 0 or len(self) <= n_bins or t_max <= t_min:
+            return self
+        bin_width = (t_max - t_min) / n_bins
+        durations = self.end_times - self.start_times
+        long = durations >= bin_width
+        short = ~long
+
+        pids = self.process_ids[short]
+        starts = self.start_times[short]
+        ends = self.end_times[short]
+        durations = durations[short]
+        bins = np.clip(((starts + ends) / 2 - t_min) // bin_width, 0, n_bins - 1).astype(np.int64)
+
+        # (bin, pid) 그룹별 실행 시간 합계
+        order = np.lexsort((pids, bins))
+        bins, pids, starts, ends, durations = bins[order], pids[order], starts[order], ends[order], durations[order]
+        is_new = np.ones(len(bins), dtype=bool)
+        is_new[1:] = (bins[1:] != bins[:-1]) | (pids[1:] != pids[:-1])
+        group_first = np.flatnonzero(is_new)
+        totals = np.add.reduceat(durations, group_first)
+        group_starts = np.minimum.reduceat(starts, group_first)
+        group_ends = np.maximum.reduceat(ends, group_first)
+        group_bins = bins[group_first]
+        group_pids = pids[group_first]
+
+        # bin마다 실행 시간이 가장 긴 프로세스 선택
+        order = np.lexsort((-totals, group_bins))
+        chosen = order[np.r_[True, group_bins[order][1:] != group_bins[order][:-1]]]
+
+        return Segments._merge_contiguous(
+            np.concatenate([self.process_ids[long], group_pids[chosen]]),
+            np.concatenate([self.start_times[long], group_starts[chosen]]).astype(np.float64),
+            np.concatenate([self.end_times[long], group_ends[chosen]]).astype(np.float64)
+        )
+
+def axes_pixel_width(ax, dpi: float) -> int:
+    """저장될 해상도 기준으로 axes의 가로 픽셀 수 계산"""
+    fig = ax.figure
+    return max(1, int(ax.get_position().width * fig.get_figwidth() * dpi))
+
+def label_mask(segments: Segments, time_per_pixel: float, min_pixels: float,
+               max_labels: int = 500) -> np.ndarray:
+    """화면상 폭이 min_pixels 이상인 구간에만 라벨 표시 (라벨 수는 max_labels로 제한)"""
+    if time_per_pixel <= 0:
+        return np.zeros(len(segments), dtype=bool)
+    widths = (segments.end_times - segments.start_times) / time_per_pixel
+    mask = widths >= min_pixels
+    if mask.sum() > max_labels:
+        threshold = np.sort(widths[mask])[-max_labels]
+        mask &= widths >= threshold
+    return mask
+
+def segment_collection(segments: Segments, y_positions: np.ndarray, height: float,
+                       facecolors, draw_edges: bool, **kwargs) -> PolyCollection:
+    """모든 구간을 하나의 PolyCollection으로 생성 (구간마다 artist를 만들지 않음)"""
+    x0 = np.asarray(segments.start_times, dtype=np.float64)
+    x1 = np.asarray(segments.end_times, dtype=np.float64)
+    y0 = np.asarray(y_positions, dtype=np.float64) - height / 2
+    y1 = y0 + height
+    verts = np.stack([
+        np.column_stack((x0, y0)),
+        np.column_stack((x0, y1)),
+        np.column_stack((x1, y1)),
+        np.column_stack((x1, y0)),
+    ], axis=1)
+    return PolyCollection(verts,
+                          facecolors=facecolors,
+                          edgecolors='black' if draw_edges else 'none',
+                          linewidths=1.0 if draw_edges else 0,
+                          **kwargs)
+
+def concat_segments(segments_list: List[Segments]) -> Segments:
+    if not segments_list:
+        return Segments.empty()
+    return Segments(np.concatenate([s.process_ids for s in segments_list]),
+                    np.concatenate([s.start_times for s in segments_list]),
+                    np.concatenate([s.end_times for s in segments_list]))
@@ -0,0 +1,77 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from typing import Dict
+from src.process import QueueLevel
+from src.schedulers.telemetry import Telemetry
+
+class TelemetryVisualizer:
+    def __init__(self, dpi: int = 300):
+        self.dpi = dpi
+        self.colors = plt.cm.tab10(np.linspace(0, 1, 10))
+
+    def _save(self, save_path: str = None):
+        plt.tight_layout()
+        if save_path:
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
+            plt.close()
+        else:
+            plt.show()
+
+    def plot_single(self, telemetry: Telemetry, title: str = "", save_path: str = None):
+        """한 스케줄러의 QueueLevel별 ready queue 길이(누적 영역), 의존성 대기 수, 처리량, 사용률"""
+        fig, axs = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
+
+        # QueueLevel별 평균 큐 길이를 누적 영역으로, bucket 최대값은 선으로 표시
+        times, _, _ = telemetry.arrays("ready_total")
+        levels = [telemetry.arrays(f"ready_{level.value}")[1] for level in QueueLevel]
+        if len(times):
+            axs[0].stackplot(times, levels, labels=[f"Level {level.value}" for level in QueueLevel],
+                             step="post", alpha=0.7)
+            axs[0].step(times, telemetry.arrays("ready_total")[2], where="post",
+                        color="black", linewidth=0.8, label="max (bucket)")
+            blocked_times, blocked, _ = telemetry.arrays("blocked")
+            axs[0].step(blocked_times, blocked, where="post", color="red",
+                        linestyle="--", label="blocked (IPC)")
+        axs[0].set_ylabel("Ready queue")
+        axs[0].legend(loc="upper right")
+
+        throughput_times, throughput, _ = telemetry.arrays("throughput")
+        axs[1].plot(throughput_times, throughput)
+        axs[1].set_ylabel(f"Throughput\n(completions / tick, {telemetry.window}-tick window)")
+
+        utilization_times, utilization, _ = telemetry.arrays("utilization")
+        axs[2].plot(utilization_times, utilization)
+        axs[2].set_ylim(0, 105)
+        axs[2].set_ylabel("CPU utilization (%)")
+        axs[2].set_xlabel("Time")
+
+        for ax in axs:
+            ax.grid(True, linestyle='--', alpha=0.7)
+        if title:
+            axs[0].set_title(title)
+        self._save(save_path)
+
+    def plot_comparison(self, telemetries: Dict[str, Telemetry], save_path: str = None):
+        """여러 스케줄러의 ready queue 길이, 의존성 대기 수, 처리량, 사용률 시계열 비교"""
+        panels = [
+            ("ready_total", "Ready queue length"),
+            ("blocked", "Dependency-blocked (IPC)"),
+            ("throughput", "Throughput (completions / tick)"),
+            ("utilization", "CPU utilization (%)"),
+        ]
+        fig, axs = plt.subplots(len(panels), 1, figsize=(14, 3 * len(panels)), sharex=True)
+
+        for i, (name, telemetry) in enumerate(telemetries.items()):
+            color = self.colors[i % len(self.colors)]
+            linestyle = '-' if i < len(self.colors) else '--'
+            for ax, (series, _) in zip(axs, panels):
+                times, means, _ = telemetry.arrays(series)
+                ax.step(times, means, where="post", color=color, linestyle=linestyle,
+                        linewidth=1, label=name)
+
+        for ax, (_, label) in zip(axs, panels):
+            ax.set_ylabel(label)
+            ax.grid(True, linestyle='--', alpha=0.7)
+        axs[0].legend(loc="upper left", bbox_to_anchor=(1.01, 1), fontsize=8)
+        axs[-1].set_xlabel("Time")
+        self._save(save_path)
@@ -2,66 +2,39 @@ import matplotlib.pyplot as plt
 import numpy as np
 from typing import Dict, List, Tuple
 from src.schedulers.base import ProcessExecution
+from src.schedulers.interval_index import IntervalIndex
+from src.visualizer.layout import create_panel_grid
+from src.visualizer.segments import Segments, axes_pixel_width, concat_segments, segment_collection
 
 class TimelineVisualizer:
-    def __init__(self):
+    def __init__(self, dpi: int = 300, max_cols: int = 5):
         self.colors = plt.cm.Set3(np.linspace(0, 1, 10))
+        self.dpi = dpi
+        self.max_cols = max_cols
     
     def create_timeline_view(self,
                            results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
                            save_path: str = None):
-        """Create a 2x3 grid of timeline views for each scheduler"""
-        fig, axs = plt.subplots(2, 3, figsize=(20, 12))
-        axs = axs.ravel()
+        """Create a grid of timeline views for each scheduler (up to 3 per row)"""
+        fig, (axs,) = create_panel_grid([len(results)], max_cols=3, panel_size=(20 / 3, 6))
+        
+        # Merge tick-level history into segments once per scheduler
+        segments = {name: Segments.from_history(executions) for name, (executions, _) in results.items()}
         
         # Get global time range for consistent scaling
-        max_time = 0
-        for executions, _ in results.values():
-            if executions:
-                max_time = max(max_time, max(exe.end_time for exe in executions))
+        max_time = max((seg.max_time for seg in segments.values()), default=0)
         
         # Create process color mapping
-        all_processes = set()
-        for executions, _ in results.values():
-            all_processes.update(exe.process_id for exe in executions)
-        process_colors = {pid: self.colors[i % len(self.colors)] 
-                         for i, pid in enumerate(sorted(all_processes))}
-        
-        for (scheduler_name, (executions, metrics)), ax in zip(results.items(), axs):
-            # Get unique processes and sort them in reverse order (P1 at top)
-            processes = sorted(set(exe.process_id for exe in executions), reverse=True)
-            
-            # Plot execution blocks
-            for i, pid in enumerate(processes):
-                process_execs = [exe for exe in executions 
-                               if exe.process_id == pid and exe.state.value == "RUNNING"]
-                
-                for exe in process_execs:
-                    ax.barh(y=f'P{pid}', 
-                           width=exe.end_time - exe.start_time,
-                           left=exe.start_time,
-                           color=process_colors[pid],
-                           edgecolor='black',
-                           alpha=0.7)
-            
-            # Customize the plot
-            ax.set_title(f'{scheduler_name}')
-            ax.set_xlabel('Time')
-            ax.grid(True, axis='x', alpha=0.3)
-            ax.set_xlim(0, max_time)
-            
-            # Add metrics text
-            metrics_text = (f'Avg Wait: {metrics["avg_waiting_time"]:.1f}\n'
-                          f'Switches: {metrics["context_switches"]}')
-            ax.text(1.02, 0.98, metrics_text,
-                   transform=ax.transAxes,
-                   verticalalignment='top',
-                   bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        process_colors = self._create_process_color_map(segments.values())
+        
+        for (scheduler_name, (_, metrics)), ax in zip(results.items(), axs):
+            self._plot_timeline(ax, segments[scheduler_name], metrics,
+                              f'{scheduler_name}', process_colors, max_time)
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight', dpi=300)
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
             plt.close()
         else:
             plt.show()
@@ -70,60 +43,86 @@ class TimelineVisualizer:
                                     ipc_results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
                                     non_ipc_results: Dict[str, Tuple[List[ProcessExecution], Dict[str, float]]],
                                     save_path: str = None):
-        """Create a 2x5 grid of timeline views for IPC and non-IPC schedulers"""
-        fig, axs = plt.subplots(2, 5, figsize=(25, 10))
+        """Create a grid of timeline views for IPC (upper rows) and non-IPC (lower rows) schedulers"""
+        fig, (ipc_axes, non_ipc_axes) = create_panel_grid(
+            [len(ipc_results), len(non_ipc_results)],
+            max_cols=self.max_cols,
+            panel_size=(5, 5)
+        )
+        
+        # Merge tick-level history into segments once per scheduler
+        ipc_segments = [Segments.from_history(executions) for executions, _ in ipc_results.values()]
+        non_ipc_segments = [Segments.from_history(executions) for executions, _ in non_ipc_results.values()]
         
         # Get global time range for consistent scaling
-        max_time = 0
-        for results in [ipc_results, non_ipc_results]:
-            for executions, _ in results.values():
-                if executions:
-                    max_time = max(max_time, max(exe.end_time for exe in executions))
+        max_time = max((seg.max_time for seg in ipc_segments + non_ipc_segments), default=0)
         
         # Create process color mapping
-        all_processes = set()
-        for results in [ipc_results, non_ipc_results]:
-            for executions, _ in results.values():
-                all_processes.update(exe.process_id for exe in executions)
-        process_colors = {pid: self.colors[i % len(self.colors)] 
-                         for i, pid in enumerate(sorted(all_processes))}
+        process_colors = self._create_process_color_map(ipc_segments + non_ipc_segments)
         
         # Plot IPC version (first row)
-        for i, (scheduler_name, (executions, metrics)) in enumerate(ipc_results.items()):
-            self._plot_timeline(axs[0, i], executions, metrics, 
+        for ax, (scheduler_name, (_, metrics)), segments in zip(ipc_axes, ipc_results.items(), ipc_segments):
+            self._plot_timeline(ax, segments, metrics, 
                               f"{scheduler_name}\n(with IPC)", 
                               process_colors, max_time)
         
         # Plot non-IPC version (second row)
-        for i, (scheduler_name, (executions, metrics)) in enumerate(non_ipc_results.items()):
-            self._plot_timeline(axs[1, i], executions, metrics, 
+        for ax, (scheduler_name, (_, metrics)), segments in zip(non_ipc_axes, non_ipc_results.items(), non_ipc_segments):
+            self._plot_timeline(ax, segments, metrics, 
                               f"{scheduler_name}\n(without IPC)", 
                               process_colors, max_time)
         
         plt.tight_layout()
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight', dpi=300)
+            plt.savefig(save_path, bbox_inches='tight', dpi=self.dpi)
             plt.close()
         else:
             plt.show()
 
+    def _create_process_color_map(self, segments_list) -> Dict[int, np.ndarray]:
+        """Assign a color to every process that appears in any result"""
+        all_processes = set()
+        for segments in segments_list:
+            all_processes.update(segments.unique_process_ids().tolist())
+        return {pid: self.colors[i % len(self.colors)] 
+                for i, pid in enumerate(sorted(all_processes))}
+
     def _plot_timeline(self, ax, executions, metrics, title, process_colors, max_time):
-        """Helper method to plot individual timeline"""
+        """Helper method to plot individual timeline (all rows in one collection)"""
+        index = IntervalIndex.from_history(executions)
+        pixel_width = axes_pixel_width(ax, self.dpi)
+        
         # Sort processes in reverse order (P1 at top)
-        processes = sorted(set(exe.process_id for exe in executions), reverse=True)
-        
-        for i, pid in enumerate(processes):
-            process_execs = [exe for exe in executions 
-                           if exe.process_id == pid and exe.state.value == "RUNNING"]
-            
-            for exe in process_execs:
-                ax.barh(y=f'P{pid}', 
-                       width=exe.end_time - exe.start_time,
-                       left=exe.start_time,
-                       color=process_colors[pid],
-                       edgecolor='black',
-                       alpha=0.7)
+        processes = index.row_process_ids[::-1].tolist()
+        
+        # Down-sample rows that have more segments than pixels (per-process rows come from the index)
+        rows = []
+        for pid in processes:
+            starts, ends = index.process_intervals(pid)
+            row = Segments(np.full(len(starts), pid, dtype=np.int64), starts, ends)
+            rows.append(row.downsample(0, max_time, pixel_width))
+        rows = concat_segments(rows)
+        row_of = {pid: i for i, pid in enumerate(processes)}
+        row_pids = rows.process_ids.tolist()
+        
+        # All rows are drawn as a single collection
+        ax.add_collection(segment_collection(
+            rows,
+            np.array([row_of[pid] for pid in row_pids]),
+            0.8,
+            [process_colors[pid] for pid in row_pids],
+            len(rows) <= pixel_width / 4,
+            alpha=0.7
+        ))
         
+        # Only label as many rows as fit vertically (about one 10pt label per row)
+        fig = ax.figure
+        max_labels = max(1, int(ax.get_position().height * fig.get_figheight() * 72 / 10))
+        step = max(1, -(-len(processes) // max_labels))
+        ticks = list(range(0, len(processes), step))
+        ax.set_yticks(ticks)
+        ax.set_yticklabels([f'P{processes[i]}' for i in ticks])
+        ax.set_ylim(-0.6, len(processes) - 0.4)
         ax.set_title(title)
         ax.set_xlabel('Time')
         ax.grid(True, axis='x', alpha=0.3)
@@ -0,0 +1,30 @@
+import pytest
+
+from src.process import Process, QueueLevel, generate_processes
+from src.schedulers.admission import AdmissionControl
+from src.schedulers.channels import ChannelModel
+from src.schedulers.registry import create_scheduler
+
+def _loads(scheduler):
+    return [scheduler._root.load] + [queue.load for queue in scheduler._queues.values()]
+
+def test_preemption_keeps_run_queue_load():
+    """선점이 반복되어도 실행이 끝나면 run queue load는 0"""
+    processes = [Process(i, 0, 50, 1, QueueLevel.A, []) for i in (1, 2, 3)]
+    scheduler = create_scheduler("CFS")
+    scheduler.schedule(processes)
+    assert scheduler.context_switches > 3
+    assert _loads(scheduler) == [0, 0, 0, 0]
+
+@pytest.mark.parametrize("use_ipc", [False, True])
+@pytest.mark.parametrize("group_by_level", [False, True])
+@pytest.mark.parametrize("setup", ["plain", "admission", "channels"])
+def test_run_queue_load_settles_to_zero(use_ipc, group_by_level, setup):
+    for seed in range(10):
+        scheduler = create_scheduler("CFS", use_ipc, group_by_level=group_by_level)
+        if setup == "admission":
+            scheduler.set_admission(AdmissionControl(capacity=5, policy="drop_oldest"))
+        elif setup == "channels":
+            scheduler.set_channels(ChannelModel(latency=2, bandwidth=0.5, capacity=1))
+        scheduler.schedule(generate_processes(30, 5, seed=seed))
+        assert _loads(scheduler) == [0, 0, 0, 0]
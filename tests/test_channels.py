@@ -0,0 +1,38 @@
+import pytest
+
+from src.process import generate_processes
+from src.schedulers.channels import ChannelModel
+from src.schedulers.registry import create_scheduler
+
+@pytest.mark.parametrize("name", ["FCFS", "RR", "MLQ"])
+def test_default_channels_match_plain_ipc(name):
+    """기본 채널(지연 없음, 무제한)은 통신 시간이 0이고 기존 IPC 모드와 지표가 같음"""
+    for seed in range(5):
+        processes = generate_processes(30, 5, seed=seed)
+        plain = create_scheduler(name, True)
+        plain.schedule(processes)
+        expected = plain.calculate_metrics()
+        scheduler = create_scheduler(name, True)
+        scheduler.set_channels(ChannelModel())
+        scheduler.schedule(processes)
+        metrics = scheduler.calculate_metrics()
+        assert metrics["avg_waiting_time"] == expected["avg_waiting_time"]
+        assert metrics["avg_turnaround_time"] == expected["avg_turnaround_time"]
+
+@pytest.mark.parametrize("name", ["FCFS", "RR", "MLQ"])
+def test_communication_time_excluded_from_waiting_time(name):
+    """대기 시간 = 반환 시간 - 실행 시간 - 통신 시간 (송신 block + 메시지 대기)"""
+    for seed in range(5):
+        processes = generate_processes(30, 5, seed=seed)
+        scheduler = create_scheduler(name, True)
+        channels = ChannelModel(latency=3, bandwidth=0.25, capacity=1, message_size=2)
+        scheduler.set_channels(channels)
+        scheduler.schedule(processes)
+        metrics = scheduler.calculate_metrics()
+        communication = channels.communication_times()
+        assert any(communication.values())
+        stats = scheduler.history_stats
+        waits = [stats.last_end[p.process_id] - p.arrival_time - stats.run_time[p.process_id]
+                 - communication.get(p.process_id, 0) for p in processes]
+        assert min(waits) >= 0
+        assert metrics["avg_waiting_time"] == pytest.approx(sum(waits) / len(waits))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.cluster import ClusterSimulator
+from src.process import generate_processes
+from src.schedulers.admission import AdmissionControl
+from src.schedulers.channels import ChannelModel
+from src.schedulers.instrumentation import Instrumentation
+from src.schedulers.registry import create_scheduler
+from src.schedulers.telemetry import Telemetry
+
+def _observed(name, use_ipc, created):
+    def factory():
+        scheduler = create_scheduler(name, use_ipc)
+        scheduler.set_telemetry(Telemetry())
+        scheduler.set_instrumentation(Instrumentation())
+        created.append(scheduler)
+        return scheduler
+    return factory
+
+@pytest.mark.parametrize("name", ["FCFS", "RR", "MLQ", "CFS"])
+@pytest.mark.parametrize("use_ipc", [False, True])
+def test_single_node_matches_schedule_with_telemetry_and_instrumentation(name, use_ipc):
+    """노드 하나의 클러스터는 telemetry / 계측 결과까지 Scheduler.schedule과 같음"""
+    processes = generate_processes(30, 5, seed=2, max_arrival=60, burst_range=(1, 8))
+    expected = _observed(name, use_ipc, [])()
+    expected.schedule([p.copy() for p in processes])
+    created = []
+    result = ClusterSimulator(1, _observed(name, use_ipc, created)).run([p.copy() for p in processes])
+    node = created[-1]
+
+    metrics = expected.calculate_metrics()
+    for key in ("avg_waiting_time", "avg_turnaround_time", "context_switches"):
+        assert result.metrics[key] == metrics[key]
+    for series in ("ready_total", "blocked", "utilization"):
+        for actual, wanted in zip(node.telemetry.arrays(series), expected.telemetry.arrays(series)):
+            np.testing.assert_array_equal(actual, wanted)
+    for counter in ("ticks", "decisions", "admissions", "completions", "context_switches"):
+        assert node.instrumentation.counters[counter] == expected.instrumentation.counters[counter]
+
+@pytest.mark.parametrize("attach", [
+    lambda scheduler: scheduler.set_channels(ChannelModel(latency=2)),
+    lambda scheduler: scheduler.set_admission(AdmissionControl(capacity=5)),
+])
+def test_rejects_channels_and_admission(attach):
+    def factory():
+        scheduler = create_scheduler("RR", True)
+        attach(scheduler)
+        return scheduler
+    with pytest.raises(ValueError, match="Cluster nodes do not support"):
+        ClusterSimulator(2, factory).run(generate_processes(10, 3, seed=1))
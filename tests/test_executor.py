@@ -0,0 +1,28 @@
+import threading
+import time
+
+from src.executor import PolicyExecutor
+
+def test_thread_backend_runs_fan_out_in_parallel():
+    """선행 작업 완료로 한꺼번에 ready가 된 후속 작업은 빈 worker 모두에서 실행"""
+    threads = set()
+    lock = threading.Lock()
+
+    def root():
+        time.sleep(0.2)  # 후속 작업이 모두 제출된 뒤 완료되도록 (완료 시점의 drain loop 경로)
+
+    def leaf():
+        with lock:
+            threads.add(threading.get_ident())
+        time.sleep(0.3)
+
+    with PolicyExecutor("FCFS", max_workers=8) as executor:
+        parent = executor.submit_task(root)
+        leaves = [executor.submit_task(leaf, dependencies=[parent]) for _ in range(8)]
+        started = time.perf_counter()
+        for future in leaves:
+            future.result(timeout=10)
+        elapsed = time.perf_counter() - started
+
+    assert len(threads) == 8
+    assert elapsed < 8 * 0.3 / 2
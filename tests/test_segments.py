@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from src.process import generate_processes
+from src.schedulers.channels import ChannelModel
+from src.schedulers.history import ChunkedFileHistorySink
+from src.schedulers.registry import create_scheduler
+from src.visualizer.segments import Segments
+
+@pytest.mark.parametrize("name", ["FCFS", "RR", "MLQ"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 65536])
+def test_chunked_sink_matches_in_memory_history(tmp_path, name, chunk_size):
+    """chunk 단위 병합 결과가 in-memory 실행 기록의 병합 결과와 같음 (chunk 경계에 걸친 구간 포함)"""
+    processes = generate_processes(40, 5, seed=3)
+    scheduler = create_scheduler(name, True)
+    scheduler.set_channels(ChannelModel(latency=2, bandwidth=0.5, capacity=1))
+    scheduler.schedule(processes)
+    expected = Segments.from_history(scheduler.execution_history)
+
+    scheduler.set_history_sink(ChunkedFileHistorySink(str(tmp_path), chunk_size=chunk_size))
+    scheduler.schedule(processes)
+    actual = Segments.from_history(scheduler.execution_history)
+    scheduler.execution_history.close()
+
+    np.testing.assert_array_equal(actual.process_ids, expected.process_ids)
+    np.testing.assert_array_equal(actual.start_times, expected.start_times)
+    np.testing.assert_array_equal(actual.end_times, expected.end_times)
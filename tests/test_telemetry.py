@@ -0,0 +1,45 @@
+import pytest
+
+from src.process import QueueLevel, generate_processes
+from src.schedulers.admission import AdmissionControl
+from src.schedulers.channels import ChannelModel
+from src.schedulers.registry import create_scheduler
+from src.schedulers.telemetry import Telemetry
+
+class _ScanningTelemetry(Telemetry):
+    """증분 집계 결과를 tick마다 ready queue 전체 scan 결과와 비교"""
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.samples = 0
+
+    def sample_queue(self, time):
+        scheduler = self.scheduler
+        queue = scheduler.ready_queue
+        for level in QueueLevel:
+            assert self._counts[f"ready_{level.value}"] == sum(1 for p in queue if p.queue_level == level)
+        assert self._total == len(queue)
+        if not scheduler.use_ipc:
+            blocked = 0
+        elif scheduler.channels is not None:
+            blocked = sum(1 for p in queue if not scheduler.channels.ready(p))
+        else:
+            blocked = sum(1 for p in queue if not p.can_execute(scheduler.completed_processes))
+        assert len(self._missing) == blocked
+        self.samples += 1
+        super().sample_queue(time)
+
+@pytest.mark.parametrize("name", ["FCFS", "RR", "MLQ", "CFS"])
+@pytest.mark.parametrize("use_ipc", [False, True])
+@pytest.mark.parametrize("setup", ["plain", "admission", "channels"])
+def test_incremental_counts_match_queue_scan(name, use_ipc, setup):
+    for seed in range(5):
+        scheduler = create_scheduler(name, use_ipc)
+        if setup == "admission":
+            scheduler.set_admission(AdmissionControl(capacity=5, policy="drop_oldest"))
+        elif setup == "channels":
+            scheduler.set_channels(ChannelModel(latency=2, bandwidth=0.5, capacity=1))
+        telemetry = _ScanningTelemetry(scheduler)
+        scheduler.set_telemetry(telemetry)
+        scheduler.schedule(generate_processes(30, 5, seed=seed))
+        assert telemetry.samples > 0